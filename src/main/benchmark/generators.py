@@ -0,0 +1,145 @@
+"""
+Seeded generators of synthetic graphs used by the benchmarks. Each generator returns the number of vertices and a list
+of (u, v) edges whose vertices are the integers from 0 to n - 1, so the same graph can be loaded into any backend.
+"""
+
+import random
+
+from src.main.graph import graph_adjl
+
+
+def erdos_renyi(n, m, seed=0):
+    """
+    Generates a random graph in the G(n, m) model of Erdős and Rényi: m distinct edges chosen uniformly among all the
+    pairs of distinct vertices.
+
+    :param n: The number of vertices.
+    :param m: The number of edges, at most n * (n - 1) / 2.
+    :param seed: The seed of the random number generator.
+    :return: A tuple (n, edges).
+    """
+
+    rnd = random.Random(seed)
+    edges = set()
+
+    while len(edges) < m:
+        u, v = rnd.randrange(n), rnd.randrange(n)
+        if u != v:
+            edges.add((min(u, v), max(u, v)))
+
+    return n, sorted(edges)
+
+
+def barabasi_albert(n, k, seed=0):
+    """
+    Generates a scale-free graph with the preferential attachment model of Barabási and Albert: each new vertex is
+    linked to k existing vertices chosen with probability proportional to their degrees.
+
+    :param n: The number of vertices, greater than k.
+    :param k: The number of edges of each new vertex.
+    :param seed: The seed of the random number generator.
+    :return: A tuple (n, edges).
+    """
+
+    rnd = random.Random(seed)
+    edges = list()
+    # Each vertex appears in this list once for each edge incident to it.
+    ends = list(range(k))
+
+    for v in range(k, n):
+        targets = set()
+        while len(targets) < k:
+            targets.add(rnd.choice(ends))
+        for u in targets:
+            edges.append((u, v))
+            ends.extend((u, v))
+
+    return n, edges
+
+
+def grid(rows, cols):
+    """
+    Generates a grid graph, each vertex linked to the ones above, below and beside it.
+
+    :param rows: The number of rows.
+    :param cols: The number of columns.
+    :return: A tuple (n, edges).
+    """
+
+    edges = list()
+
+    for r in range(rows):
+        for c in range(cols):
+            v = r * cols + c
+            if c + 1 < cols:
+                edges.append((v, v + 1))
+            if r + 1 < rows:
+                edges.append((v, v + cols))
+
+    return rows * cols, edges
+
+
+def path(n):
+    """
+    Generates a path graph, the vertex i linked to the vertex i + 1.
+
+    :param n: The number of vertices.
+    :return: A tuple (n, edges).
+    """
+
+    return n, [(v, v + 1) for v in range(n - 1)]
+
+
+def by_edges(kind, m, seed=0):
+    """
+    Generates a graph of the given kind with about m edges.
+
+    :param kind: 'erdos_renyi' (average degree 10), 'barabasi_albert' (3 edges per vertex), 'grid' or 'path'.
+    :param m: The approximate number of edges.
+    :param seed: The seed of the random number generator.
+    :return: A tuple (n, edges).
+    """
+
+    if kind == 'erdos_renyi':
+        return erdos_renyi(max(11, m // 5), m, seed)
+    if kind == 'barabasi_albert':
+        return barabasi_albert(max(4, m // 3 + 3), 3, seed)
+    if kind == 'grid':
+        side = max(2, int((m / 2) ** 0.5))
+        return grid(side, side)
+    if kind == 'path':
+        return path(m + 1)
+    raise Exception('Unknown kind of graph: {}'.format(kind))
+
+
+def to_adjacency_list(n, edges, is_directed=False):
+    """
+    Loads the edges into an adjacency list Graph.
+
+    :return: A graph_adjl.Graph.
+    """
+
+    graph = graph_adjl.Graph(is_directed=is_directed)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from(edges)
+
+    return graph
+
+
+def to_adjacency_matrix(n, edges, is_directed=False):
+    """
+    Loads the edges into an adjacency matrix Graph. Requires NumPy.
+
+    :return: A graph_adjm.Graph.
+    """
+
+    from src.main.graph import graph_adjm
+
+    graph = graph_adjm.Graph(is_directed=is_directed, capacity=n)
+
+    for v in range(n):
+        graph.add_vertex(v)
+    for u, v in edges:
+        graph.add_edge(u, v)
+
+    return graph
@@ -0,0 +1,72 @@
+"""
+Measures how fast edges can be loaded into the adjacency list Graph, comparing one add_edge call per edge against the
+bulk add_edges_from loader.
+
+Usage: python -m src.main.benchmark.load [number of edges] [number of vertices]
+"""
+
+import random
+import sys
+import time
+
+from src.main.graph.graph_adjl import Graph
+
+
+def random_edges(n_edges, n_vertices, seed=0):
+    """
+    Generates random weighted edges.
+
+    :param n_edges: The number of edges.
+    :param n_vertices: The number of vertices the edges connect.
+    :param seed: The seed of the random number generator.
+    :return: A list of (u, v, weight) tuples whose vertices are the integers from 0 to n_vertices - 1.
+    """
+
+    rnd = random.Random(seed)
+
+    return [(rnd.randrange(n_vertices), rnd.randrange(n_vertices), rnd.randint(1, 100))
+            for _ in range(n_edges)]
+
+
+def load_one_by_one(edges, n_vertices):
+    graph = Graph()
+
+    for i in range(n_vertices):
+        graph.add_vertex(i)
+    for u, v, weight in edges:
+        graph.add_edge(u, v, weight)
+
+    return graph
+
+
+def load_bulk(edges, n_vertices):
+    graph = Graph()
+
+    graph.add_vertices_from(range(n_vertices))
+    graph.add_edges_from(edges)
+
+    return graph
+
+
+def run(n_edges=1000000, n_vertices=None):
+    """
+    Loads the same random edges with each method and prints the throughput.
+
+    :param n_edges: The number of edges.
+    :param n_vertices: The number of vertices, by default a tenth of the number of edges.
+    """
+
+    n_vertices = n_vertices or max(1, n_edges // 10)
+    edges = random_edges(n_edges, n_vertices)
+
+    print('Loading {} edges over {} vertices'.format(n_edges, n_vertices))
+
+    for name, loader in (('add_edge', load_one_by_one), ('add_edges_from', load_bulk)):
+        start = time.perf_counter()
+        loader(edges, n_vertices)
+        elapsed = time.perf_counter() - start
+        print('{:<16}{:>10.3f} s{:>14,.0f} edges/s'.format(name, elapsed, n_edges / elapsed))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,102 @@
+"""
+Memory benchmark of the adjacency list Graph.
+
+Each synthetic graph is built under tracemalloc in two steps: first with its vertices only, which gives the bytes per
+vertex, and then with its edges, whose extra memory gives the bytes per edge. The results are shown next to the ones
+stored in memory_baseline.json, measured with the previous representation of the vertices.
+
+Usage: python -m src.main.benchmark.memory [--edges N] [--save-baseline]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+from src.main.benchmark import generators
+from src.main.graph import graph_adjl
+
+
+KINDS = ('erdos_renyi', 'barabasi_albert', 'grid', 'path')
+BASELINE = os.path.join(os.path.dirname(__file__), 'memory_baseline.json')
+
+
+def measure(n, edges, is_directed=False):
+    """
+    Measures the memory a graph takes.
+
+    :return: A tuple (bytes per vertex, bytes per edge).
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        graph = graph_adjl.Graph(is_directed=is_directed)
+        graph.add_vertices_from(range(n))
+        vertices = tracemalloc.get_traced_memory()[0] - start
+        graph.add_edges_from(edges)
+        total = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    return vertices / max(1, n), (total - vertices) / max(1, len(edges))
+
+
+def run(size=100000, kinds=KINDS, seed=0):
+    """
+    Measures every kind of graph, undirected and directed, with about size edges.
+
+    :return: A dict mapping 'kind.undirected' or 'kind.directed' to {'vertex_bytes': ..., 'edge_bytes': ...}.
+    """
+
+    results = dict()
+
+    for kind in kinds:
+        n, edges = generators.by_edges(kind, size, seed)
+        for is_directed in (False, True):
+            key = '{}.{}'.format(kind, 'directed' if is_directed else 'undirected')
+            vertex_bytes, edge_bytes = measure(n, edges, is_directed)
+            results[key] = {'vertex_bytes': round(vertex_bytes, 1), 'edge_bytes': round(edge_bytes, 1)}
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measures the memory of the adjacency list graph.')
+    parser.add_argument('--edges', type=int, default=100000, help='the approximate number of edges of each graph')
+    parser.add_argument('--baseline', default=BASELINE, help='the baseline JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='stores the results as the new baseline')
+    parser.add_argument('--seed', type=int, default=0, help='the seed of the graph generators')
+    args = parser.parse_args(argv)
+
+    results = run(args.edges, seed=args.seed)
+
+    baseline = dict()
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print('{:<30}{:>18}{:>18}'.format('graph', 'bytes per vertex', 'bytes per edge'))
+    for key, result in sorted(results.items()):
+        columns = list()
+        for field in ('vertex_bytes', 'edge_bytes'):
+            if key in baseline:
+                columns.append('{:.0f} -> {:.0f}'.format(baseline[key][field], result[field]))
+            else:
+                columns.append('{:.0f}'.format(result[field]))
+        print('{:<30}{:>18}{:>18}'.format(key, *columns))
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print('Baseline saved to', args.baseline)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Benchmark suite of the Graph operations over synthetic graphs of growing sizes.
+
+Every operation runs a few times on each generated graph, keeping the best time, and once more under tracemalloc to
+measure its peak memory. The results are compared with the ones stored in baseline.json, and the operations that got
+slower than the tolerance allows are reported as regressions. Graphs with up to 1M edges are generated, but the default
+run stops at 10k edges, the size the stored baseline was measured with.
+
+Usage: python -m src.main.benchmark.suite [--max-edges N] [--repeat R] [--tolerance T] [--save-baseline]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from src.main.benchmark import generators
+
+
+KINDS = ('erdos_renyi', 'barabasi_albert', 'grid', 'path')
+SIZES = (1000, 10000, 100000, 1000000)
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+# Differences smaller than this are timer noise, and are never reported as regressions.
+MIN_SECONDS = 0.005
+
+
+def _middle(graph):
+    vertices = list(graph.vertices)
+    return vertices[0], vertices[len(vertices) // 2]
+
+
+# Each operation is (name, backend, maximum number of vertices, setup, function). setup receives the number of vertices
+# and the edges and returns the argument of function, and only function is measured.
+OPERATIONS = (
+    ('add_edge', 'adjl', None,
+     lambda n, edges: (n, edges),
+     lambda args: generators.to_adjacency_list(*args)),
+    ('degree_sequence', 'adjl', None,
+     generators.to_adjacency_list,
+     lambda graph: graph.degree_sequence),
+    ('is_connected', 'adjl', None,
+     generators.to_adjacency_list,
+     lambda graph: graph.is_connected()),
+    ('i_bfs', 'adjl', None,
+     generators.to_adjacency_list,
+     lambda graph: graph.i_bfs(_middle(graph)[0], None)),
+    ('dijkstra', 'adjl', None,
+     generators.to_adjacency_list,
+     lambda graph: graph.dijkstra(*_middle(graph))),
+    ('bfs_paths', 'adjl', None,
+     generators.to_adjacency_list,
+     lambda graph: list(graph.bfs_paths(*_middle(graph), max_depth=6, max_paths=100))),
+    ('diameter', 'adjl', 2000,
+     generators.to_adjacency_list,
+     lambda graph: graph.diameter),
+    ('add_edge', 'adjm', 2000,
+     lambda n, edges: (n, edges),
+     lambda args: generators.to_adjacency_matrix(*args)),
+    ('degree_sequence', 'adjm', 2000,
+     generators.to_adjacency_matrix,
+     lambda graph: graph.degree_sequence),
+    ('floyd_warshall', 'adjm', 500,
+     generators.to_adjacency_matrix,
+     lambda graph: graph.floyd_warshall()),
+)
+
+
+def measure(setup, function, n, edges, repeat=3):
+    """
+    Measures the time and the peak memory of an operation.
+
+    :return: A tuple (seconds, bytes), the time being the best of repeat runs.
+    """
+
+    elapsed = float('inf')
+
+    for _ in range(repeat):
+        argument = setup(n, edges)
+        start = time.perf_counter()
+        function(argument)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    argument = setup(n, edges)
+    tracemalloc.start()
+    function(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def run(max_edges=10000, kinds=KINDS, seed=0, repeat=3):
+    """
+    Runs every operation on every kind of graph, with sizes up to max_edges edges.
+
+    :return: A dict mapping 'backend.operation.kind.size' to {'seconds': ..., 'peak_bytes': ...}.
+    """
+
+    results = dict()
+
+    for kind in kinds:
+        for size in SIZES:
+            if size > max_edges:
+                continue
+            n, edges = generators.by_edges(kind, size, seed)
+            for name, backend, limit, setup, function in OPERATIONS:
+                if limit is not None and n > limit:
+                    continue
+                key = '{}.{}.{}.{}'.format(backend, name, kind, size)
+                seconds, peak = measure(setup, function, n, edges, repeat)
+                results[key] = {'seconds': seconds, 'peak_bytes': peak}
+                print('{:<48}{:>12.4f} s{:>14,} B'.format(key, seconds, peak), flush=True)
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compares the results with the baseline.
+
+    :param tolerance: How much slower than the baseline an operation can be, 0.25 meaning 25%.
+    :return: The list of (key, baseline seconds, seconds) of the regressions.
+    """
+
+    regressions = list()
+
+    for key, result in sorted(results.items()):
+        if key not in baseline:
+            continue
+        before, after = baseline[key]['seconds'], result['seconds']
+        if after > before * (1 + tolerance) and after - before > MIN_SECONDS:
+            regressions.append((key, baseline[key]['seconds'], result['seconds']))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks the graph operations on synthetic graphs.')
+    parser.add_argument('--max-edges', type=int, default=10000, help='the size of the largest graph')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown, 0.25 meaning 25%%')
+    parser.add_argument('--baseline', default=BASELINE, help='the baseline JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='stores the results as the new baseline')
+    parser.add_argument('--repeat', type=int, default=3, help='how many times each operation is timed')
+    parser.add_argument('--seed', type=int, default=0, help='the seed of the graph generators')
+    args = parser.parse_args(argv)
+
+    results = run(args.max_edges, seed=args.seed, repeat=args.repeat)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print('Baseline saved to', args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('No baseline found at', args.baseline)
+        return 0
+
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+
+    for key, before, after in regressions:
+        print('REGRESSION {}: {:.4f} s -> {:.4f} s ({:+.0%})'.format(key, before, after, after / before - 1))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+This module implements the adjacency maps of the vertices of an adjacency list Graph.
+
+An adjacency map takes the id of each neighbor to the weight of the edge between them, or to the list of the weights
+when there are parallel edges. As most pairs of vertices have a single edge, a number takes the place of a one-element
+list, which is several times larger. An undirected loop is stored twice, so it always takes a list.
+
+The maps a vertex doesn't use are the shared read-only EMPTY map, and a real map is created when the first edge is
+added to it: an undirected graph only uses the neighbors map, a directed one the in and out maps, and an isolated
+vertex none of them.
+"""
+
+import math
+
+from types import MappingProxyType
+
+
+EMPTY = MappingProxyType(dict())
+
+
+def add(adjacency, vertex, weight):
+    """
+    Adds an edge to an adjacency map.
+
+    :param adjacency: The map, not EMPTY.
+    :param vertex: The neighbor id.
+    :param weight: The weight of the edge.
+    """
+
+    entry = adjacency.get(vertex)
+
+    if entry is None:
+        adjacency[vertex] = weight
+    elif type(entry) is list:
+        entry.append(weight)
+    else:
+        adjacency[vertex] = [entry, weight]
+
+
+def count(entry):
+    """
+    The number of edges of an entry of an adjacency map.
+
+    :param entry: A weight or a list of weights.
+    :return: The number of weights.
+    """
+
+    return len(entry) if type(entry) is list else 1
+
+
+def weights(entry):
+    """
+    The weights of an entry of an adjacency map.
+
+    :param entry: A weight or a list of weights.
+    :return: The list of weights.
+    """
+
+    return list(entry) if type(entry) is list else [entry]
+
+
+def cost(weight):
+    """
+    The cost of moving along an edge. Edges added without a weight have the infinite value, and cost 1.
+
+    :param weight: The weight of the edge.
+    :return: The cost as a float.
+    """
+
+    return 1.0 if weight == math.inf else float(weight)
+
+
+def cheapest(entry):
+    """
+    The weight of the cheapest edge of an entry of an adjacency map, an edge without weight (infinite) costing 1.
+
+    :param entry: A weight or a list of weights.
+    :return: The weight of the cheapest edge.
+    """
+
+    return min(entry, key=cost) if type(entry) is list else entry
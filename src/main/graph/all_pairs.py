@@ -0,0 +1,198 @@
+"""
+This module computes the shortest paths between all the pairs of vertices of a graph.
+
+Two algorithms are available: Floyd-Warshall, vectorised over an adjacency matrix, which is the fastest option for
+small or dense graphs, and Dijkstra's algorithm with a binary heap run once from every vertex of the frozen CSR graph,
+which does much less work on large sparse graphs. Both produce a distance matrix and a predecessor matrix, that can be
+saved as .npy files and memory-mapped later, so other processes can answer distance queries without recomputing them.
+The vertex names are saved as JSON, encoded as in the binary graph files, so tuples and frozensets are loaded back.
+"""
+
+import json
+import math
+
+import numpy as np
+
+from src.main.graph import graph_adjm
+from src.main.graph import serialization
+from src.main.graph import shortest_path
+from src.main.graph.graph_csr import CSRGraph
+
+
+class ShortestPathTable:
+    """
+    This class holds the shortest paths between all the pairs of vertices of a graph.
+    """
+
+    def __init__(self, distances, previous, labels):
+        """
+        Receives the result matrices.
+
+        :param distances: A n x n array, distances[i][j] is the length of the shortest path from the i-th to the j-th
+                          vertex, or infinity if there isn't one.
+        :param previous: A n x n array, previous[i][j] is the index of the vertex preceding the j-th vertex in the
+                         shortest path from the i-th vertex, or -1.
+        :param labels: The vertex names, labels[i] being the name of the i-th vertex.
+        """
+
+        self.distances = distances
+        self.previous = previous
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+
+    def distance(self, u, v):
+        """
+        Returns the length of the shortest path between two vertices.
+
+        :param u: The initial vertex.
+        :param v: The final vertex.
+        :return: The distance, or infinity if v can't be reached from u.
+        """
+
+        return float(self.distances[self.index[u], self.index[v]])
+
+    def path(self, u, v):
+        """
+        Rebuilds the shortest path between two vertices.
+
+        :param u: The initial vertex.
+        :param v: The final vertex.
+        :return: A ShortestPath tuple with the list of vertices and the total weight.
+        """
+
+        i, j = self.index[u], self.index[v]
+
+        if self.distances[i, j] == math.inf:
+            raise Exception('The target vertex is unreachable')
+
+        path = [j]
+        while path[-1] != i:
+            path.append(int(self.previous[i, path[-1]]))
+        path.reverse()
+
+        return shortest_path.ShortestPath([self.labels[k] for k in path], float(self.distances[i, j]))
+
+    def save(self, prefix):
+        """
+        Saves the table in the files <prefix>.dist.npy, <prefix>.prev.npy and <prefix>.labels.json.
+
+        :param prefix: The path of the files without the extensions.
+        """
+
+        labels = serialization.encode_labels(self.labels)
+
+        np.save(prefix + '.dist.npy', self.distances)
+        np.save(prefix + '.prev.npy', self.previous)
+        _write_labels(prefix, labels)
+
+    @classmethod
+    def load(cls, prefix, mmap=True):
+        """
+        Loads a table saved with save.
+
+        :param prefix: The path of the files without the extensions.
+        :param mmap: If True the matrices are memory-mapped read-only instead of read into memory, so they are shared
+                     between the processes that load them.
+        :return: A ShortestPathTable.
+        """
+
+        mode = 'r' if mmap else None
+
+        with open(prefix + '.labels.json') as f:
+            labels = serialization.decode_labels(json.load(f))
+
+        return cls(np.load(prefix + '.dist.npy', mmap_mode=mode), np.load(prefix + '.prev.npy', mmap_mode=mode), labels)
+
+
+def _write_labels(prefix, labels):
+    # Writes the encoded vertex names.
+    with open(prefix + '.labels.json', 'w') as f:
+        json.dump(labels, f)
+
+
+def dense_matrix(graph):
+    """
+    Builds the adjacency matrix of a graph, with the cost of each edge or infinity where there isn't an edge.
+
+    :param graph: A frozen CSRGraph.
+    :return: A n x n array.
+    """
+
+    n = len(graph)
+    matrix = np.full((n, n), math.inf)
+    rows = np.repeat(np.arange(n), graph.out_degrees)
+    matrix[rows, graph.indices] = graph.costs
+
+    return matrix
+
+
+def repeated_dijkstra(graph, distances, previous):
+    """
+    Fills the result matrices running Dijkstra's algorithm from every vertex.
+
+    :param graph: A frozen CSRGraph.
+    :param distances: A n x n array filled with infinity.
+    :param previous: A n x n array filled with -1.
+    """
+
+    for source in range(len(graph)):
+        dist, prev = shortest_path.dijkstra(graph, source)
+        distances[source, list(dist)] = list(dist.values())
+        previous[source, list(prev)] = list(prev.values())
+
+
+def all_pairs_shortest_paths(graph, method='auto', path=None):
+    """
+    Computes the shortest paths between all the pairs of vertices.
+
+    :param graph: An adjacency list Graph, a frozen CSRGraph or an adjacency matrix Graph.
+    :param method: 'floyd_warshall', 'dijkstra' or 'auto', that uses Floyd-Warshall for graphs up to 1000 vertices or
+                   with at least a tenth of all the possible edges, and Dijkstra otherwise.
+    :param path: If informed, the result is written to files with this prefix, as ShortestPathTable.save does, and the
+                 returned table is memory-mapped from them.
+    :return: A ShortestPathTable.
+    """
+
+    if isinstance(graph, graph_adjm.Graph):
+        labels = list(graph)
+        distances, previous = graph.floyd_warshall()
+    else:
+        if not isinstance(graph, CSRGraph):
+            graph = graph.freeze()
+
+        labels = graph.labels
+        n = len(graph)
+
+        if method == 'auto':
+            method = 'floyd_warshall' if n <= 1000 or len(graph.indices) * 10 >= n * n else 'dijkstra'
+
+        if method == 'floyd_warshall':
+            distances, previous = graph_adjm.floyd_warshall(dense_matrix(graph))
+        elif method == 'dijkstra':
+            id_type = np.int32 if n < 2 ** 31 else np.int64
+            if path:
+                # Checks the names before any file is written.
+                encoded = serialization.encode_labels(labels)
+                # Writes straight to the files, so the matrices don't need to fit in memory.
+                distances = np.lib.format.open_memmap(path + '.dist.npy', 'w+', np.float64, (n, n))
+                previous = np.lib.format.open_memmap(path + '.prev.npy', 'w+', id_type, (n, n))
+                distances.fill(math.inf)
+                previous.fill(-1)
+            else:
+                distances, previous = np.full((n, n), math.inf), np.full((n, n), -1, dtype=id_type)
+            repeated_dijkstra(graph, distances, previous)
+            if path:
+                distances.flush()
+                previous.flush()
+                _write_labels(path, encoded)
+                return ShortestPathTable.load(path)
+        else:
+            raise Exception('Unknown method: {}'.format(method))
+
+    table = ShortestPathTable(distances, previous, labels)
+
+    if path:
+        table.save(path)
+        return ShortestPathTable.load(path)
+
+    return table
@@ -0,0 +1,119 @@
+"""
+This module caches the results of graph queries.
+
+Every change to a graph increases its version, a mutation counter, and a cache holds only the results computed for the
+current version: when the graph changes, the next query finds the cache out of date and empties it. The properties of
+the graph (without parameters) are kept until the next change, and the queries with parameters, which can have any
+number of distinct arguments, are kept in a LRU (least recently used) cache with a bounded size.
+"""
+
+import functools
+import inspect
+
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'size', 'maxsize'])
+
+
+class QueryCache:
+    """
+    This class keeps the results of the queries made on a graph while its version doesn't change.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Creates an empty cache.
+
+        :param maxsize: The greatest number of results of queries with parameters kept at once.
+        """
+
+        self.maxsize = maxsize
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self._properties = dict()
+        self._queries = OrderedDict()
+
+    def __len__(self):
+        return len(self._properties) + len(self._queries)
+
+    def clear(self):
+        """
+        Removes every result, keeping the statistics.
+        """
+
+        self._properties.clear()
+        self._queries.clear()
+
+    def info(self):
+        """
+        The statistics of the cache.
+
+        :return: A CacheInfo tuple with the number of hits, misses, results kept and the LRU size.
+        """
+
+        return CacheInfo(self.hits, self.misses, len(self), self.maxsize)
+
+    def get(self, version, key, compute, bounded=False):
+        """
+        Returns the result of a query, computing it if it isn't in the cache.
+
+        :param version: The current version of the graph.
+        :param key: The key of the query, the name of the query and its arguments.
+        :param compute: A function without arguments that computes the result.
+        :param bounded: True if the result must be kept in the LRU cache.
+        :return: The result.
+        """
+
+        if version != self.version:
+            self.clear()
+            self.version = version
+
+        results = self._queries if bounded else self._properties
+
+        if key in results:
+            self.hits += 1
+            if bounded:
+                results.move_to_end(key)
+            return results[key]
+
+        self.misses += 1
+        result = compute()
+        results[key] = result
+
+        if bounded and len(results) > self.maxsize:
+            results.popitem(last=False)
+
+        return result
+
+
+def memoize(copy=None):
+    """
+    Decorates a Graph method so its results are kept in the graph's cache until the graph changes. Methods with
+    parameters are kept in the LRU cache, so their arguments must be hashable.
+
+    :param copy: A function applied to the cached result before returning it, so callers can change the returned
+                 object without changing the cache. Not needed for immutable results.
+    :return: The decorator.
+    """
+
+    def decorator(method):
+        name = method.__name__
+        signature = inspect.signature(method)
+        # The number of parameters after the graph, so a call with all of them by position needs no binding.
+        positional = len(signature.parameters) - 1
+
+        @functools.wraps(method)
+        def wrapper(graph, *args, **kwargs):
+            if kwargs or len(args) != positional:
+                # Keyword calls and calls that rely on defaults share the key of the same call made by position.
+                bound = signature.bind(graph, *args, **kwargs)
+                bound.apply_defaults()
+                args = tuple(bound.arguments.values())[1:]
+            result = graph.cache.get(graph.version, (name,) + args, lambda: method(graph, *args), bool(args))
+            return result if copy is None else copy(result)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,178 @@
+"""
+This module classifies the structure of an adjacency list Graph: whether it's simple, a multigraph or a pseudograph,
+bipartite, acyclic, a tree or a forest, regular, complete, a cycle, a wheel or a star.
+
+Every predicate comes from the same O(V + E) work: the degree index the graph keeps, a single pass over the adjacency
+maps that counts the loops, the parallel edges and the neighbors of each vertex, and a single Breadth-First Search that
+finds the components and 2-colours the vertices. Directed graphs take one more pass, Kahn's algorithm, to tell if they
+have a directed cycle, and a possible wheel one more search, to check that its rim is a single cycle.
+
+The predicates follow the usual definitions for undirected graphs. In a directed graph acyclic means without directed
+cycles, complete means an edge in each direction between every two vertices, and regular means that every in-degree
+and out-degree are the same. The other shapes describe the underlying undirected graph, where the direction is ignored
+and two opposite edges between the same vertices are parallel edges.
+"""
+
+from collections import deque
+from collections import namedtuple
+
+from src.main.graph import adjacency
+
+
+Classification = namedtuple('Classification', [
+    'vertices',             # number of vertices
+    'edges',                # number of edges, counting the parallel ones
+    'loops',                # number of loops
+    'parallel_edges',       # number of edges that repeat an edge between the same vertices, in the same direction
+    'components',           # number of (weakly) connected components
+    'simple',               # without loops and parallel edges
+    'multigraph',           # with parallel edges but without loops
+    'pseudograph',          # with loops
+    'connected',
+    'bipartite',            # the vertices split in two sets, every edge between them
+    'complete_bipartite',   # bipartite, with an edge between every vertex of a set and every vertex of the other
+    'acyclic',
+    'forest',               # without cycles in the underlying graph
+    'tree',                 # a connected forest
+    'regular',
+    'degree',               # the degree of every vertex if the graph is regular, otherwise None
+    'complete',             # simple, with an edge between every two vertices
+    'cycle',                # a single cycle through every vertex
+    'wheel',                # a cycle plus a hub linked to every vertex of the cycle
+    'star',                 # a tree with a center linked to every other vertex
+])
+
+
+def _underlying(vertex, directed):
+    # The neighbors of a vertex in the underlying undirected graph, mapped to the number of edges between them.
+    if not directed:
+        return {j: adjacency.count(w) for j, w in vertex.neighbors.items()}
+
+    neighbors = {j: adjacency.count(w) for j, w in vertex.out_neighbors.items()}
+    for j, w in vertex.in_neighbors.items():
+        neighbors[j] = neighbors.get(j, 0) + adjacency.count(w)
+
+    return neighbors
+
+
+def _acyclic(graph):
+    # Kahn's algorithm: the graph has no directed cycle if removing the vertices without incoming edges, one at a time,
+    # removes every vertex.
+    in_degrees = dict(graph._in_degrees)
+    vertices = graph._vertices
+    queue = deque(v for v, degree in in_degrees.items() if degree == 0)
+    removed = 0
+
+    while queue:
+        v = queue.popleft()
+        removed += 1
+        for j, w in vertices[v].out_neighbors.items():
+            in_degrees[j] -= adjacency.count(w)
+            if in_degrees[j] == 0:
+                queue.append(j)
+
+    return removed == len(graph)
+
+
+def _rim_connected(underlying, hub, n):
+    # Tells if the vertices other than the hub are connected without going through it.
+    start = next(v for v in underlying if v != hub)
+    visited = {hub, start}
+    stack = [start]
+
+    while stack:
+        for j in underlying[stack.pop()]:
+            if j not in visited:
+                visited.add(j)
+                stack.append(j)
+
+    return len(visited) == n
+
+
+def classify(graph):
+    """
+    Classifies the structure of a graph in O(V + E).
+
+    :param graph: The adjacency list Graph.
+    :return: A Classification tuple.
+    """
+
+    directed = graph.is_directed
+    n = len(graph)
+    edges = sum(graph._degrees.values()) // 2
+    loops = parallel = 0
+    # Whether the underlying undirected graph has loops or parallel edges.
+    underlying_multiple = False
+    underlying = dict()
+
+    for vertex in graph.values():
+        i = vertex.id
+        for j, w in (vertex.out_neighbors if directed else vertex.neighbors).items():
+            k = adjacency.count(w)
+            if j == i:
+                loops += k if directed else k // 2
+                parallel += k - 1 if directed else k // 2 - 1
+            elif directed or i < j:
+                parallel += k - 1
+        neighbors = _underlying(vertex, directed)
+        if not underlying_multiple and any(count > 1 or j == i for j, count in neighbors.items()):
+            underlying_multiple = True
+        underlying[i] = neighbors
+
+    # The Breadth-First Search, colouring each vertex with the opposite colour of the vertex it was reached from.
+    colours = dict()
+    components = 0
+    bipartite = True
+
+    for root in underlying:
+        if root in colours:
+            continue
+        components += 1
+        colours[root] = 0
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            for j in underlying[v]:
+                if j not in colours:
+                    colours[j] = 1 - colours[v]
+                    queue.append(j)
+                elif colours[j] == colours[v]:
+                    bipartite = False
+
+    underlying_degrees = [len(neighbors) for neighbors in underlying.values()]
+    underlying_edges = sum(underlying_degrees) // 2
+    connected = components == 1
+    simple = not loops and not parallel
+    underlying_simple = not underlying_multiple
+
+    forest = underlying_simple and underlying_edges == n - components
+    tree = forest and connected
+
+    if directed:
+        in_degrees, out_degrees = set(graph._in_degrees.values()), set(graph._out_degrees.values())
+        regular = len(in_degrees) <= 1 and in_degrees == out_degrees
+        complete = simple and edges == n * (n - 1)
+        acyclic = _acyclic(graph)
+    else:
+        degrees = set(graph._degrees.values())
+        regular = len(degrees) <= 1
+        complete = simple and 2 * edges == n * (n - 1)
+        acyclic = forest
+
+    degree = next(iter(graph._in_degrees.values() if directed else graph._degrees.values()), 0) if regular else None
+
+    side = sum(colours.values())
+    complete_bipartite = (bipartite and underlying_simple and connected and n >= 2 and
+                          underlying_edges == side * (n - side))
+
+    cycle = underlying_simple and connected and n >= 3 and all(d == 2 for d in underlying_degrees)
+
+    hub = max(underlying, key=lambda v: len(underlying[v]), default=None)
+    wheel = (underlying_simple and n >= 4 and underlying_edges == 2 * (n - 1) and len(underlying[hub]) == n - 1 and
+             sum(1 for d in underlying_degrees if d == 3) >= n - 1 and _rim_connected(underlying, hub, n))
+
+    star = tree and n >= 2 and len(underlying[hub]) == n - 1
+
+    return Classification(n, edges, loops, parallel, components, simple, bool(parallel) and not loops, bool(loops),
+                          connected, bipartite, complete_bipartite, acyclic, forest, tree, regular, degree, complete,
+                          cycle, wheel, star)
@@ -0,0 +1,296 @@
+"""
+This module implements the connectivity of graphs: connected components, weakly and strongly connected components of
+directed graphs, and a union-find index that answers connectivity queries while edges are being added.
+
+A connected component is a maximal set of vertices where there is a path between any two of them. In a directed graph
+the components are weakly connected when the direction of the edges is ignored, and strongly connected when there is a
+directed path from any vertex to any other. Every function runs in O(V + E) without recursion.
+"""
+
+import itertools
+
+from src.main.graph import traversal
+
+
+class Undirected:
+    """
+    A view of a graph that ignores the direction of its edges, so the neighbors of a vertex are both its successors and
+    its predecessors.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __contains__(self, vertex):
+        return vertex in self.graph
+
+    def __iter__(self):
+        return iter(self.graph)
+
+    def __len__(self):
+        return len(self.graph)
+
+    def neighbors(self, vertex):
+        if not self.graph.is_directed:
+            return self.graph.neighbors(vertex)
+        return itertools.chain(self.graph.neighbors(vertex), self.graph.predecessors(vertex))
+
+
+def connected_components(graph):
+    """
+    Finds the connected components of the graph, the weakly connected ones if the graph is directed.
+
+    :param graph: The graph.
+    :return: A generator of sets of vertices, one for each component.
+    """
+
+    view, visited = Undirected(graph), set()
+
+    for vertex in graph:
+        if vertex not in visited:
+            yield set(traversal.bfs_order(view, vertex, visited))
+
+
+def weakly_connected_components(graph):
+    """
+    Finds the weakly connected components of a directed graph, the ones found when the edges' direction is ignored.
+
+    :param graph: The graph.
+    :return: A generator of sets of vertices, one for each component.
+    """
+
+    return connected_components(graph)
+
+
+def component_of(graph, vertex):
+    """
+    Finds the connected component that contains a vertex, the weakly connected one if the graph is directed.
+
+    :param graph: The graph.
+    :param vertex: The vertex.
+    :return: The set of vertices of the component.
+    """
+
+    return set(traversal.bfs_order(Undirected(graph), vertex))
+
+
+def number_of_components(graph):
+    """
+    Counts the connected components of the graph, the weakly connected ones if the graph is directed.
+
+    :param graph: The graph.
+    :return: The number of components.
+    """
+
+    return sum(1 for _ in connected_components(graph))
+
+
+def strongly_connected_components(graph):
+    """
+    Finds the strongly connected components of the graph with Tarjan's algorithm, using an explicit stack instead of
+    recursion. The components are found in reverse topological order: no edge leaves a component to a later one.
+
+    :param graph: The graph.
+    :return: A generator of lists of vertices, one for each component.
+    """
+
+    index, low = dict(), dict()
+    stack, on_stack = list(), set()
+    counter = itertools.count()
+
+    for root in graph:
+        if root in index:
+            continue
+
+        index[root] = low[root] = next(counter)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.neighbors(root)))]
+
+        while work:
+            current, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = next(counter)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.neighbors(neighbor))))
+                    break
+                elif neighbor in on_stack and index[neighbor] < low[current]:
+                    low[current] = index[neighbor]
+            else:
+                work.pop()
+                if work and low[current] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[current]
+                if low[current] == index[current]:
+                    component = list()
+                    while True:
+                        vertex = stack.pop()
+                        on_stack.discard(vertex)
+                        component.append(vertex)
+                        if vertex == current:
+                            break
+                    yield component
+
+
+class UnionFind:
+    """
+    This class implements the disjoint-set (union-find) data structure, with union by size and path halving, so each
+    operation costs O(α(n)) amortised.
+    """
+
+    def __init__(self, elements=()):
+        """
+        Creates a set for each element.
+
+        :param elements: The initial elements.
+        """
+
+        self.parent = dict()
+        self.size = dict()
+        self.count = 0
+
+        for element in elements:
+            self.add(element)
+
+    def __contains__(self, element):
+        return element in self.parent
+
+    def add(self, element):
+        """
+        Creates a set containing only the element, if it isn't in any set yet.
+
+        :param element: The new element.
+        """
+
+        if element not in self.parent:
+            self.parent[element] = element
+            self.size[element] = 1
+            self.count += 1
+
+    def find(self, element):
+        """
+        Finds the representative of the set that contains the element.
+
+        :param element: The element.
+        :return: The representative element.
+        """
+
+        parent = self.parent
+
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+
+        return element
+
+    def union(self, a, b):
+        """
+        Joins the sets that contain two elements.
+
+        :param a: The first element.
+        :param b: The second element.
+        :return: True if the elements were in different sets or False otherwise.
+        """
+
+        a, b = self.find(a), self.find(b)
+
+        if a == b:
+            return False
+
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+
+        self.parent[b] = a
+        self.size[a] += self.size.pop(b)
+        self.count -= 1
+
+        return True
+
+    def connected(self, a, b):
+        """
+        Tells if two elements are in the same set.
+
+        :param a: The first element.
+        :param b: The second element.
+        :return: True if they are in the same set or False otherwise.
+        """
+
+        return self.find(a) == self.find(b)
+
+
+class ConnectivityIndex:
+    """
+    This class answers if two vertices are connected in O(α(n)) with a union-find over the graph's vertices. It observes
+    the graph and joins the components as vertices and edges are added. A removal can split a component, what a
+    union-find can't represent, so it's rebuilt on the next query after a vertex or an edge is removed.
+    """
+
+    def __init__(self, graph):
+        """
+        Builds the index and subscribes it to the graph's changes.
+
+        :param graph: The graph to be indexed.
+        """
+
+        self.graph = graph
+        self._sets = None
+        graph.subscribe(self)
+
+    def close(self):
+        """
+        Stops observing the graph.
+        """
+
+        self.graph.unsubscribe(self)
+
+    @property
+    def sets(self):
+        """
+        The union-find over the graph's vertices, rebuilt if it's out of date.
+
+        :return: A UnionFind instance.
+        """
+
+        if self._sets is None:
+            self._sets = UnionFind(self.graph)
+            for vertex in self.graph:
+                for neighbor in self.graph.neighbors(vertex):
+                    self._sets.union(vertex, neighbor)
+
+        return self._sets
+
+    def connected(self, u, v):
+        """
+        Tells if there is a path between two vertices, ignoring the direction of the edges.
+
+        :param u: The first vertex.
+        :param v: The second vertex.
+        :return: True if they are in the same component or False otherwise.
+        """
+
+        return self.sets.connected(u, v)
+
+    @property
+    def number_of_components(self):
+        """
+        Counts the connected components of the graph.
+
+        :return: The number of components.
+        """
+
+        return self.sets.count
+
+    def vertex_added(self, vertex):
+        if self._sets is not None:
+            self._sets.add(vertex)
+
+    def vertex_removed(self, vertex):
+        self._sets = None
+
+    def edge_added(self, u, v, weight):
+        if self._sets is not None:
+            self._sets.union(u, v)
+
+    def edge_removed(self, u, v):
+        self._sets = None
@@ -0,0 +1,245 @@
+"""
+This module implements the algorithms of directed acyclic graphs (DAGs): topological sorting, cycle detection and
+single-source shortest and longest paths.
+
+The topological sort is Kahn's algorithm: the vertices without incoming edges are removed one at a time, each removal
+decrementing the in-degree of its successors, and the order of the removals is a topological order. If some vertices
+are never removed the graph has a cycle, and as every one of them keeps a predecessor among them, following the
+predecessors from any of them leads to a cycle.
+
+In topological order every edge is relaxed once, after all the edges into its origin, so the shortest and the longest
+paths from a source cost O(V + E) instead of the O((V + E) log V) of Dijkstra's algorithm, and the weights can be
+negative. The longest path of the whole graph is its critical path, the chain of dependencies that bounds the time to
+run every job of a dependency graph. An edge without weight costs 1 and parallel edges cost the cheapest of them, as
+in dijkstra.
+
+The functions work on any directed graph that provides neighbors and weighted_neighbors, such as the interned view of
+the adjacency list Graph, which also lets the in-degree counts the graph maintains be used instead of counting them.
+"""
+
+from collections import Counter
+from collections import deque
+from collections import namedtuple
+
+from src.main.graph import adjacency
+from src.main.graph.shortest_path import ShortestPath, path_to
+
+
+LongestPath = namedtuple('LongestPath', ['path', 'weight'])
+
+
+def _check(graph):
+    if not graph.is_directed:
+        raise Exception('Topological orders are defined for directed graphs.')
+
+
+def _successors(graph, vertex):
+    # Each successor with the number of edges to it, so the in-degrees can count the parallel edges.
+    vertices = getattr(graph, '_vertices', None)
+
+    if vertices is not None and not isinstance(graph, dict):
+        return ((successor, adjacency.count(weights)) for successor, weights in vertices[vertex].out_neighbors.items())
+
+    return Counter(graph.neighbors(vertex)).items()
+
+
+def _kahn(graph, in_degrees):
+    # The vertices removed by Kahn's algorithm, in order, and the remaining in-degree of each vertex.
+    if in_degrees is None:
+        in_degrees = dict.fromkeys(graph, 0)
+        for vertex in graph:
+            for successor, count in _successors(graph, vertex):
+                in_degrees[successor] += count
+
+    remaining = dict(in_degrees)
+    queue = deque(vertex for vertex, degree in remaining.items() if degree == 0)
+    order = list()
+
+    while queue:
+        vertex = queue.popleft()
+        order.append(vertex)
+        for successor, count in _successors(graph, vertex):
+            remaining[successor] -= count
+            if remaining[successor] == 0:
+                queue.append(successor)
+
+    return order, remaining
+
+
+def topological_sort(graph, in_degrees=None):
+    """
+    Sorts the vertices of a directed acyclic graph so every edge goes from a vertex to a later one, with Kahn's
+    algorithm.
+
+    :param graph: The directed graph.
+    :param in_degrees: The number of edges into each vertex, counting the parallel ones, if the graph maintains them.
+    :return: The list of vertices in topological order.
+    """
+
+    _check(graph)
+    order, _ = _kahn(graph, in_degrees)
+
+    if len(order) != len(graph):
+        raise Exception('The graph has a cycle, so it has no topological order.')
+
+    return order
+
+
+def find_cycle(graph, in_degrees=None):
+    """
+    Finds a directed cycle, a witness that the graph has no topological order.
+
+    :param graph: The directed graph.
+    :param in_degrees: The number of edges into each vertex, counting the parallel ones, if the graph maintains them.
+    :return: The list of vertices of the cycle, starting and ending with the same vertex, or None if the graph is
+             acyclic.
+    """
+
+    _check(graph)
+    order, remaining = _kahn(graph, in_degrees)
+
+    if len(order) == len(graph):
+        return None
+
+    left = {vertex for vertex, degree in remaining.items() if degree > 0}
+    vertex = next(iter(left))
+    walk, position = [vertex], {vertex: 0}
+
+    # Each vertex left has a predecessor left, so the backward walk repeats a vertex after at most len(left) steps.
+    while True:
+        predecessor = next(p for p in graph.predecessors(vertex) if p in left)
+        if predecessor in position:
+            start = position[predecessor]
+            return [predecessor] + walk[:start:-1] + [predecessor]
+        position[predecessor] = len(walk)
+        walk.append(predecessor)
+        vertex = predecessor
+
+
+def _relax(graph, source, order, better):
+    if source not in graph:
+        raise Exception('Start vertex cannot be found in the graph.')
+
+    if order is None:
+        order = topological_sort(graph)
+
+    distances, previous = {source: 0.0}, dict()
+
+    for vertex in order:
+        if vertex not in distances:
+            continue  # not reachable from the source, or before it in the order
+        distance = distances[vertex]
+        for neighbor, cost in graph.weighted_neighbors(vertex):
+            if neighbor not in distances or better(distance + cost, distances[neighbor]):
+                distances[neighbor] = distance + cost
+                previous[neighbor] = vertex
+
+    return distances, previous
+
+
+def shortest_paths(graph, source, order=None):
+    """
+    Computes the distance from a source to every vertex reachable from it in a directed acyclic graph, relaxing the
+    edges in topological order.
+
+    :param graph: The directed acyclic graph.
+    :param source: The initial vertex.
+    :param order: The topological order of the vertices, if already known.
+    :return: A tuple (distances, previous) as returned by dijkstra.
+    """
+
+    return _relax(graph, source, order, lambda new, old: new < old)
+
+
+def longest_paths(graph, source, order=None):
+    """
+    Computes the weight of the longest path from a source to every vertex reachable from it in a directed acyclic
+    graph, relaxing the edges in topological order.
+
+    :param graph: The directed acyclic graph.
+    :param source: The initial vertex.
+    :param order: The topological order of the vertices, if already known.
+    :return: A tuple (distances, previous) where distances maps each reachable vertex to the weight of the longest
+             path from the source to it and previous maps each of them, except the source, to its predecessor in it.
+    """
+
+    return _relax(graph, source, order, lambda new, old: new > old)
+
+
+def shortest_path(graph, source, target, order=None):
+    """
+    Finds the shortest path between two vertices of a directed acyclic graph.
+
+    :param graph: The directed acyclic graph.
+    :param source: The initial vertex.
+    :param target: The vertex to be reached from the initial vertex.
+    :param order: The topological order of the vertices, if already known.
+    :return: A ShortestPath tuple with the list of vertices in the path and its total weight.
+    """
+
+    if target not in graph:
+        raise Exception('The target vertex does not exist in the graph.')
+
+    distances, previous = shortest_paths(graph, source, order)
+
+    if target not in distances:
+        raise Exception('The target vertex is unreachable')
+
+    return ShortestPath(path_to(previous, source, target), distances[target])
+
+
+def longest_path(graph, source, target, order=None):
+    """
+    Finds the longest path between two vertices of a directed acyclic graph.
+
+    :param graph: The directed acyclic graph.
+    :param source: The initial vertex.
+    :param target: The vertex to be reached from the initial vertex.
+    :param order: The topological order of the vertices, if already known.
+    :return: A LongestPath tuple with the list of vertices in the path and its total weight.
+    """
+
+    if target not in graph:
+        raise Exception('The target vertex does not exist in the graph.')
+
+    distances, previous = longest_paths(graph, source, order)
+
+    if target not in distances:
+        raise Exception('The target vertex is unreachable')
+
+    return LongestPath(path_to(previous, source, target), distances[target])
+
+
+def critical_path(graph, order=None):
+    """
+    Finds the critical path of a directed acyclic graph, its longest path between any two vertices.
+
+    :param graph: The directed acyclic graph.
+    :param order: The topological order of the vertices, if already known.
+    :return: A LongestPath tuple with the list of vertices in the path and its total weight, an empty path if the graph
+             has no vertices.
+    """
+
+    if order is None:
+        order = topological_sort(graph)
+
+    # Every vertex can start the path, so each one starts at 0.
+    distances, previous = dict.fromkeys(order, 0.0), dict()
+
+    for vertex in order:
+        distance = distances[vertex]
+        for neighbor, cost in graph.weighted_neighbors(vertex):
+            if distance + cost > distances[neighbor]:
+                distances[neighbor] = distance + cost
+                previous[neighbor] = vertex
+
+    if not distances:
+        return LongestPath(list(), 0.0)
+
+    end = max(distances, key=distances.get)
+    path = [end]
+    while path[-1] in previous:
+        path.append(previous[path[-1]])
+    path.reverse()
+
+    return LongestPath(path, distances[end])
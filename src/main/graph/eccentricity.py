@@ -0,0 +1,274 @@
+"""
+This module implements distance based measures of a graph: eccentricity, diameter, radius, center and periphery.
+
+The eccentricity of a vertex is the greatest distance between it and any other vertex of the graph. It's infinite when
+some vertex can not be reached. The diameter is the greatest eccentricity and the radius the lowest one, the center is
+the set of vertices whose eccentricity is equal to the radius and the periphery the set of vertices whose eccentricity
+is equal to the diameter.
+
+Every measure is computed with one shortest path search per source vertex: a Breadth-First Search when the number of
+edges is the distance, or Dijkstra's algorithm when the edge weights are considered. The searches are independent, so
+they can be distributed over a pool of processes. For very large graphs the diameter can be estimated with a double
+sweep, or bounded with the iFUB (iterative Fringe Upper Bound) algorithm, which usually needs only a few searches.
+"""
+
+import math
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.main.graph import shortest_path
+
+
+def distances_from(graph, source, weighted=False):
+    """
+    Computes the distances from a source vertex to every vertex reachable from it.
+
+    :param graph: The graph.
+    :param source: The source vertex.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :return: A dict mapping each reachable vertex to its distance from the source.
+    """
+
+    if weighted:
+        return shortest_path.dijkstra(graph, source)[0]
+
+    distances = {source: 0}
+    queue = deque([source])
+
+    while queue:
+        current = queue.popleft()
+        distance = distances[current] + 1
+        for neighbor in graph.neighbors(current):
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                queue.append(neighbor)
+
+    return distances
+
+
+def _search(graph, source, weighted):
+    # The distances from the source and the predecessor of each vertex in the search tree.
+    if weighted:
+        return shortest_path.dijkstra(graph, source)
+
+    distances, previous = {source: 0}, dict()
+    queue = deque([source])
+
+    while queue:
+        current = queue.popleft()
+        distance = distances[current] + 1
+        for neighbor in graph.neighbors(current):
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                previous[neighbor] = current
+                queue.append(neighbor)
+
+    return distances, previous
+
+
+def _eccentricity(graph, source, weighted):
+    distances = distances_from(graph, source, weighted)
+
+    if len(distances) < len(graph):
+        return math.inf
+
+    return max(distances.values())
+
+
+# State of each worker process, sent once by the pool initializer instead of pickling the graph for every task.
+_worker_graph = None
+_worker_weighted = False
+
+
+def _init_worker(graph, weighted):
+    global _worker_graph, _worker_weighted
+    _worker_graph, _worker_weighted = graph, weighted
+
+
+def _worker_eccentricity(source):
+    return _eccentricity(_worker_graph, source, _worker_weighted)
+
+
+def eccentricities(graph, weighted=False, workers=None):
+    """
+    Computes the eccentricity of every vertex of the graph.
+
+    :param graph: The graph.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :param workers: The number of processes to distribute the searches over. If not informed, or if it's 1, every
+                    search runs in the current process.
+    :return: A dict mapping each vertex to its eccentricity.
+    """
+
+    sources = list(graph)
+
+    if not workers or workers == 1 or len(sources) < 2:
+        return {v: _eccentricity(graph, v, weighted) for v in sources}
+
+    chunksize = max(1, len(sources) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph, weighted)) as executor:
+        return dict(zip(sources, executor.map(_worker_eccentricity, sources, chunksize=chunksize)))
+
+
+def eccentricity(graph, vertex, weighted=False):
+    """
+    Computes the eccentricity of a single vertex.
+
+    :param graph: The graph.
+    :param vertex: The vertex.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :return: The greatest distance from the vertex to any other vertex, or infinity if some vertex is unreachable.
+    """
+
+    if vertex not in graph:
+        raise Exception('The vertex does not exist in the graph.')
+
+    return _eccentricity(graph, vertex, weighted)
+
+
+def _farthest(distances):
+    return max(distances.items(), key=lambda item: item[1])
+
+
+def double_sweep(graph, start=None, weighted=False):
+    """
+    Estimates the diameter with two searches: the first one finds the vertex farthest from the start vertex, and the
+    second one finds the vertex farthest from it. The distance between both is a lower bound of the diameter, which is
+    exact for trees and very close to the diameter for most real world graphs.
+
+    :param graph: The graph.
+    :param start: The vertex where the first search starts. If not informed, any vertex is used.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :return: A lower bound of the diameter.
+    """
+
+    if not len(graph):
+        return 0
+
+    if start is None:
+        start = next(iter(graph))
+
+    distances = distances_from(graph, start, weighted)
+
+    if len(distances) < len(graph):
+        return math.inf
+
+    far, _ = _farthest(distances)
+
+    return _farthest(distances_from(graph, far, weighted))[1]
+
+
+def diameter_bounds(graph, weighted=False, max_sweeps=None):
+    """
+    Computes the diameter of an undirected graph with the iFUB algorithm. Starting from a central vertex u, the vertices
+    are visited from the farthest to the closest to u. After the eccentricities of all the vertices at distance greater
+    than d from u are known, the remaining pairs of vertices are at most 2d apart, so the search stops as soon as the
+    greatest eccentricity found reaches that bound.
+
+    :param graph: An undirected graph.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :param max_sweeps: The maximum number of searches. If not informed, the search runs until the diameter is exact.
+    :return: A tuple (lower, upper) with the bounds of the diameter, both equal when the diameter is exact.
+    """
+
+    if graph.is_directed:
+        raise Exception('The diameter bounds can only be computed for undirected graphs.')
+
+    if not len(graph):
+        return 0, 0
+
+    # A vertex in the middle of a longest path found by a double sweep is a good approximation of a central vertex.
+    distances = distances_from(graph, next(iter(graph)), weighted)
+
+    if len(distances) < len(graph):
+        return math.inf, math.inf
+
+    far, _ = _farthest(distances)
+    distances, previous = _search(graph, far, weighted)
+    center, length = _farthest(distances)
+    # Walks the path back towards far, whose distances always decrease, even along edges of weight zero.
+    while distances[center] > length / 2:
+        center = previous[center]
+
+    distances = distances_from(graph, center, weighted)
+    sweeps = 3
+    lower, upper = length, 2 * max(distances.values())
+
+    fringe = sorted(distances, key=distances.get, reverse=True)
+    i = 0
+
+    while lower < upper and i < len(fringe):
+        level = distances[fringe[i]]
+        while i < len(fringe) and distances[fringe[i]] == level:
+            if max_sweeps is not None and sweeps >= max_sweeps:
+                return lower, upper
+            lower = max(lower, _eccentricity(graph, fringe[i], weighted))
+            sweeps += 1
+            i += 1
+        upper = max(lower, 2 * distances[fringe[i]]) if i < len(fringe) else lower
+
+    return lower, upper
+
+
+def diameter(graph, weighted=False, workers=None, approximate=False):
+    """
+    Computes the diameter of the graph, the greatest eccentricity among its vertices.
+
+    :param graph: The graph.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :param workers: The number of processes to distribute the searches over.
+    :param approximate: If True, returns the lower bound found by a double sweep instead of the exact value.
+    :return: The diameter of the graph, or infinity if it is not connected.
+    """
+
+    if approximate:
+        return double_sweep(graph, weighted=weighted)
+
+    return max(eccentricities(graph, weighted, workers).values(), default=0)
+
+
+def radius(graph, weighted=False, workers=None):
+    """
+    Computes the radius of the graph, the lowest eccentricity among its vertices.
+
+    :param graph: The graph.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :param workers: The number of processes to distribute the searches over.
+    :return: The radius of the graph.
+    """
+
+    return min(eccentricities(graph, weighted, workers).values(), default=0)
+
+
+def center(graph, weighted=False, workers=None):
+    """
+    Finds the vertices whose eccentricity is equal to the radius.
+
+    :param graph: The graph.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :param workers: The number of processes to distribute the searches over.
+    :return: The list of central vertices.
+    """
+
+    values = eccentricities(graph, weighted, workers)
+    lowest = min(values.values(), default=0)
+
+    return [v for v, e in values.items() if e == lowest]
+
+
+def periphery(graph, weighted=False, workers=None):
+    """
+    Finds the vertices whose eccentricity is equal to the diameter.
+
+    :param graph: The graph.
+    :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+    :param workers: The number of processes to distribute the searches over.
+    :return: The list of peripheral vertices.
+    """
+
+    values = eccentricities(graph, weighted, workers)
+    greatest = max(values.values(), default=0)
+
+    return [v for v, e in values.items() if e == greatest]
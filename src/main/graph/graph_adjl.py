@@ -10,7 +10,33 @@ Cons: It's slow for dense graphs. """
 import math
 import re
 
-from collections import defaultdict
+from src.main.graph import adjacency
+from src.main.graph import cache
+from src.main.graph import classification
+from src.main.graph import components
+from src.main.graph import dag
+from src.main.graph import eccentricity
+from src.main.graph import graphical
+from src.main.graph import isomorphism
+from src.main.graph import paths
+from src.main.graph import point_to_point
+from src.main.graph import shortest_path
+from src.main.graph import spanning_tree
+from src.main.graph import tours
+from src.main.graph import traversal
+
+
+def edge_cost(weights):
+    """
+    Returns the cost of moving along the (possibly parallel) edges with the received weights.
+    Edges added without a weight have the infinite value, and are considered to cost 1, so in a graph that is not
+    valued the cheapest path is the one with the least amount of edges.
+
+    :param weights: The weight of the edge between two vertices, or the list of weights of the parallel edges.
+    :return: The lowest cost as a float, each weight being mapped to its cost before the parallel edges are compared.
+    """
+
+    return adjacency.cost(adjacency.cheapest(weights))
 
 
 class Vertex:
@@ -18,16 +44,30 @@ class Vertex:
     This class implements a vertex. In graph theory, a vertex (plural vertices) or node is the fundamental unit
     from which the graphs are formed. """
 
+    __slots__ = ('name', 'id', 'neighbors', 'in_neighbors', 'out_neighbors')
+
     def __init__(self, name):
         """
-        Receives the name of the vertex and creates a list of neighbors.
-        :param name: The vertex' name
+        Receives the name of the vertex. Its adjacency maps are created when the first edge is added to them, see the
+        adjacency module. The neighbors are identified by their integer ids in the graph, see Graph.add_vertex.
+        :param name: The vertex' name, any hashable value
         """
 
-        self.name = str(name)
-        self.neighbors = defaultdict(list)
-        self.in_neighbors = defaultdict(list)
-        self.out_neighbors = defaultdict(list)
+        self.name = name
+        self.id = None
+        self.neighbors = adjacency.EMPTY
+        self.in_neighbors = adjacency.EMPTY
+        self.out_neighbors = adjacency.EMPTY
+
+    def __getstate__(self):
+        # The shared empty map can't be pickled.
+        return self.name, self.id, *(None if m is adjacency.EMPTY else m
+                                     for m in (self.neighbors, self.in_neighbors, self.out_neighbors))
+
+    def __setstate__(self, state):
+        self.name, self.id = state[:2]
+        self.neighbors, self.in_neighbors, self.out_neighbors = (adjacency.EMPTY if m is None else m
+                                                                 for m in state[2:])
 
     def __str__(self):
         """
@@ -35,7 +75,7 @@ class Vertex:
         :return: The vertex' name
         """
 
-        return self.name
+        return str(self.name)
 
     def __repr__(self):
         """
@@ -55,17 +95,105 @@ class Vertex:
         """
 
         if edge_dir == "in":
-            self.in_neighbors[v].append(weight)
+            if self.in_neighbors is adjacency.EMPTY:
+                self.in_neighbors = dict()
+            adjacency.add(self.in_neighbors, v, weight)
         elif edge_dir == "out":
-            self.out_neighbors[v].append(weight)
+            if self.out_neighbors is adjacency.EMPTY:
+                self.out_neighbors = dict()
+            adjacency.add(self.out_neighbors, v, weight)
         else:
-            self.neighbors[v].append(weight)
+            if self.neighbors is adjacency.EMPTY:
+                self.neighbors = dict()
+            adjacency.add(self.neighbors, v, weight)
 
     def get_neighbors(self):
-        if self.out_neighbors:
-            return self.out_neighbors
-        else:
-            return self.neighbors
+        """
+        Returns the vertices reached by the edges of the vertex: its out-neighbors in a directed graph, its neighbors
+        in an undirected one. Only the vertices of undirected graphs have neighbors.
+        :return: The adjacency map.
+        """
+
+        return self.out_neighbors if self.neighbors is adjacency.EMPTY else self.neighbors
+
+
+class InternedGraph:
+    """
+    A view of an adjacency list Graph whose vertices are the integer ids the graph assigns to them. The algorithms run
+    on this view, hashing and comparing small integers instead of the vertex names, and the names are translated only
+    when the results are returned.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self._vertices = graph._vertices
+
+    def __contains__(self, vertex):
+        return isinstance(vertex, int) and 0 <= vertex < len(self._vertices) and self._vertices[vertex] is not None
+
+    def __iter__(self):
+        return (vertex.id for vertex in self.graph.values())
+
+    def __len__(self):
+        return len(self.graph)
+
+    @property
+    def is_directed(self):
+        return self.graph.is_directed
+
+    @property
+    def version(self):
+        return self.graph.version
+
+    @property
+    def id_bound(self):
+        """
+        An upper bound of the ids, so lists of this size can be indexed by any id.
+
+        :return: The greatest id plus one.
+        """
+
+        return len(self._vertices)
+
+    def id_of(self, label):
+        """
+        Translates a vertex name to its id.
+
+        :param label: The vertex name.
+        :return: The vertex id, or -1 if there isn't such vertex. -1 is never in the view, so the algorithms reject
+                 it, but it must not be used as an index.
+        """
+
+        vertex = self.graph.get(label)
+
+        return -1 if vertex is None else vertex.id
+
+    def label_of(self, vertex):
+        """
+        Translates a vertex id to its name.
+
+        :param vertex: The vertex id.
+        :return: The vertex name.
+        """
+
+        return self._vertices[vertex].name
+
+    def neighbors(self, vertex):
+        return self._vertices[vertex].get_neighbors().keys()
+
+    def predecessors(self, vertex):
+        if self.graph.is_directed:
+            return self._vertices[vertex].in_neighbors.keys()
+        return self._vertices[vertex].neighbors.keys()
+
+    def weighted_neighbors(self, vertex):
+        for neighbor, weights in self._vertices[vertex].get_neighbors().items():
+            yield neighbor, edge_cost(weights)
+
+    def weighted_predecessors(self, vertex):
+        vertex = self._vertices[vertex]
+        for predecessor, weights in (vertex.in_neighbors if self.graph.is_directed else vertex.neighbors).items():
+            yield predecessor, edge_cost(weights)
 
 
 class Graph(dict):
@@ -85,6 +213,29 @@ class Graph(dict):
         self.name = name
         self._is_directed = is_directed
 
+        # Each vertex has an integer id, its position in this list. The ids of removed vertices are reused.
+        self._vertices = list()
+        self._free_ids = list()
+
+        # Degree index by vertex id, kept up to date by every method that adds or removes edges.
+        self._degrees = dict()
+        self._in_degrees = dict()
+        self._out_degrees = dict()
+
+        # Objects notified of every change, see subscribe.
+        self._observers = list()
+
+        # Mutation counter, increased by every change, and the results of the queries made since the last change.
+        self._version = 0
+        self.cache = cache.QueryCache()
+
+    def __getstate__(self):
+        # The observers stay with the original graph, a copy starts without any.
+        state = self.__dict__.copy()
+        state['_observers'] = list()
+        state['cache'] = cache.QueryCache(self.cache.maxsize)
+        return state
+
     def __str__(self):
         """
         Represents the graph in the form of an adjacency list.
@@ -94,11 +245,12 @@ class Graph(dict):
 
         str_g = ''
 
-        for key in sorted(list(self.keys())):
+        for key in sorted(self.keys(), key=str):
             # str_g += key + ' --> ' + str(self[key].get_neighbors()) + '\n'
-            str_g += key + ' → '
+            str_g += str(key) + ' → '
             str_list = ''
-            for vertex in [(k, v) for k, v in self[key].get_neighbors().items()]:
+            for vertex in [(self._vertices[k].name, adjacency.weights(v))
+                           for k, v in self[key].get_neighbors().items()]:
                 str_list += re.sub('[()]', '', str(vertex)) + ' → '
                 str_list = re.sub("',", "':", str_list)
                 str_list = re.sub("'", '', str_list)
@@ -106,24 +258,101 @@ class Graph(dict):
 
         return str_g
 
+    def subscribe(self, observer):
+        """
+        Registers an object to be notified of the changes in the graph. The observer must implement the methods
+        vertex_added(vertex), vertex_removed(vertex), edge_added(u, v, weight) and edge_removed(u, v), called after
+        each change.
+
+        :param observer: The object to be notified.
+        """
+
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer):
+        """
+        Stops notifying an object of the changes in the graph.
+
+        :param observer: The object registered with subscribe.
+        """
+
+        self._observers.remove(observer)
+
+    @property
+    def is_directed(self):
+        """
+        Tells if the graph is directed.
+
+        :return: True if the graph is directed or False otherwise
+        """
+
+        return self._is_directed
+
+    @property
+    def version(self):
+        """
+        The mutation counter of the graph, increased each time a vertex or an edge is added or removed.
+
+        :return: The current version.
+        """
+
+        return self._version
+
+    @property
+    def interned(self):
+        """
+        A view of the graph whose vertices are their integer ids, on which the algorithms run.
+
+        :return: An InternedGraph.
+        """
+
+        return InternedGraph(self)
+
+    def _labels(self, ids):
+        vertices = self._vertices
+        return [vertices[i].name for i in ids]
+
+    def freeze(self):
+        """
+        Converts the graph to the compact and read-only CSR (Compressed Sparse Row) representation, whose vertices are
+        integer ids. Requires NumPy.
+
+        :return: A CSRGraph with the same vertices and edges.
+        """
+
+        from src.main.graph.graph_csr import CSRGraph
+
+        return CSRGraph.from_graph(self)
+
     def add_vertex(self, vertex):
         """
-        Adds a new vertex to the graph.
-        :param vertex: The vertex to be added. It can be a string, an integer, or an instance of Vertex.
+        Adds a new vertex to the graph and assigns an integer id to it.
+        :param vertex: The vertex to be added. It can be an instance of Vertex or its name, any hashable value except
+                       None. Names are not converted, so 1 and '1' are different vertices.
         :return: True if it have succeeded in adding the new vertex or False otherwise.
         """
 
-        if isinstance(vertex, Vertex) and vertex.name not in self:
+        if vertex is None:
+            return False
+        if not isinstance(vertex, Vertex):
+            vertex = Vertex(vertex)
+
+        if vertex.name not in self:
+            if self._free_ids:
+                vertex.id = self._free_ids.pop()
+                self._vertices[vertex.id] = vertex
+            else:
+                vertex.id = len(self._vertices)
+                self._vertices.append(vertex)
             self[vertex.name] = vertex
+            self._in_degrees[vertex.id] = sum(map(adjacency.count, vertex.in_neighbors.values()))
+            self._out_degrees[vertex.id] = sum(map(adjacency.count, vertex.out_neighbors.values()))
+            self._degrees[vertex.id] = (sum(map(adjacency.count, vertex.neighbors.values())) +
+                                        self._in_degrees[vertex.id] + self._out_degrees[vertex.id])
+            self._version += 1
+            for observer in self._observers:
+                observer.vertex_added(vertex.name)
             return True
-        if isinstance(vertex, str) and vertex not in self:
-            self[vertex] = Vertex(vertex)
-            return True
-        if isinstance(vertex, int):
-            vertex = str(vertex)
-            if vertex not in self:
-                self[vertex] = Vertex(vertex)
-                return True
         return False
 
     def rm_vertex(self, vertex):
@@ -133,16 +362,33 @@ class Graph(dict):
         :param vertex: The vertex to be removed
         """
 
-        if not isinstance(vertex, str):
-            vertex = str(vertex)
+        if isinstance(vertex, Vertex):
+            vertex = vertex.name
 
-        if vertex in self:
-            for v in self[vertex].neighbors:
-                for u in self[v].neighbors:
-                    if u == vertex and v != vertex:
-                        self[v].neighbors.pop(vertex)
-                        break
+        removed = self.get(vertex)
+
+        if removed is not None:
+            i, vertices = removed.id, self._vertices
+            for v in removed.neighbors:
+                if v != i:
+                    self._degrees[v] -= adjacency.count(vertices[v].neighbors.pop(i))
+            for v in removed.out_neighbors:
+                if v != i:
+                    count = adjacency.count(vertices[v].in_neighbors.pop(i))
+                    self._in_degrees[v] -= count
+                    self._degrees[v] -= count
+            for v in removed.in_neighbors:
+                if v != i:
+                    count = adjacency.count(vertices[v].out_neighbors.pop(i))
+                    self._out_degrees[v] -= count
+                    self._degrees[v] -= count
             self.pop(vertex)
+            vertices[i] = None
+            self._free_ids.append(i)
+            del self._degrees[i], self._in_degrees[i], self._out_degrees[i]
+            self._version += 1
+            for observer in self._observers:
+                observer.vertex_removed(vertex)
 
     def add_edge(self, u, v=None, weight=math.inf):
         """
@@ -156,78 +402,232 @@ class Graph(dict):
 
         edge_in, edge_out = ("in", "out") if self._is_directed else (None, None)
 
-        if not v:
+        if v is None:
             v = u
 
-        if u in self and v in self:
-            for key, value in self.items():
-                if key == u:
-                    value.add_neighbor(v, weight, edge_out)
-                if key == v:
-                    value.add_neighbor(u, weight, edge_in)
+        vertex_u, vertex_v = self.get(u), self.get(v)
+
+        if vertex_u is not None and vertex_v is not None:
+            vertex_u.add_neighbor(vertex_v.id, weight, edge_out)
+            vertex_v.add_neighbor(vertex_u.id, weight, edge_in)
+            self._degrees[vertex_u.id] += 1
+            self._degrees[vertex_v.id] += 1
+            if self._is_directed:
+                self._out_degrees[vertex_u.id] += 1
+                self._in_degrees[vertex_v.id] += 1
+            self._version += 1
+            for observer in self._observers:
+                observer.edge_added(u, v, weight)
             return True
         else:
             return False
 
+    def add_vertices_from(self, vertices):
+        """
+        Adds many vertices to the graph at once. Vertices that already exist are ignored.
+
+        :param vertices: An iterable of vertices, as accepted by add_vertex.
+        :return: The number of vertices added.
+        """
+
+        add_vertex = self.add_vertex
+
+        return sum(1 for vertex in vertices if add_vertex(vertex))
+
+    def add_edges_from(self, edges, weight=math.inf):
+        """
+        Adds many edges to the graph at once, creating the vertices that don't exist yet.
+
+        :param edges: An iterable of (u, v) or (u, v, weight) tuples.
+        :param weight: The weight of the edges informed without one, if not defined, assumes the infinite value.
+        :return: The number of edges added.
+        """
+
+        directed = self._is_directed
+        degrees, in_degrees, out_degrees = self._degrees, self._in_degrees, self._out_degrees
+        get = self.get
+        observers = self._observers
+        added = 0
+
+        for edge in edges:
+            if len(edge) == 3:
+                u, v, w = edge
+            else:
+                (u, v), w = edge, weight
+
+            vertex_u = get(u)
+            if vertex_u is None:
+                self.add_vertex(u)
+                vertex_u = self[u]
+            vertex_v = get(v)
+            if vertex_v is None:
+                self.add_vertex(v)
+                vertex_v = self[v]
+
+            i, j = vertex_u.id, vertex_v.id
+            if directed:
+                vertex_u.add_neighbor(j, w, 'out')
+                vertex_v.add_neighbor(i, w, 'in')
+                out_degrees[i] += 1
+                in_degrees[j] += 1
+            else:
+                vertex_u.add_neighbor(j, w)
+                vertex_v.add_neighbor(i, w)
+            degrees[i] += 1
+            degrees[j] += 1
+            added += 1
+            self._version += 1
+            for observer in observers:
+                observer.edge_added(u, v, w)
+
+        return added
+
     def rm_edge(self, v, u):
         """
         Removes the edge between the received vertices if it exists.
+        Parallel edges between them are removed as well. In directed graphs only the edges going from v to u
+        are removed.
         :param v: The first vertex
         :param u: The second vertex
         """
 
-        if u in self and v in self:
-            if u in self[v].neighbors:
-                self[v].neighbors.pop(u)
-            if v in self[u].neighbors:
-                self[u].neighbors.pop(v)
+        first, second = self.get(v), self.get(u)
+
+        if first is None or second is None:
+            return
+
+        i, j = first.id, second.id
+
+        if self._is_directed:
+            if j in first.out_neighbors:
+                removed = adjacency.count(first.out_neighbors.pop(j))
+                second.in_neighbors.pop(i)
+                self._out_degrees[i] -= removed
+                self._in_degrees[j] -= removed
+                self._degrees[i] -= removed
+                self._degrees[j] -= removed
+                self._version += 1
+                for observer in self._observers:
+                    observer.edge_removed(v, u)
+        elif j in first.neighbors:
+            removed = adjacency.count(first.neighbors.pop(j))
+            if i != j:
+                second.neighbors.pop(i)
+                self._degrees[i] -= removed
+                self._degrees[j] -= removed
+            else:
+                # A loop is stored twice in the neighbors list and counts twice to the degree.
+                self._degrees[i] -= removed
+            self._version += 1
+            for observer in self._observers:
+                observer.edge_removed(v, u)
 
-    def is_connected(self, found=set(), start=None):
+    def edge_weights(self, u, v):
         """
-        Checks if the graph is connected.
+        Returns the weights of the edges between two vertices, one for each parallel edge. In directed graphs only the
+        edges going from u to v are considered.
+
+        :param u: The first vertex
+        :param v: The second vertex
+        :return: The list of weights, empty if there is no such edge.
+        """
+
+        first, second = self.get(u), self.get(v)
+
+        if first is None or second is None:
+            return list()
+
+        entry = (first.out_neighbors if self._is_directed else first.neighbors).get(second.id)
+
+        if entry is None:
+            return list()
+
+        weights = adjacency.weights(entry)
+
+        # An undirected loop is stored twice.
+        return weights[::2] if first is second and not self._is_directed else weights
+
+    def is_connected(self):
+        """
+        Checks if the graph is connected. A directed graph is considered connected if it's weakly connected, that is,
+        if it's connected when the direction of its edges is ignored.
 
-        :param found: A set of vertices found.
-        :param start: The initial vertex.
         :return: True if it's a connected graph or False otherwise
         """
 
-        vertices = list(self.keys())
-        vertices.sort()
+        return len(self) > 0 and components.number_of_components(self.interned) == 1
+
+    def is_strongly_connected(self):
+        """
+        Checks if there is a directed path from each vertex to every other vertex.
+
+        :return: True if it's a strongly connected graph or False otherwise
+        """
 
-        if not start:
-            start = vertices[0]
+        return len(self) > 0 and len(next(components.strongly_connected_components(self.interned))) == len(self)
 
-        found.add(start)
+    def connected_components(self):
+        """
+        Finds the connected components of the graph, the weakly connected ones if the graph is directed.
 
-        if len(found) != len(vertices):
-            for v in self[start].get_neighbors():
-                if v not in found:
-                    if self.is_connected(found, v):
-                        return True
-        else:
-            return True
+        :return: A list of sets of vertices, one for each component.
+        """
 
-        return False
+        return [set(self._labels(component)) for component in components.connected_components(self.interned)]
+
+    def strongly_connected_components(self):
+        """
+        Finds the strongly connected components of the graph.
+
+        :return: A list of lists of vertices, one for each component.
+        """
+
+        return [self._labels(component) for component in components.strongly_connected_components(self.interned)]
+
+    @cache.memoize(copy=set)
+    def component_of(self, vertex):
+        """
+        Finds the connected component that contains a vertex, the weakly connected one if the graph is directed.
+
+        :param vertex: The vertex
+        :return: The set of vertices of the component.
+        """
+
+        return set(self._labels(components.component_of(self.interned, self[vertex].id)))
 
     @property
-    def min_degree(self):
+    def number_of_components(self):
         """
-        Find the lowest degree of vertex in the graph.
+        Counts the connected components of the graph, the weakly connected ones if the graph is directed.
 
-        :return: The lowest degree
+        :return: The number of components.
+        """
+
+        return components.number_of_components(self.interned)
+
+    def connectivity_index(self):
         """
+        Creates a union-find index of the graph's components, kept up to date as vertices and edges are added, that
+        tells if two vertices are connected in O(α(n)).
 
-        min_degree = math.inf
+        :return: A ConnectivityIndex subscribed to the graph.
+        """
+
+        return components.ConnectivityIndex(self)
 
-        for vertex in self:
-            degree = self.degree(vertex)
+    @property
+    @cache.memoize()
+    def min_degree(self):
+        """
+        Find the lowest degree of vertex in the graph.
 
-            if degree < min_degree:
-                min_degree = degree
+        :return: The lowest degree
+        """
 
-        return min_degree
+        return min(self._degrees.values(), default=math.inf)
 
     @property
+    @cache.memoize()
     def max_degree(self):
         """
         Find the greatest degree of vertex in the graph.
@@ -235,37 +635,56 @@ class Graph(dict):
         :return: The greatest degree
         """
 
-        max_degree = 0
+        return max(self._degrees.values(), default=0)
 
-        for vertex in self:
-            degree = self.degree(vertex)
+    def degree(self, vertex):
+        """
+        Returns the degree of a vertex, the number of edges incident to it. Loops count twice, and in directed graphs
+        the degree is the sum of the in-degree and the out-degree.
 
-            if degree > max_degree:
-                max_degree = degree
-        return max_degree
+        :param vertex: The vertex
+        :return: The vertex' degree or 0 if the vertex does not exist
+        """
 
-    def degree(self, vertex):
         if isinstance(vertex, Vertex):
             vertex = vertex.name
 
-        v_degree = 0
+        vertex = self.get(vertex)
 
-        for v in self:
-            if not self._is_directed:
-                for u in self[v].neighbors:
-                    if u == vertex:
-                        v_degree += len(self[v].neighbors[u])
-            else:
-                for u in self[v].in_neighbors:
-                    if u == vertex:
-                        v_degree += len(self[v].in_neighbors[u])
-                for u in self[v].out_neighbors:
-                    if u == vertex:
-                        v_degree += len(self[v].out_neighbors[u])
+        return 0 if vertex is None else self._degrees[vertex.id]
+
+    def in_degree(self, vertex):
+        """
+        Returns the number of edges arriving at a vertex of a directed graph.
+
+        :param vertex: The vertex
+        :return: The vertex' in-degree or 0 if the vertex does not exist
+        """
+
+        if isinstance(vertex, Vertex):
+            vertex = vertex.name
+
+        vertex = self.get(vertex)
+
+        return 0 if vertex is None else self._in_degrees[vertex.id]
+
+    def out_degree(self, vertex):
+        """
+        Returns the number of edges leaving a vertex of a directed graph.
+
+        :param vertex: The vertex
+        :return: The vertex' out-degree or 0 if the vertex does not exist
+        """
+
+        if isinstance(vertex, Vertex):
+            vertex = vertex.name
 
-        return v_degree
+        vertex = self.get(vertex)
+
+        return 0 if vertex is None else self._out_degrees[vertex.id]
 
     @property
+    @cache.memoize()
     def density(self):
         """
         Calculates the density of the graph using the formula:
@@ -280,31 +699,93 @@ class Graph(dict):
         return 2.0 * e / (v * (v - 1))
 
     @property
+    @cache.memoize()
     def diameter(self):
         """
-        Calculate the diameter of a graph by finding the largest possible path
-        between the two vertices in the graph.
+        Calculate the diameter of a graph, the greatest distance, in number of edges, between two of its vertices.
+        The property is exact and computed in the current process, see compute_diameter and diameter_bounds for the
+        weighted, parallel and approximate versions.
+
+        :return: The diameter of the graph or infinity if there are vertices that can not be reached from others
+        """
+
+        return eccentricity.diameter(self.interned)
+
+    def compute_diameter(self, weighted=False, workers=None, approximate=False):
+        """
+        Calculate the diameter of a graph, the greatest distance between two of its vertices.
+
+        :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+        :param workers: The number of processes to distribute the searches over.
+        :param approximate: If True, returns the lower bound found by a double sweep instead of the exact value.
+        :return: The diameter of the graph or infinity if there are vertices that can not be reached from others
+        """
+
+        return eccentricity.diameter(self.interned, weighted, workers, approximate)
+
+    def diameter_bounds(self, weighted=False, max_sweeps=None):
+        """
+        Bounds the diameter of an undirected graph with the iFUB algorithm, which usually needs only a few searches.
+
+        :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+        :param max_sweeps: The maximum number of searches. If not informed, the search runs until the diameter is exact.
+        :return: A tuple (lower, upper) with the bounds of the diameter, both equal when the diameter is exact.
+        """
+
+        return eccentricity.diameter_bounds(self.interned, weighted, max_sweeps)
+
+    def eccentricities(self, weighted=False, workers=None):
+        """
+        Calculates the eccentricity of every vertex.
+
+        :param weighted: If True the edge weights are used as distances, otherwise each edge counts as 1.
+        :param workers: The number of processes to distribute the searches over.
+        :return: A dict mapping each vertex to its eccentricity.
+        """
 
-        :return: The diameter of the graph
+        vertices = self._vertices
+
+        return {vertices[v].name: e for v, e in eccentricity.eccentricities(self.interned, weighted, workers).items()}
+
+    @property
+    def radius(self):
         """
+        Calculate the radius of a graph, the lowest eccentricity among its vertices.
 
-        v = list(self.vertices)
+        :return: The radius of the graph
+        """
 
-        pairs = [(v[i], v[j]) for i in range(len(v) - 1) for j in range(i + 1, len(v))]
+        return eccentricity.radius(self.interned)
 
-        smallest_paths = list()
+    @property
+    def center(self):
+        """
+        Finds the vertices with the lowest eccentricity.
 
-        for (s, e) in pairs:
-            paths = self.bfs_paths(s, e)
-            smallest = sorted(paths, key=lambda x: len(x))
-            if smallest:
-                smallest_paths.append(smallest[0])
+        :return: The list of central vertices
+        """
 
-        smallest_paths.sort(key=len)
+        return self._labels(eccentricity.center(self.interned))
 
-        diameter = len(smallest_paths[-1])
+    @property
+    def periphery(self):
+        """
+        Finds the vertices with the greatest eccentricity.
+
+        :return: The list of peripheral vertices
+        """
+
+        return self._labels(eccentricity.periphery(self.interned))
 
-        return diameter
+    def eccentricity(self, vertex):
+        """
+        Calculates the eccentricity of a vertex, its greatest distance, in number of edges, to any other vertex.
+
+        :param vertex: The vertex
+        :return: The eccentricity or infinity if some vertex can not be reached from it
+        """
+
+        return eccentricity.eccentricity(self.interned, self.interned.id_of(vertex))
 
     @staticmethod
     def is_degree_sequence(sequence):
@@ -316,7 +797,7 @@ class Graph(dict):
         :param sequence: A graph's degree vertex sequence.
         :return: True if the graph has a degree sequence
         """
-        return all(x >= y for x, y in zip(sequence, sequence[1:]))
+        return graphical.is_non_increasing(sequence)
 
     @staticmethod
     def erdoes_gallai(d_sequence):
@@ -325,27 +806,33 @@ class Graph(dict):
         The Erdös-Gallai Theorem states that the sequence (di) i = 1, ..., n being di >= di + 1
         is a degree sequence of a simple graph if the sum of the sequence is even and
         (d[i])i=1, ..., n <= k(k - 1) + min(d[i], k)i=k+1, .., n   for  k in {1, ..., n}
+        The check takes linear time, see the graphical module.
 
         :param d_sequence: The degree sequence of a graph
         :return: True if the Erdös-Gallai is fulfilled or False otherwise
         """
 
-        if sum(d_sequence) % 2:
-            # sum of sequence is odd
-            return False
+        return graphical.erdos_gallai(d_sequence)
 
-        if Graph.is_degree_sequence(d_sequence):
-            for k in range(1, len(d_sequence) + 1):
-                left = sum(d_sequence[:k])
-                right = k * (k - 1) + sum([min(x, k) for x in d_sequence[k:]])
-                if left > right:
-                    return False
-        else:
-            # sequence is increasing
-            return False
-        return True
+    @classmethod
+    def from_degree_sequence(cls, sequence, name='Graph'):
+        """
+        Builds a simple graph with a degree sequence using the Havel-Hakimi algorithm.
+
+        :param sequence: The degree of each vertex, in any order. The vertex i, named by the integer i, has the degree
+                         sequence[i].
+        :param name: The graph's name.
+        :return: A new Graph.
+        """
+
+        graph = cls(name)
+        graph.add_vertices_from(range(len(sequence)))
+        graph.add_edges_from(graphical.havel_hakimi(sequence))
+
+        return graph
 
     @property
+    @cache.memoize()
     def degree_sequence(self):
         """
         Returns the vertices' degree sequence of the graph.
@@ -353,31 +840,17 @@ class Graph(dict):
         :return: Returns an inversely sorted tuple containing all the vertices degrees.
         """
 
-        seq = list()
-
-        for vertex in self:
-            seq.append(self.degree(vertex))
-
-        seq.sort(reverse=True)
-
-        return tuple(seq)
+        return tuple(sorted(self._degrees.values(), reverse=True))
 
     @property
+    @cache.memoize(copy=list)
     def isolated_vertices(self):
         """
         Finds all the isolated vertices.
 
         :return: The isolated vertices list or an empty list if there isn't any isolated vertex.
         """
-        isolated = list()
-
-        for v in self:
-            if self._is_directed and not self[v].out_neighbors and not self[v].in_neighbors:
-                isolated.append(v)
-            elif not self._is_directed and not self[v].neighbors:
-                isolated.append(v)
-
-        return isolated
+        return self._labels(v for v, degree in self._degrees.items() if degree == 0)
 
     @property
     def vertices(self):
@@ -404,7 +877,7 @@ class Graph(dict):
                 # if {v, neighbor} not in visited:
                     # visited.append(set((v, neighbor)))    # Ignore duplicates
                     # yield(v, neighbor)
-                yield (v, neighbor)
+                yield (v, self._vertices[neighbor].name)
 
     @property
     def leaves(self):
@@ -412,11 +885,9 @@ class Graph(dict):
         Generates a list of leaf vertices
         """
 
-        leaves_list = list()
-
-        for v in self:
-            if self.degree(v) == 1:
-                yield v
+        for v, degree in self._degrees.items():
+            if degree == 1:
+                yield self._vertices[v].name
 
     @property
     def sources(self):
@@ -424,9 +895,9 @@ class Graph(dict):
         Yields all source vertices (vertices with in-degree zero)
         """
 
-        for v in self:
-            if not self[v].in_neighbors:
-                yield v
+        for v, degree in self._in_degrees.items():
+            if not degree:
+                yield self._vertices[v].name
 
     @property
     def sinks(self):
@@ -434,21 +905,29 @@ class Graph(dict):
         Yields all sink vertices (vertices with out-degree zero)
         """
 
-        for v in self:
-            if not self[v].out_neighbors:
-                yield v
+        for v, degree in self._out_degrees.items():
+            if not degree:
+                yield self._vertices[v].name
 
     @property
     def pendants(self):
 
         for leaf in self.leaves:
-            yield (
-                self[leaf].name,
-                [k for k in
-                    self[leaf].out_neighbors.items() or
-                    self[leaf].in_neighbors.items() or
-                    self[leaf].get_neighbors()][0][0]
-            )
+            vertex = self[leaf]
+            neighbor = next(iter(vertex.out_neighbors or vertex.in_neighbors or vertex.neighbors))
+            yield vertex.name, self._vertices[neighbor].name
+
+    @property
+    @cache.memoize()
+    def classification(self):
+        """
+        Classifies the structure of the graph in O(V + E): whether it's simple, a multigraph or a pseudograph,
+        bipartite, complete bipartite, acyclic, a forest, a tree, regular, complete, a cycle, a wheel or a star.
+
+        :return: A Classification tuple.
+        """
+
+        return classification.classify(self)
 
     # Breadth-First Search Methods ==============================================
 
@@ -458,72 +937,56 @@ class Graph(dict):
 
         :param start: The initial vertex
         :param target: The target vertex to be find
-        :return: True if the target vertex is found or False otherwise
+        :return: A list containing all vertices that have been visited until the target is found or None otherwise.
         """
 
-        queue, visited = [start], list()
-
-        while queue:
-            current = queue.pop(0)
-            if current == target:
-                return visited + [current]
+        graph = self.interned
+        visited, target = list(), graph.id_of(target)
 
-            if current not in visited:
-                queue.extend(set(self[current].get_neighbors()) - set(visited))
-                visited += [current]
+        for vertex in traversal.bfs_order(graph, self[start].id):
+            visited.append(vertex)
+            if vertex == target:
+                return self._labels(visited)
         return None
 
     def r_bfs(self, start, target, visited=None):
         """
-        Search for target vertex demonstrating how to make a recursive Breadth-First Search
+        Search for target vertex visiting the graph level by level, as a recursive Breadth-First Search does.
+        The search is iterative, so it doesn't overflow the stack.
 
-        :param start: The initial vertex
+        :param start: The initial vertex or a list of initial vertices
         :param target: The target vertex to be find
-        :param visited: A list to control which vertices have been visited and do not need to be visited again.
+        :param visited: A list of vertices that have already been visited and do not need to be visited again.
         :return: A list containing all vertices that have been visited until the target is found or None otherwise.
         """
 
-        if not visited:
-            visited = list()
-
-        if isinstance(start, list):
-            visited.extend([v for v in start if v not in visited])
-        else:
-            visited.append(start)
-
-        if target in visited:
-            return visited
-
-        if len(visited) >= len(self.keys()):
-            return None
-
-        same_level_nodes = list()
+        graph = self.interned
+        start = [self[v].id for v in start] if isinstance(start, list) else self[start].id
+        visited, target = [graph.id_of(v) for v in visited or ()], graph.id_of(target)
 
-        for v in start:
-            #  Does not consider neighbors that are vertices already visited.
-            neighbors = [u for u in self[v].get_neighbors() if u not in visited]
-            # List of vertices of the same level, without considering repeated vertices.
-            same_level_nodes.extend([u for u in neighbors if u not in same_level_nodes])
-
-        return self.r_bfs(same_level_nodes, target, visited)
+        for level in traversal.bfs_layers(graph, start, set(visited)):
+            visited.extend(level)
+            if target in level:
+                return self._labels(visited)
+        return None
 
-    def bfs_paths(self, start, target):
+    def bfs_paths(self, start, target, max_depth=None, max_paths=None):
         """
-        Returns a generator for all possible paths between a vertex S and a vertex T.
-        Uses the Breadth-First Search method with backtracking.
+        Returns a generator for all possible paths between a vertex S and a vertex T, the shortest ones first.
+        Uses the Breadth-First Search method, and paths with the same prefix share its memory. Every partial path up to
+        the length of the paths found is kept, so max_paths limits the output but not the memory: dfs_paths and
+        k_shortest_paths are the choice for routes in large graphs.
 
         :param start: The initial vertex
         :param target: The target vertex to be find
+        :param max_depth: The maximum number of edges of a path, if not informed the paths can have any length.
+        :param max_paths: The maximum number of paths generated, if not informed all the paths are generated.
         """
 
-        queue = [(start, [start])]
+        graph = self.interned
 
-        while queue:
-            current, path = queue.pop(0)
-            if current == target:
-                yield path
-            for vertex in set(self[current].get_neighbors()) - set(path):
-                queue.extend([(vertex, path + [vertex])])
+        for path in paths.bfs_paths(graph, self[start].id, self[target].id, max_depth, max_paths):
+            yield self._labels(path)
 
     # Depth-First Search Methods ==============================================
 
@@ -533,70 +996,124 @@ class Graph(dict):
 
         :param start: The initial vertex
         :param target: The target vertex to be find
-        :return: True if the target vertex is found or False otherwise
+        :return: A list containing all vertices that have been visited until the target is found or None otherwise.
         """
-        stack, visited = [start], list()
-
-        while stack:
-            current = stack.pop()
-
-            if current == target:
-                return visited + [current]
 
-            if current not in visited:
-                visited.append(current)
-                stack.extend(set(self[current].get_neighbors()) - set(visited))
+        graph = self.interned
+        visited, target = list(), graph.id_of(target)
 
+        for vertex in traversal.dfs_order(graph, self[start].id):
+            visited.append(vertex)
+            if vertex == target:
+                return self._labels(visited)
         return None
 
     def r_dfs(self, start, target, visited=None):
         """
-        Search for a given target vertex using the recursive Depth-First Search algorithm.
+        Search for a given target vertex visiting the vertices in the same order as the recursive Depth-First Search
+        algorithm. The search is iterative, so it doesn't overflow the stack.
 
         :param start: The initial vertex
         :param target: The target vertex to be find
-        :param visited: A list to control which vertices have been visited and do not need to be visited again.
+        :param visited: A list of vertices that have already been visited and do not need to be visited again.
         :return: A list containing all vertices that have been visited until the target is found or None otherwise.
         """
 
-        if not visited:
-            visited = list()
+        graph = self.interned
+        visited, target = [graph.id_of(v) for v in visited or ()], graph.id_of(target)
 
-        visited.append(start)
-
-        for v in set(self[start].get_neighbors()) - set(visited):
-
-            if target not in visited:
-                self.r_dfs(v, target, visited)
-
-            if target in visited:
-                return visited
-
-        # return None
+        for vertex in traversal.dfs_order(graph, self[start].id, set(visited)):
+            visited.append(vertex)
+            if vertex == target:
+                return self._labels(visited)
+        return None
 
-    def dfs_paths(self, start, target, visited=None):
+    def dfs_paths(self, start, target, visited=None, max_depth=None, max_paths=None):
         """
         Returns a generator for all possible paths between a vertex S and a vertex T.
         Uses the Depth-First Search method with backtracking.
 
         :param start: The initial vertex
         :param target: The target vertex to be find
-        :param visited: A list to control which vertices have been visited and do not need to be visited again.
+        :param visited: The vertices already in the path, ending at the start vertex.
+        :param max_depth: The maximum number of edges of a path, if not informed the paths can have any length.
+        :param max_paths: The maximum number of paths generated, if not informed all the paths are generated.
+        """
+
+        graph = self.interned
+        visited = [self[v].id for v in visited] if visited else None
+
+        for path in paths.dfs_paths(graph, self[start].id, self[target].id, max_depth, max_paths, visited):
+            yield self._labels(path)
+
+    def k_shortest_paths(self, start, target, k):
         """
+        Finds the k shortest paths, that don't repeat vertices, between two vertices using Yen's algorithm.
 
-        if not visited:
-            visited = [start]
+        :param start: The initial vertex.
+        :param target: The target vertex.
+        :param k: The number of paths.
+        :return: A list of up to k ShortestPath tuples in order of weight.
+        """
 
-        if start == target:
-            yield visited
+        graph = self.interned
 
-        for vertex in [x for x in self[start].get_neighbors() if x not in visited]:
-            for each_path in self.dfs_paths(vertex, target, visited + [vertex]):
-                yield each_path  # return the paths generator
+        return [shortest_path.ShortestPath(self._labels(p.path), p.weight)
+                for p in paths.k_shortest_paths(graph, graph.id_of(start), graph.id_of(target), k)]
 
     # ----------------------------------------------------------
 
-    def dijkstra(self, start, target, visited=None, distances=None, previous=None):
+    def neighbors(self, vertex):
+        """
+        Returns the vertices that can be reached from a vertex through one edge.
+
+        :param vertex: The vertex whose neighbors will be returned.
+        :return: A list of the neighbors' names.
+        """
+
+        return self._labels(self[vertex].get_neighbors())
+
+    def predecessors(self, vertex):
+        """
+        Returns the vertices from which a vertex can be reached through one edge. In undirected graphs they are the
+        same as its neighbors.
+
+        :param vertex: The vertex whose predecessors will be returned.
+        :return: A list of the predecessors' names.
+        """
+
+        if self._is_directed:
+            return self._labels(self[vertex].in_neighbors)
+        return self._labels(self[vertex].neighbors)
+
+    def weighted_neighbors(self, vertex):
+        """
+        Yields the neighbors of a vertex together with the cost of the edge reaching each one of them.
+        When there are parallel edges only the cheapest one is considered.
+
+        :param vertex: The vertex whose neighbors will be returned.
+        :return: A generator of (neighbor, cost) tuples.
+        """
+
+        for neighbor, weights in self[vertex].get_neighbors().items():
+            yield self._vertices[neighbor].name, edge_cost(weights)
+
+    def weighted_predecessors(self, vertex):
+        """
+        Yields the predecessors of a vertex together with the cost of the edge from each one of them.
+        When there are parallel edges only the cheapest one is considered.
+
+        :param vertex: The vertex whose predecessors will be returned.
+        :return: A generator of (predecessor, cost) tuples.
+        """
+
+        vertex = self[vertex]
+
+        for predecessor, weights in (vertex.in_neighbors if self._is_directed else vertex.neighbors).items():
+            yield self._vertices[predecessor].name, edge_cost(weights)
+
+    @cache.memoize(copy=lambda path: shortest_path.ShortestPath(list(path.path), path.weight))
+    def dijkstra(self, start, target):
         """
         Dijkstra Algorithm implementation.
         Finds the shortest path between two vertices, uses weighted edges to represent the cost of each path for each
@@ -605,57 +1122,256 @@ class Graph(dict):
 
         :param start: The initial vertex.
         :param target: The vertex to be reached from the initial vertex.
-        :param visited: A list to control which vertices have been visited.
-        :param distances: List used to store the minimum distances for each vertex.
-        :param previous: The predecessor vertex of the current vertex.
-        :return: The shortest path from start to target.
+        :return: A ShortestPath tuple containing the list of vertices of the shortest path and its weight.
+        """
+
+        graph = self.interned
+        path = shortest_path.shortest_path(graph, graph.id_of(start), graph.id_of(target))
+
+        return shortest_path.ShortestPath(self._labels(path.path), path.weight)
+
+    def minimum_spanning_tree(self, algorithm='kruskal'):
         """
+        Finds a minimum spanning tree of the graph, or a minimum spanning forest if it isn't connected.
 
-        if not visited:
-            visited = list()
-        if not distances:
-            distances = dict()
-        if not previous:
-            previous = dict()
+        :param algorithm: 'kruskal' or 'prim'.
+        :return: A new Graph with all the vertices and only the edges of the tree, each one with the weight of the
+                 cheapest of the parallel edges it replaces.
+        """
+
+        tree = Graph(self.name, self._is_directed)
+        tree.add_vertices_from(self)
 
-        if start not in self:
-            raise Exception('Start vertex cannot be found in the graph.')
-        if target not in self:
-            raise Exception('The target vertex does not exist in the graph.')
-        if not self[target].get_neighbors():
-            raise Exception('The target vertex is unreachable')
+        vertices = self._vertices
+        for u, v, _ in spanning_tree.minimum_spanning_tree(self.interned, algorithm).edges:
+            tree.add_edge(vertices[u].name, vertices[v].name, adjacency.cheapest(vertices[u].neighbors[v]))
 
-        if start == target:
-            path = list()
-            ant = target
+        return tree
 
-            while ant:
-                path.append(ant)
-                ant = previous.get(ant, None)
-            path.reverse()
+    def bidirectional_dijkstra(self, start, target):
+        """
+        Finds the shortest path between two vertices searching forward from the initial vertex and backward from the
+        target at the same time, which settles far fewer vertices than dijkstra on large graphs.
 
-            return 'Smaller path: {}\nWeight: {}'.format(path, distances[target])
+        :param start: The initial vertex.
+        :param target: The vertex to be reached from the initial vertex.
+        :return: A ShortestPath tuple containing the list of vertices of the shortest path and its weight.
+        """
 
+        graph = self.interned
+        path = point_to_point.bidirectional_dijkstra(graph, graph.id_of(start), graph.id_of(target))
+
+        return shortest_path.ShortestPath(self._labels(path.path), path.weight)
+
+    def landmarks(self, count=8):
+        """
+        Precomputes the distances to and from some landmark vertices, used by astar to bound the distances. It must be
+        computed again after the graph changes.
+
+        :param count: The number of landmarks.
+        :return: A Landmarks table.
+        """
+
+        return point_to_point.Landmarks(self.interned, count)
+
+    def astar(self, start, target, heuristic=None):
+        """
+        Finds the shortest path between two vertices with the A* algorithm, guided by a heuristic.
+
+        :param start: The initial vertex.
+        :param target: The vertex to be reached from the initial vertex.
+        :param heuristic: A Landmarks table made by the landmarks method, or a function that receives a vertex and the
+                          target and returns a lower bound of the distance between them. If not informed the search is
+                          the same as dijkstra.
+        :return: A ShortestPath tuple containing the list of vertices of the shortest path and its weight.
+        """
+
+        graph = self.interned
+        target_id = graph.id_of(target)
+
+        if isinstance(heuristic, point_to_point.Landmarks):
+            if heuristic.graph.graph is not self or heuristic.version != self._version:
+                raise Exception('The landmarks are out of date, the graph has changed.')
+            estimate = heuristic.heuristic(target_id)
+        elif heuristic is not None:
+            vertices = self._vertices
+            estimate = lambda vertex: heuristic(vertices[vertex].name, target)  # noqa: E731
         else:
-            if not visited:
-                distances[start] = 0
-            for neighbor in self[start].get_neighbors():
-                if neighbor not in visited:
-                    new_distance = distances[start] + float(min(self[start].get_neighbors()[neighbor]))
-                    if new_distance < distances.get(neighbor, math.inf):
-                        distances[neighbor] = new_distance
-                        previous[neighbor] = start
+            estimate = None
+
+        path = point_to_point.astar(graph, graph.id_of(start), target_id, estimate)
+
+        return shortest_path.ShortestPath(self._labels(path.path), path.weight)
+
+    @cache.memoize(copy=list)
+    def topological_sort(self):
+        """
+        Sorts the vertices of a directed acyclic graph so every edge goes from a vertex to a later one, using the
+        in-degrees the graph keeps.
+
+        :return: The list of vertices in topological order.
+        """
+
+        return self._labels(dag.topological_sort(self.interned, self._in_degrees))
+
+    def find_cycle(self):
+        """
+        Finds a directed cycle, a witness that the graph has no topological order.
+
+        :return: The list of vertices of the cycle, starting and ending with the same vertex, or None if the graph is
+                 acyclic.
+        """
+
+        cycle = dag.find_cycle(self.interned, self._in_degrees)
+
+        return None if cycle is None else self._labels(cycle)
+
+    def _topological_ids(self):
+        return [self[label].id for label in self.topological_sort()]
+
+    def dag_shortest_path(self, start, target):
+        """
+        Finds the shortest path between two vertices of a directed acyclic graph in O(V + E), relaxing the edges in
+        topological order. Unlike dijkstra, the weights can be negative.
+
+        :param start: The initial vertex.
+        :param target: The vertex to be reached from the initial vertex.
+        :return: A ShortestPath tuple containing the list of vertices of the shortest path and its weight.
+        """
+
+        graph = self.interned
+        path = dag.shortest_path(graph, graph.id_of(start), graph.id_of(target), self._topological_ids())
+
+        return shortest_path.ShortestPath(self._labels(path.path), path.weight)
+
+    def dag_longest_path(self, start, target):
+        """
+        Finds the longest path between two vertices of a directed acyclic graph in O(V + E).
+
+        :param start: The initial vertex.
+        :param target: The vertex to be reached from the initial vertex.
+        :return: A LongestPath tuple containing the list of vertices of the longest path and its weight.
+        """
+
+        graph = self.interned
+        path = dag.longest_path(graph, graph.id_of(start), graph.id_of(target), self._topological_ids())
+
+        return dag.LongestPath(self._labels(path.path), path.weight)
+
+    @cache.memoize(copy=lambda path: dag.LongestPath(list(path.path), path.weight))
+    def critical_path(self):
+        """
+        Finds the critical path of a directed acyclic graph, its longest path between any two vertices. In a graph of
+        jobs, whose edges are dependencies weighted by durations, it's the chain that bounds the total time.
+
+        :return: A LongestPath tuple containing the list of vertices of the path and its weight.
+        """
 
-            visited.append(start)
+        path = dag.critical_path(self.interned, self._topological_ids())
 
-            unvisited = {}
+        return dag.LongestPath(self._labels(path.path), path.weight)
 
-            for k in self:
-                if k not in visited:
-                    unvisited[k] = distances.get(k, math.inf)
-            x = min(unvisited, key=unvisited.get)
+    def eulerian_path(self):
+        """
+        Finds an Eulerian path, one that uses every edge exactly once, parallel edges and loops included, with
+        Hierholzer's algorithm in O(V + E). If the graph has an Eulerian circuit, the path is a circuit.
+
+        :return: The list of vertices in the path, or None if there is no such path.
+        """
+
+        path = tours.eulerian_path(self.interned)
+
+        return None if path is None else self._labels(path)
+
+    def eulerian_circuit(self):
+        """
+        Finds an Eulerian circuit, a closed path that uses every edge exactly once, with Hierholzer's algorithm in
+        O(V + E).
+
+        :return: The list of vertices in the circuit, starting and ending with the same vertex, or None if there is no
+                 such circuit.
+        """
+
+        path = tours.eulerian_circuit(self.interned)
+
+        return None if path is None else self._labels(path)
+
+    def hamiltonian_path(self, budget=None):
+        """
+        Finds a Hamiltonian path, one that visits every vertex exactly once, with the Held–Karp dynamic programming in
+        O(2ⁿ·n). Graphs that can't have such a path by their connectivity or degrees are ruled out without the search.
+
+        :param budget: The greatest number of seconds the search can take. If it runs out an exception is raised.
+        :return: The list of vertices in the path, or None if there is no such path.
+        """
+
+        path = tours.hamiltonian_path(self.interned, budget)
+
+        return None if path is None else self._labels(path)
+
+    def hamiltonian_cycle(self, budget=None):
+        """
+        Finds a Hamiltonian cycle, one that visits every vertex exactly once and returns to the first one, with the
+        Held–Karp dynamic programming in O(2ⁿ·n).
+
+        :param budget: The greatest number of seconds the search can take. If it runs out an exception is raised.
+        :return: The list of vertices in the cycle, starting and ending with the same vertex, or None if there is no
+                 such cycle.
+        """
+
+        path = tours.hamiltonian_cycle(self.interned, budget)
+
+        return None if path is None else self._labels(path)
+
+    @property
+    @cache.memoize()
+    def fingerprint(self):
+        """
+        An invariant of the graph, equal for isomorphic graphs: the numbers of vertices and edges, the degree sequence
+        and a Weisfeiler–Lehman hash.
+
+        :return: A hashable tuple.
+        """
+
+        return isomorphism.fingerprint(self)
+
+    @property
+    @cache.memoize()
+    def canonical_form(self):
+        """
+        A key equal for two graphs if and only if they are isomorphic, to group graphs in a dict.
+
+        :return: A hashable tuple.
+        """
+
+        return isomorphism.canonical_form(self)
+
+    def is_isomorphic(self, other):
+        """
+        Checks if the graph is isomorphic to another one, the same graph with the vertices named differently. The
+        fingerprints are compared first, and the vertices are matched only if they are equal.
+
+        :param other: The other graph.
+        :return: True if the graphs are isomorphic or False otherwise.
+        """
+
+        if self.fingerprint != other.fingerprint:
+            return False
+
+        return next(isomorphism.isomorphisms(self, other), None) is not None
+
+    def isomorphism(self, other):
+        """
+        Finds a mapping between the vertices of the graph and the vertices of an isomorphic graph.
+
+        :param other: The other graph.
+        :return: A dict mapping each vertex to a vertex of the other graph, or None if the graphs aren't isomorphic.
+        """
+
+        if self.fingerprint != other.fingerprint:
+            return None
 
-            return self.dijkstra(x, target, visited, distances, previous)
+        return next(isomorphism.isomorphisms(self, other), None)
 
     # TODO implementar:
     '''
@@ -671,36 +1387,36 @@ class Graph(dict):
     mostrar os adjacentes entre sí
     mostrar arestas adjacentes
     mostrar laços
-    verificar se é simples, sem arestas paralelas e laços
-    mostrar se é grafo completo
+    verificar se é simples, sem arestas paralelas e laços OK
+    mostrar se é grafo completo                 OK
     qtd de grafos distintos
-    se é grafo ciclo
+    se é grafo ciclo                            OK
     é um ciclo  OBS grafo ciclo é aquele que é um circulo e não um ciclico que é aquele que possui um ou mais ciclos
-    é aciclico
+    é aciclico                                  OK
     is wheel vertex
-    se é grafo roda
+    se é grafo roda                             OK
     se é grafo cubo
-    se é bipartido
-    se é bipartido completo
-    é grafo estrela?
+    se é bipartido                              OK
+    se é bipartido completo                     OK
+    é grafo estrela?                            OK
     complemento de um grafo
-    multigrafo
-    pseudografo
-    multigrafo dirigido
+    multigrafo                                  OK
+    pseudografo                                 OK
+    multigrafo dirigido                         OK
     hipergrafo
     valorado
-    is regular graph?
+    is regular graph?                           OK
     
     imersível
     subgrafo
-    grafo regular
+    grafo regular                               OK
     matriz adjacencia dirigido e não dirigido
     matriz incidencia
-    ver se são isomorfos
+    ver se são isomorfos                        OK
     árvores e arvores geradoras
     florestas \||||||
     homromorfos
-    caminho euleriano e hamiltoniano
+    caminho euleriano e hamiltoniano            OK
     V. J. Havel (1955) e S. L. Hakimi
 (1961) e S. A. Choudum.
 
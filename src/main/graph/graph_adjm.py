@@ -3,8 +3,17 @@ Adjacency matrix
 pro: rápida para grafos densos
 pro: mais fácil para arestas com peso
 con: mais espaço
+
+The Graph class implemented in this module keeps the edge weights in a NumPy matrix, where the position [i][j] holds the
+weight of the edge from the i-th to the j-th vertex, or the infinite value if there isn't such edge. The matrix is
+preallocated and its capacity doubles whenever it's full, so adding a vertex costs amortised O(V), and whole graph
+operations such as degrees, density and Floyd-Warshall's all pairs shortest paths are vectorised.
 """
 
+import math
+
+import numpy as np
+
 
 class Vertex:
     def __init__(self, name):
@@ -12,45 +21,320 @@ class Vertex:
 
 
 class Graph:
-    vertices = dict()
-    edges = list()
-    edges_indices = dict()
+    """
+    This class implements a graph structure in the form of an adjacency matrix. Parallel edges are not supported,
+    adding an edge between two vertices that are already adjacent replaces its weight.
+    """
 
-    def add_vertex(self, vertex):
-        if isinstance(vertex, Vertex) and vertex.name not in self.vertices:
-            self.vertices[vertex.name] = vertex
-            for row in self.edges:
-                row.append(float('inf'))
-            self.edges.append([float('inf')] * (len(self.edges) + 1))
-            self.edges_indices[vertex.name] = len(self.edges_indices)
-            return True
-        else:
-            return False
+    def __init__(self, name='Graph', is_directed=False, capacity=8):
+        """
+        Creates an empty graph.
 
-    def add_edge(self, u, v, weight=float('inf')):
-        if u in self.vertices and v in self.vertices:
-            self.edges[self.edges_indices[u]][self.edges_indices[v]] = weight
-            self.edges[self.edges_indices[v]][self.edges_indices[u]] = weight
-            return True
-        else:
-            return False
+        :param name: The graph's name.
+        :param is_directed: True if the graph is directed.
+        :param capacity: The number of vertices the matrix has room for before it needs to grow.
+        """
+
+        self.name = name
+        self._is_directed = is_directed
+        self.vertices = dict()
+        self.edges_indices = dict()
+        self._labels = list()
+        self._matrix = np.full((max(1, capacity), max(1, capacity)), math.inf)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __contains__(self, vertex):
+        return vertex in self.edges_indices
 
     def __str__(self):
+        """
+        Represents the graph in the form of an adjacency matrix.
+
+        :return: A string representing the graph's adjacency matrix.
+        """
 
         matrix = '  '
 
         for v in sorted(self.edges_indices):
-            matrix += v + ' '
+            matrix += str(v) + ' '
 
         matrix += '\n'
 
+        order = [i for _, i in sorted(self.edges_indices.items())]
+
         for v, i in sorted(self.edges_indices.items()):
-            matrix += v + ' '
+            matrix += str(v) + ' '
 
-            for j in range(len(self.edges)):
-                e = self.edges[i][j]
-                matrix += (e if str(e) != 'inf' else '∞') + ' '
+            for j in order:
+                e = self._matrix[i, j]
+                matrix += ('%g' % e if e != math.inf else '∞') + ' '
 
             matrix += '\n'
 
         return matrix
+
+    @property
+    def is_directed(self):
+        """
+        Tells if the graph is directed.
+
+        :return: True if the graph is directed or False otherwise
+        """
+
+        return self._is_directed
+
+    @property
+    def edges(self):
+        """
+        The adjacency matrix, the weight of the edge between the vertices with indices i and j is at [i][j].
+
+        :return: A n x n view of the matrix, where n is the number of vertices.
+        """
+
+        n = len(self._labels)
+
+        return self._matrix[:n, :n]
+
+    def add_vertex(self, vertex):
+        """
+        Adds a new vertex to the graph.
+
+        :param vertex: The vertex to be added, an instance of Vertex or its name.
+        :return: True if it have succeeded in adding the new vertex or False otherwise.
+        """
+
+        if not isinstance(vertex, Vertex):
+            vertex = Vertex(vertex)
+
+        if vertex.name in self.vertices:
+            return False
+
+        n = len(self._labels)
+
+        if n == len(self._matrix):
+            matrix = np.full((2 * n, 2 * n), math.inf)
+            matrix[:n, :n] = self._matrix[:n, :n]
+            self._matrix = matrix
+
+        self.vertices[vertex.name] = vertex
+        self.edges_indices[vertex.name] = n
+        self._labels.append(vertex.name)
+
+        return True
+
+    def rm_vertex(self, vertex):
+        """
+        Removes the received vertex if it exists. The last vertex of the matrix takes its place.
+
+        :param vertex: The vertex to be removed
+        """
+
+        if vertex not in self.edges_indices:
+            return
+
+        i, last = self.edges_indices.pop(vertex), len(self._labels) - 1
+
+        if i != last:
+            self._matrix[i, :last + 1] = self._matrix[last, :last + 1]
+            self._matrix[:last + 1, i] = self._matrix[:last + 1, last]
+            self._matrix[i, i] = self._matrix[last, last]
+            self._labels[i] = self._labels[last]
+            self.edges_indices[self._labels[i]] = i
+
+        self._matrix[last, :] = math.inf
+        self._matrix[:, last] = math.inf
+        self._labels.pop()
+        del self.vertices[vertex]
+
+    def add_edge(self, u, v, weight=1.0):
+        """
+        Adds an edge between two vertices of the graph.
+
+        :param u: The first vertex
+        :param v: The second vertex
+        :param weight: The weight of the edge, 1 if not informed.
+        :return: True if it have succeeded in adding the edge or False otherwise.
+        """
+
+        if u in self.edges_indices and v in self.edges_indices:
+            i, j = self.edges_indices[u], self.edges_indices[v]
+            self._matrix[i, j] = weight
+            if not self._is_directed:
+                self._matrix[j, i] = weight
+            return True
+        else:
+            return False
+
+    def rm_edge(self, u, v):
+        """
+        Removes the edge between the received vertices if it exists.
+
+        :param u: The first vertex
+        :param v: The second vertex
+        """
+
+        if u in self.edges_indices and v in self.edges_indices:
+            i, j = self.edges_indices[u], self.edges_indices[v]
+            self._matrix[i, j] = math.inf
+            if not self._is_directed:
+                self._matrix[j, i] = math.inf
+
+    def neighbors(self, vertex):
+        """
+        Returns the vertices that can be reached from a vertex through one edge.
+
+        :param vertex: The vertex whose neighbors will be returned.
+        :return: A list of the neighbors' names.
+        """
+
+        row = self.edges[self.edges_indices[vertex]]
+
+        return [self._labels[j] for j in np.flatnonzero(row != math.inf)]
+
+    def weighted_neighbors(self, vertex):
+        """
+        Returns the neighbors of a vertex together with the weight of the edge reaching each one of them.
+
+        :param vertex: The vertex whose neighbors will be returned.
+        :return: A list of (neighbor, weight) tuples.
+        """
+
+        row = self.edges[self.edges_indices[vertex]]
+        adjacent = np.flatnonzero(row != math.inf)
+
+        return [(self._labels[j], w) for j, w in zip(adjacent.tolist(), row[adjacent].tolist())]
+
+    @property
+    def out_degrees(self):
+        """
+        The number of edges leaving each vertex, in the order of the matrix rows.
+
+        :return: An array of out-degrees.
+        """
+
+        return np.count_nonzero(self.edges != math.inf, axis=1)
+
+    @property
+    def in_degrees(self):
+        """
+        The number of edges arriving at each vertex, in the order of the matrix columns.
+
+        :return: An array of in-degrees.
+        """
+
+        return np.count_nonzero(self.edges != math.inf, axis=0)
+
+    @property
+    def degrees(self):
+        """
+        The degree of each vertex, in the order of the matrix rows. Loops count twice, and in directed graphs the
+        degree is the sum of the in-degree and the out-degree.
+
+        :return: An array of degrees.
+        """
+
+        if self._is_directed:
+            return self.out_degrees + self.in_degrees
+
+        return self.out_degrees + (np.diagonal(self.edges) != math.inf)
+
+    def degree(self, vertex):
+        """
+        Returns the degree of a vertex.
+
+        :param vertex: The vertex
+        :return: The vertex' degree
+        """
+
+        i = self.edges_indices[vertex]
+        row = self.edges[i] != math.inf
+
+        if self._is_directed:
+            return int(np.count_nonzero(row) + np.count_nonzero(self.edges[:, i] != math.inf))
+
+        return int(np.count_nonzero(row) + row[i])
+
+    @property
+    def degree_sequence(self):
+        """
+        Returns the vertices' degree sequence of the graph.
+
+        :return: Returns an inversely sorted tuple containing all the vertices degrees.
+        """
+
+        return tuple(np.sort(self.degrees)[::-1].tolist())
+
+    @property
+    def number_of_edges(self):
+        """
+        Counts the edges of the graph.
+
+        :return: The number of edges
+        """
+
+        adjacent = self.edges != math.inf
+        total = np.count_nonzero(adjacent)
+
+        if self._is_directed:
+            return int(total)
+
+        loops = np.count_nonzero(np.diagonal(adjacent))
+
+        return int((total - loops) // 2 + loops)
+
+    @property
+    def density(self):
+        """
+        Calculates the density of the graph, the ratio between its number of edges and the greatest number of edges a
+        simple graph with the same number of vertices can have.
+
+        :return: The graph density value
+        """
+
+        v = len(self._labels)
+        adjacent = self.edges != math.inf
+        e = np.count_nonzero(adjacent) - np.count_nonzero(np.diagonal(adjacent))
+
+        return float(e) / (v * (v - 1)) if v > 1 else 0.0
+
+    def floyd_warshall(self):
+        """
+        Computes the shortest paths between all the pairs of vertices with the Floyd-Warshall algorithm.
+
+        :return: A tuple (distances, previous) of n x n arrays, indexed as the adjacency matrix.
+        """
+
+        return floyd_warshall(self.edges)
+
+
+def floyd_warshall(matrix):
+    """
+    Computes the shortest paths between all the pairs of vertices with the Floyd-Warshall algorithm. Each one of its
+    V iterations relaxes the whole matrix at once.
+
+    :param matrix: A n x n adjacency matrix with the weight of each edge, or infinity where there isn't an edge.
+    :return: A tuple (distances, previous) of n x n arrays. distances[i][j] is the length of the shortest path from
+             the i-th to the j-th vertex, or infinity if there isn't one, and previous[i][j] is the index of the
+             vertex that precedes the j-th vertex in that path, or -1.
+    """
+
+    n = len(matrix)
+    distances = np.array(matrix, dtype=np.float64)
+    previous = np.where(distances != math.inf, np.arange(n)[:, None], -1)
+
+    diagonal = np.arange(n)
+    distances[diagonal, diagonal] = np.minimum(distances[diagonal, diagonal], 0)
+    previous[diagonal, diagonal] = -1
+
+    for k in range(n):
+        through_k = distances[:, k, None] + distances[k]
+        shorter = through_k < distances
+        np.copyto(distances, through_k, where=shorter)
+        np.copyto(previous, np.broadcast_to(previous[k], (n, n)), where=shorter)
+
+    return distances, previous
@@ -0,0 +1,271 @@
+"""
+This module contains the CSRGraph class, a read-only graph stored in the CSR (Compressed Sparse Row) format.
+
+The vertices are identified by consecutive integers, from 0 to n - 1, and the edges are kept in three NumPy arrays:
+the neighbors of the vertex i are indices[indptr[i]:indptr[i + 1]] and the weights of the edges reaching them are the
+values at the same positions of weights. The original vertex names are kept in the labels list.
+
+Pros: Uses a few bytes per edge, and whole graph operations can be vectorised.
+Cons: It can't be changed, a new graph must be built for every change.
+"""
+
+import math
+
+import numpy as np
+
+from src.main.graph.adjacency import cheapest
+from src.main.graph.graph_adjl import Graph
+
+
+class CSRGraph:
+    """
+    This class implements a frozen graph in the CSR format. Its vertices are integer ids, so the algorithms that work
+    on the adjacency list Graph also work on it, receiving and returning ids instead of vertex names.
+    """
+
+    def __init__(self, indptr, indices, weights, labels, is_directed=False, name='Graph'):
+        """
+        Receives the CSR arrays of the graph.
+
+        :param indptr: Array with n + 1 positions, the neighbors of the vertex i are in indices[indptr[i]:indptr[i + 1]]
+        :param indices: Array with the neighbors of every vertex.
+        :param weights: Array with the weight of the edge to each neighbor in indices.
+        :param labels: The vertex names, labels[i] being the name of the vertex i.
+        :param is_directed: True if the graph is directed.
+        :param name: The graph's name.
+        """
+
+        self.name = name
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self._is_directed = is_directed
+        self._costs = None
+        self._reverse = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Builds the CSR representation of an adjacency list Graph. Parallel edges are merged into their cheapest
+        edge.
+
+        :param graph: The adjacency list Graph.
+        :return: A new CSRGraph.
+        """
+
+        labels = list(graph)
+        # Maps the ids of the adjacency list vertices to the consecutive ids of the CSR graph.
+        index = {graph[label].id: i for i, label in enumerate(labels)}
+        adjacency = [graph[label].get_neighbors() for label in labels]
+
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum([len(neighbors) for neighbors in adjacency], out=indptr[1:])
+        nnz = int(indptr[-1])
+
+        id_type = np.int32 if len(labels) < 2 ** 31 else np.int64
+        indices = np.fromiter((index[u] for neighbors in adjacency for u in neighbors), dtype=id_type, count=nnz)
+        weights = np.fromiter((cheapest(w) for neighbors in adjacency for w in neighbors.values()), dtype=np.float64,
+                              count=nnz)
+
+        return cls(indptr, indices, weights, labels, graph.is_directed, graph.name)
+
+    def to_graph(self):
+        """
+        Builds an adjacency list Graph with the same vertices and edges.
+
+        :return: A new Graph.
+        """
+
+        graph = Graph(self.name, self._is_directed)
+        labels = self.labels
+
+        graph.add_vertices_from(labels)
+
+        for u in range(len(labels)):
+            start, end = self.indptr[u], self.indptr[u + 1]
+            for v, weight in zip(self.indices[start:end].tolist(), self.weights[start:end].tolist()):
+                if self._is_directed or u <= v:
+                    graph.add_edge(labels[u], labels[v], weight)
+
+        return graph
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __iter__(self):
+        return iter(range(len(self.labels)))
+
+    def __contains__(self, vertex):
+        return isinstance(vertex, (int, np.integer)) and 0 <= vertex < len(self.labels)
+
+    def __repr__(self):
+        return 'CSRGraph(%r, vertices=%d, edges=%d, is_directed=%r)' % (
+            self.name, len(self.labels), len(self.indices), self._is_directed)
+
+    @property
+    def is_directed(self):
+        """
+        Tells if the graph is directed.
+
+        :return: True if the graph is directed or False otherwise
+        """
+
+        return self._is_directed
+
+    @property
+    def costs(self):
+        """
+        The cost of each edge, the same as its weight except for the edges without weight, which cost 1.
+
+        :return: An array parallel to indices.
+        """
+
+        if self._costs is None:
+            self._costs = np.where(self.weights == math.inf, 1.0, self.weights)
+
+        return self._costs
+
+    @property
+    def out_degrees(self):
+        """
+        The number of neighbors of each vertex.
+
+        :return: An array with the number of neighbors of each vertex id.
+        """
+
+        return np.diff(self.indptr)
+
+    @property
+    def nbytes(self):
+        """
+        The memory used by the CSR arrays.
+
+        :return: The number of bytes.
+        """
+
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def id_of(self, label):
+        """
+        Translates a vertex name to its id.
+
+        :param label: The vertex name.
+        :return: The vertex id.
+        """
+
+        return self.index[label]
+
+    def label_of(self, vertex):
+        """
+        Translates a vertex id to its name.
+
+        :param vertex: The vertex id.
+        :return: The vertex name.
+        """
+
+        return self.labels[vertex]
+
+    def neighbors(self, vertex):
+        """
+        Returns the vertices that can be reached from a vertex through one edge.
+
+        :param vertex: The vertex id.
+        :return: A list of neighbor ids.
+        """
+
+        return self.indices[self.indptr[vertex]:self.indptr[vertex + 1]].tolist()
+
+    @property
+    def reverse(self):
+        """
+        The graph with the direction of every edge reversed, whose neighbors are the predecessors in this graph. An
+        undirected graph is its own reverse.
+
+        :return: A CSRGraph sharing the labels with this one.
+        """
+
+        if not self._is_directed:
+            return self
+
+        if self._reverse is None:
+            n = len(self.labels)
+            sources = np.repeat(np.arange(n, dtype=self.indices.dtype), self.out_degrees)
+            order = np.argsort(self.indices, kind='stable')
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=n), out=indptr[1:])
+            self._reverse = CSRGraph(indptr, sources[order], self.weights[order], self.labels, True, self.name)
+            self._reverse._reverse = self
+
+        return self._reverse
+
+    def predecessors(self, vertex):
+        """
+        Returns the vertices from which a vertex can be reached through one edge.
+
+        :param vertex: The vertex id.
+        :return: A list of predecessor ids.
+        """
+
+        return self.reverse.neighbors(vertex)
+
+    def weighted_neighbors(self, vertex):
+        """
+        Returns the neighbors of a vertex together with the cost of the edge reaching each one of them.
+
+        :param vertex: The vertex id.
+        :return: An iterator of (neighbor, cost) tuples.
+        """
+
+        start, end = self.indptr[vertex], self.indptr[vertex + 1]
+
+        return zip(self.indices[start:end].tolist(), self.costs[start:end].tolist())
+
+    def weighted_predecessors(self, vertex):
+        """
+        Returns the predecessors of a vertex together with the cost of the edge from each one of them.
+
+        :param vertex: The vertex id.
+        :return: An iterator of (predecessor, cost) tuples.
+        """
+
+        return self.reverse.weighted_neighbors(vertex)
+
+    def bfs_distances(self, source):
+        """
+        Computes the number of edges between a source vertex and every vertex with a level-synchronous Breadth-First
+        Search, expanding each level at once with array operations.
+
+        :param source: The source vertex id.
+        :return: An array with the distance of each vertex id, -1 for the vertices that can't be reached.
+        """
+
+        distances = np.full(len(self.labels), -1, dtype=np.int64)
+        distances[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+
+        while frontier.size:
+            level += 1
+            neighbors = self.indices[gather(self.indptr, frontier)]
+            frontier = np.unique(neighbors[distances[neighbors] < 0])
+            distances[frontier] = level
+
+        return distances
+
+
+def gather(indptr, vertices):
+    """
+    Computes the positions in the indices array of the neighbors of many vertices.
+
+    :param indptr: The CSR row pointers.
+    :param vertices: An array of vertex ids.
+    :return: An array with the positions of the neighbors of all the vertices, in order.
+    """
+
+    starts = indptr[vertices]
+    counts = indptr[vertices + 1] - starts
+    offsets = np.cumsum(counts) - counts
+
+    return np.repeat(starts - offsets, counts) + np.arange(counts.sum())
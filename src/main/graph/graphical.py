@@ -0,0 +1,128 @@
+"""
+This module tells if sequences of integers are graphical, the degree sequences of simple graphs, and builds graphs
+from them.
+
+The Erdős–Gallai theorem states that a non-increasing sequence d1 >= d2 >= ... >= dn is graphical if and only if its sum
+is even and, for every k from 1 to n,
+
+    d1 + ... + dk <= k(k - 1) + min(d(k+1), k) + ... + min(dn, k)
+
+The left side is a prefix sum, and as the sequence is non-increasing the right side is k times the number of terms
+after k that are at least k, plus the sum of the remaining terms. That number only decreases as k grows, so a pointer
+sweeping the sequence once finds it for every k, and the whole check costs O(n) instead of O(n²).
+
+The Havel–Hakimi algorithm builds a graph with a graphical degree sequence: it links the vertex of greatest remaining
+degree to the vertices with the next greatest remaining degrees, and repeats until every degree is used. The vertices
+are kept in buckets by remaining degree, so the greatest ones are found without sorting.
+"""
+
+
+def is_non_increasing(sequence):
+    return all(x >= y for x, y in zip(sequence, sequence[1:]))
+
+
+def erdos_gallai(sequence):
+    """
+    Checks if a non-increasing sequence is graphical with the Erdős–Gallai theorem, in O(n).
+
+    :param sequence: The degree sequence, sorted in non-increasing order.
+    :return: True if it's the degree sequence of a simple graph or False otherwise, including when the sequence isn't
+             non-increasing.
+    """
+
+    n = len(sequence)
+
+    if not is_non_increasing(sequence) or (n and sequence[-1] < 0) or sum(sequence) % 2:
+        return False
+
+    prefix = [0] * (n + 1)
+    for i, d in enumerate(sequence):
+        prefix[i + 1] = prefix[i] + d
+
+    # at_least is the number of terms greater than or equal to k.
+    at_least = n
+
+    for k in range(1, n + 1):
+        while at_least and sequence[at_least - 1] < k:
+            at_least -= 1
+        split = max(at_least, k)
+        if prefix[k] > k * (k - 1) + k * (split - k) + prefix[n] - prefix[split]:
+            return False
+
+    return True
+
+
+def erdos_gallai_batch(sequences):
+    """
+    Checks many sequences at once with the Erdős–Gallai theorem, using NumPy array operations over all of them.
+
+    :param sequences: A 2D array-like with one non-increasing sequence per row. Shorter sequences can be padded with
+                      zeros at the end, which doesn't change whether they are graphical.
+    :return: A boolean array, True for each graphical sequence.
+    """
+
+    import numpy as np
+
+    sequences = np.asarray(sequences, dtype=np.int64)
+    if sequences.ndim != 2:
+        raise Exception('The sequences must be a 2D array, one sequence per row.')
+
+    rows, n = sequences.shape
+    valid = (sequences.sum(axis=1) % 2 == 0) & (sequences.min(axis=1, initial=0) >= 0)
+    valid &= (np.diff(sequences, axis=1) <= 0).all(axis=1)
+
+    if n == 0:
+        return valid
+
+    prefix = np.zeros((rows, n + 1), dtype=np.int64)
+    np.cumsum(sequences, axis=1, out=prefix[:, 1:])
+
+    # counts[r, v] is the number of terms of the row r equal to v, the greater ones counted as n + 1, and its suffix
+    # sums give the number of terms greater than or equal to each v.
+    counts = np.zeros((rows, n + 2), dtype=np.int64)
+    np.add.at(counts, (np.arange(rows)[:, None], np.clip(sequences, 0, n + 1)), 1)
+    at_least = np.cumsum(counts[:, ::-1], axis=1)[:, ::-1]
+
+    k = np.arange(1, n + 1)
+    split = np.maximum(at_least[:, 1:n + 1], k)
+    right = k * (k - 1) + k * (split - k) + prefix[:, n:] - np.take_along_axis(prefix, split, axis=1)
+
+    return valid & (prefix[:, 1:] <= right).all(axis=1)
+
+
+def havel_hakimi(sequence):
+    """
+    Finds the edges of a simple graph with a degree sequence using the Havel–Hakimi algorithm.
+
+    :param sequence: The degree of each vertex, in any order. The vertex i has the degree sequence[i].
+    :return: A list of (u, v) edges between the vertices 0 to n - 1.
+    """
+
+    if not erdos_gallai(sorted(sequence, reverse=True)):
+        raise Exception('The sequence is not the degree sequence of a simple graph.')
+
+    buckets = [list() for _ in range(max(sequence, default=0) + 1)]
+    for vertex, degree in enumerate(sequence):
+        buckets[degree].append(vertex)
+
+    edges = list()
+    top = len(buckets) - 1
+
+    while True:
+        while top and not buckets[top]:
+            top -= 1
+        if not top:
+            return edges
+
+        vertex = buckets[top].pop()
+        targets = list()
+        d = top
+
+        while len(targets) < top:
+            while not buckets[d]:
+                d -= 1
+            targets.append((buckets[d].pop(), d))
+
+        for target, d in targets:
+            edges.append((vertex, target))
+            buckets[d - 1].append(target)
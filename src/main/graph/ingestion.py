@@ -0,0 +1,266 @@
+"""
+This module loads streams of edges into an adjacency list Graph.
+
+The records (u, v) or (u, v, weight) are validated and gathered in batches, and each batch is committed to the graph at
+once with add_edges_from. Within a batch, and against the edges already in the graph, the parallel edges are handled by
+a policy:
+
+    'all'  keeps every parallel edge, as add_edge does.
+    'min'  keeps a single edge between two vertices, the cheapest one, an edge without weight costing 1.
+    'sum'  keeps a single edge between two vertices, whose weight is the sum of the weights, an edge without weight
+           counting as 1.
+
+Every record received is counted once, as rejected, as merged into another edge of the batch or of the graph, or as
+committed, a new edge added to the graph.
+
+The records can come from an iterable, read as the batches are committed, or from an iterable or an async iterator
+read by an asyncio task into a bounded queue: when the queue is full the reading waits for the commits, so a slow graph
+slows the stream down instead of filling the memory.
+"""
+
+import asyncio
+import math
+import numbers
+import time
+
+from src.main.graph import adjacency
+
+
+POLICIES = ('all', 'min', 'sum')
+
+# Marks the end of the records in the queue.
+_DONE = object()
+
+
+class Metrics:
+    """
+    Counters of an ingestion.
+    """
+
+    def __init__(self):
+        self.received = 0
+        self.rejected = 0
+        self.merged = 0
+        self.committed = 0
+        self.batches = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.seconds = 0.0
+
+    @property
+    def throughput(self):
+        """
+        The number of records received per second.
+
+        :return: The rate, 0 if no time has passed.
+        """
+
+        return self.received / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return ('Metrics(received=%d, rejected=%d, merged=%d, committed=%d, batches=%d, max_queue_depth=%d, '
+                'throughput=%.1f/s)' % (self.received, self.rejected, self.merged, self.committed, self.batches,
+                                        self.max_queue_depth, self.throughput))
+
+
+class EdgePipeline:
+    """
+    This class validates, dedupes and commits edges to a graph in batches.
+    """
+
+    def __init__(self, graph, policy='all', batch_size=10000, max_buffer=100000, strict=False):
+        """
+        Creates a pipeline that loads edges into a graph.
+
+        :param graph: The adjacency list Graph.
+        :param policy: How parallel edges are handled, 'all', 'min' or 'sum'.
+        :param batch_size: The number of records committed at once.
+        :param max_buffer: The greatest number of records waiting in the queue of an asynchronous ingestion.
+        :param strict: If True an invalid record raises an exception, otherwise it's counted and skipped.
+        """
+
+        if policy not in POLICIES:
+            raise Exception('Unknown policy: {}'.format(policy))
+        if batch_size < 1 or max_buffer < 1:
+            raise Exception('The batch size and the buffer size must be positive.')
+
+        self.graph = graph
+        self.policy = policy
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self.strict = strict
+        self.metrics = Metrics()
+        self._batch = list()
+        self._merged = dict()
+        self._pending = 0
+
+    def _key(self, u, v):
+        return (u, v) if self.graph.is_directed else frozenset((u, v))
+
+    def _reject(self, record, reason):
+        if self.strict:
+            raise Exception('Invalid edge record {!r}: {}'.format(record, reason))
+        self.metrics.rejected += 1
+
+    def add(self, record):
+        """
+        Adds a record to the current batch, committing it when it's full.
+
+        :param record: A (u, v) or (u, v, weight) tuple.
+        """
+
+        self.metrics.received += 1
+
+        try:
+            if len(record) == 2:
+                (u, v), weight = record, math.inf
+            else:
+                u, v, weight = record
+        except (TypeError, ValueError):
+            return self._reject(record, 'expected (u, v) or (u, v, weight)')
+
+        if u is None or v is None:
+            return self._reject(record, 'a vertex cannot be None')
+        if isinstance(weight, bool) or not isinstance(weight, numbers.Real) or weight != weight or weight < 0:
+            return self._reject(record, 'the weight must be a non-negative number')
+
+        if self.policy == 'all':
+            self._batch.append((u, v, weight))
+        else:
+            key = self._key(u, v)
+            if key in self._merged:
+                self.metrics.merged += 1
+                self._merged[key][2] = self._combine(self._merged[key][2], weight)
+            else:
+                self._merged[key] = [u, v, weight]
+        self._pending += 1
+
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def _combine(self, a, b):
+        if self.policy == 'min':
+            return min(a, b, key=adjacency.cost)
+        return adjacency.cost(a) + adjacency.cost(b)
+
+    def flush(self):
+        """
+        Commits the current batch to the graph.
+
+        :return: The number of edges added to the graph.
+        """
+
+        if not self._pending:
+            return 0
+
+        graph = self.graph
+        # The edges of the graph replaced by the merged ones, which are not new edges.
+        replaced = 0
+
+        if self.policy == 'all':
+            edges = self._batch
+        else:
+            edges = list()
+            for u, v, weight in self._merged.values():
+                existing = graph.edge_weights(u, v)
+                if existing:
+                    self.metrics.merged += 1
+                    merged = weight
+                    for w in existing:
+                        merged = self._combine(merged, w)
+                    if len(existing) == 1 and merged == existing[0]:
+                        continue  # the edge in the graph already has the merged weight
+                    graph.rm_edge(u, v)
+                    replaced += 1
+                    weight = merged
+                edges.append((u, v, weight))
+
+        added = graph.add_edges_from(edges)
+
+        self.metrics.committed += added - replaced
+        self.metrics.batches += 1
+        self._batch = list()
+        self._merged = dict()
+        self._pending = 0
+
+        return added
+
+    def ingest(self, records):
+        """
+        Loads the records of an iterable, reading them as the batches are committed.
+
+        :param records: An iterable of (u, v) or (u, v, weight) tuples.
+        :return: The metrics of the pipeline.
+        """
+
+        start = time.perf_counter()
+
+        try:
+            for record in records:
+                self.add(record)
+            self.flush()
+        finally:
+            self.metrics.seconds += time.perf_counter() - start
+
+        return self.metrics
+
+    async def ingest_async(self, records):
+        """
+        Loads the records of an iterable or an async iterator. A task reads the records into a queue bounded by
+        max_buffer, which waits while the queue is full, and the records are committed as they leave the queue.
+
+        :param records: An iterable or an async iterator of (u, v) or (u, v, weight) tuples.
+        :return: The metrics of the pipeline.
+        """
+
+        start = time.perf_counter()
+        queue = asyncio.Queue(self.max_buffer)
+
+        async def produce():
+            try:
+                if hasattr(records, '__aiter__'):
+                    async for record in records:
+                        await queue.put(record)
+                else:
+                    for record in records:
+                        await queue.put(record)
+            finally:
+                await queue.put(_DONE)
+
+        producer = asyncio.ensure_future(produce())
+        metrics = self.metrics
+
+        try:
+            while True:
+                record = await queue.get()
+                metrics.queue_depth = queue.qsize()
+                metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth + 1)
+                if record is _DONE:
+                    break
+                batches = metrics.batches
+                self.add(record)
+                if metrics.batches != batches:
+                    await asyncio.sleep(0)  # lets the producer run after each commit
+            self.flush()
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+            metrics.queue_depth = 0
+            metrics.seconds += time.perf_counter() - start
+
+        return metrics
+
+
+def ingest(graph, records, policy='all', batch_size=10000):
+    """
+    Loads edges into a graph with an EdgePipeline.
+
+    :param graph: The adjacency list Graph.
+    :param records: An iterable of (u, v) or (u, v, weight) tuples.
+    :param policy: How parallel edges are handled, 'all', 'min' or 'sum'.
+    :param batch_size: The number of records committed at once.
+    :return: The metrics of the ingestion.
+    """
+
+    return EdgePipeline(graph, policy, batch_size).ingest(records)
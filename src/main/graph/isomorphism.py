@@ -0,0 +1,370 @@
+"""
+This module tells if graphs are isomorphic, the same graph with the vertices named differently.
+
+The comparison goes from the cheapest test to the most expensive one:
+
+- The fingerprint of a graph is an invariant, equal for isomorphic graphs: the numbers of vertices and edges, the degree
+  sequence and a Weisfeiler–Lehman hash. The hash comes from the colour refinement: every vertex starts with a colour
+  for its number of loops, and at each round it gets a new colour for its colour and the multiset of the colours of its
+  neighbors, until the colours stop splitting. Graphs with different fingerprints are not isomorphic.
+- The VF2-style matcher searches a mapping between the vertices of two graphs with the same fingerprint, extending it
+  one vertex at a time and backtracking. Only vertices with the same refined colour can be mapped to each other, and
+  each pair must have the same edges to the vertices already mapped.
+- The canonical form is a key equal for two graphs if and only if they are isomorphic, so graphs can be grouped in a
+  dict. The refined colours are made unique by fixing the colour of one vertex at a time and refining again, trying
+  every vertex of a colour, and the key is the least edge list the search finds. Vertices with the same neighbors
+  (twins) lead to the same keys, so only one of them is tried.
+
+The edges count with their multiplicity, so parallel edges and loops matter, but their weights don't. The fingerprint
+and the keys don't depend on the vertex names or on the process, so they can be stored and compared across runs.
+"""
+
+import hashlib
+import heapq
+
+from collections import Counter
+
+from src.main.graph import adjacency
+
+
+class _Structure:
+    """
+    The edges of a graph between the vertex indices 0 to n - 1, out[i] and into[i] mapping each neighbor (predecessor)
+    of the vertex i to the number of edges to (from) it.
+    """
+
+    def __init__(self, graph):
+        self.directed = graph.is_directed
+        self.labels = list(graph)
+        self.n = len(self.labels)
+
+        vertices = getattr(graph, '_vertices', None)
+
+        if vertices is not None:
+            # An adjacency list Graph or its interned view, whose maps keep the parallel edges.
+            objects = [graph[label] if isinstance(graph, dict) else vertices[label] for label in self.labels]
+            index = {vertex.id: i for i, vertex in enumerate(objects)}
+            self.out, self.into = list(), list()
+            for vertex in objects:
+                edges = vertex.out_neighbors if self.directed else vertex.neighbors
+                self.out.append({index[v]: adjacency.count(w) for v, w in edges.items()})
+                if self.directed:
+                    self.into.append({index[v]: adjacency.count(w) for v, w in vertex.in_neighbors.items()})
+        else:
+            index = {label: i for i, label in enumerate(self.labels)}
+            self.out = [{index[v]: k for v, k in Counter(graph.neighbors(label)).items()} for label in self.labels]
+            if self.directed:
+                self.into = [{index[v]: k for v, k in Counter(graph.predecessors(label)).items()}
+                             for label in self.labels]
+
+        if not self.directed:
+            self.into = self.out
+
+    @property
+    def edges(self):
+        return sum(sum(out.values()) for out in self.out)
+
+    def signature(self, colours, v):
+        out = tuple(sorted((colours[w], k) for w, k in self.out[v].items()))
+        into = tuple(sorted((colours[w], k) for w, k in self.into[v].items())) if self.directed else ()
+        return colours[v], out, into
+
+
+def _rank(keys):
+    # Replaces each key by its position among the distinct keys, in order.
+    ranks = {key: i for i, key in enumerate(sorted(set(keys)))}
+    return [ranks[key] for key in keys]
+
+
+def _refine(structure, colours, digest=None):
+    """
+    Refines the colours until they stop splitting. Each new colour is the rank of the vertex's signature, so it doesn't
+    depend on the order of the vertices.
+
+    :param structure: The graph's _Structure.
+    :param colours: The initial colour of each vertex index.
+    :param digest: A hashlib object updated with the signatures of every round.
+    :return: The refined colours.
+    """
+
+    count = len(set(colours))
+
+    while True:
+        signatures = [structure.signature(colours, v) for v in range(structure.n)]
+        if digest is not None:
+            digest.update(repr(sorted(Counter(signatures).items())).encode())
+        colours = _rank(signatures)
+        if len(set(colours)) == count:
+            return colours
+        count = len(set(colours))
+
+
+def _initial_colours(structure):
+    # The number of loops of each vertex, as a loop and an edge to another vertex of the same colour look alike.
+    return _rank([structure.out[v].get(v, 0) for v in range(structure.n)])
+
+
+def _colours(structure):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((structure.n, structure.directed)).encode())
+    colours = _refine(structure, _initial_colours(structure), digest)
+    return colours, digest.hexdigest()
+
+
+def fingerprint(graph):
+    """
+    Computes an invariant of the graph, equal for isomorphic graphs.
+
+    :param graph: An adjacency list Graph, or any graph that provides neighbors (and predecessors if it's directed).
+    :return: A tuple (vertices, edges, degree sequence, Weisfeiler–Lehman hash).
+    """
+
+    structure = _Structure(graph)
+    sequence = getattr(graph, 'degree_sequence', None)
+
+    if sequence is None:
+        degrees = [sum(structure.out[v].values()) + (sum(structure.into[v].values()) if structure.directed else 0)
+                   for v in range(structure.n)]
+        sequence = tuple(sorted(degrees, reverse=True))
+
+    return structure.n, structure.edges, tuple(sequence), _colours(structure)[1]
+
+
+def _feasible(s1, s2, u, v, mapping, reverse):
+    # Tells if u can be mapped to v, given the vertices already mapped.
+    if s1.out[u].get(u, 0) != s2.out[v].get(v, 0):
+        return False
+
+    for edges1, edges2 in ((s1.out, s2.out), (s1.into, s2.into)) if s1.directed else ((s1.out, s2.out),):
+        mapped = 0
+        for w, k in edges1[u].items():
+            if w in mapping:
+                if edges2[v].get(mapping[w]) != k:
+                    return False
+                mapped += 1
+        if mapped != sum(1 for x in edges2[v] if x in reverse):
+            return False
+
+    return True
+
+
+def _order(structure, colours):
+    # Orders the vertices so each one is, if possible, adjacent to one before it, starting by the rarest colours.
+    frequency = Counter(colours)
+    links = [0] * structure.n
+    heap = [(0, frequency[colours[v]], -len(structure.out[v]), v) for v in range(structure.n)]
+    heapq.heapify(heap)
+    order = list()
+    done = [False] * structure.n
+
+    while heap:
+        key, _, _, v = heapq.heappop(heap)
+        if done[v] or key != -links[v]:
+            continue  # stale heap entry
+        done[v] = True
+        order.append(v)
+        for w in set(structure.out[v]) | set(structure.into[v]):
+            if not done[w]:
+                links[w] += 1
+                heapq.heappush(heap, (-links[w], frequency[colours[w]], -len(structure.out[w]), w))
+
+    return order
+
+
+def _isomorphisms(s1, s2, c1, c2):
+    n = s1.n
+    order = _order(s1, c1)
+    by_colour = dict()
+    for v in range(n):
+        by_colour.setdefault(c2[v], list()).append(v)
+
+    mapping, reverse = dict(), dict()
+
+    def candidates(u):
+        # The vertices adjacent to the image of a mapped neighbor of u, or every vertex with the colour of u.
+        for edges1, edges2 in ((s1.into, s2.out), (s1.out, s2.into)):
+            for w in edges1[u]:
+                if w in mapping:
+                    return [x for x in edges2[mapping[w]] if c2[x] == c1[u]]
+        return by_colour.get(c1[u], [])
+
+    if n == 0:
+        yield dict()
+        return
+
+    stack = [iter(candidates(order[0]))]
+
+    while stack:
+        u = order[len(stack) - 1]
+        if u in mapping:
+            del reverse[mapping.pop(u)]
+        for v in stack[-1]:
+            if v not in reverse and _feasible(s1, s2, u, v, mapping, reverse):
+                mapping[u], reverse[v] = v, u
+                break
+        else:
+            stack.pop()
+            continue
+        if len(stack) == n:
+            yield mapping
+        else:
+            stack.append(iter(candidates(order[len(stack)])))
+
+
+def isomorphisms(first, second):
+    """
+    Finds the isomorphisms between two graphs, the mappings between their vertices that preserve the edges.
+
+    :param first: The first graph.
+    :param second: The second graph.
+    :return: A generator of dicts mapping each vertex of the first graph to a vertex of the second one.
+    """
+
+    s1, s2 = _Structure(first), _Structure(second)
+
+    if s1.n != s2.n or s1.directed != s2.directed or s1.edges != s2.edges:
+        return
+
+    (c1, hash1), (c2, hash2) = _colours(s1), _colours(s2)
+
+    if hash1 != hash2:
+        return
+
+    for mapping in _isomorphisms(s1, s2, c1, c2):
+        yield {s1.labels[u]: s2.labels[v] for u, v in mapping.items()}
+
+
+def is_isomorphic(first, second):
+    """
+    Tells if two graphs are isomorphic, comparing their fingerprints and, if they are equal, searching a mapping.
+
+    :param first: The first graph.
+    :param second: The second graph.
+    :return: True if the graphs are isomorphic or False otherwise.
+    """
+
+    if fingerprint(first) != fingerprint(second):
+        return False
+
+    return next(isomorphisms(first, second), None) is not None
+
+
+def _twins(structure, u, w):
+    # Tells if swapping u and w preserves the edges.
+    if structure.out[u].get(w) != structure.out[w].get(u) or structure.out[u].get(u) != structure.out[w].get(w):
+        return False
+
+    for edges in (structure.out, structure.into) if structure.directed else (structure.out,):
+        a = {x: k for x, k in edges[u].items() if x != u and x != w}
+        b = {x: k for x, k in edges[w].items() if x != u and x != w}
+        if a != b:
+            return False
+
+    return True
+
+
+def _orbit_of(generators, path, vertex):
+    # The vertices a composition of the automorphisms that fix every vertex of the path maps the vertex to.
+    useful = [g for g in generators if all(g[v] == v for v in path)]
+    orbit, pending = {vertex}, [vertex]
+
+    while pending:
+        v = pending.pop()
+        for g in useful:
+            if g[v] not in orbit:
+                orbit.add(g[v])
+                pending.append(g[v])
+
+    return orbit
+
+
+def canonical_form(graph):
+    """
+    Computes a canonical form of the graph, a key equal for two graphs if and only if they are isomorphic.
+
+    The search individualises one vertex of the smallest colour class at a time, a depth-first search whose leaves are
+    the colourings where every vertex has its own colour. Two leaves with the same edge list reveal an automorphism,
+    and the vertices an automorphism fixing the current path maps to each other lead to the same leaves, so only one
+    of them is tried. The search can still take exponential time on some graphs, and is meant for small graphs.
+
+    :param graph: An adjacency list Graph, or any graph that provides neighbors (and predecessors if it's directed).
+    :return: A hashable tuple (vertices, directed, edges), the edges being (i, j, multiplicity) tuples between the
+             canonical positions of the vertices.
+    """
+
+    structure = _Structure(graph)
+    n = structure.n
+    best, best_leaf = None, None
+    generators = list()
+    # Each entry is the path of individualised vertices, its colours, the vertices to try and the ones tried.
+    stack = [((), _refine(structure, _initial_colours(structure)), None, None)]
+
+    while stack:
+        path, colours, pending, tried = stack[-1]
+
+        if pending is None:
+            cells = dict()
+            for v in range(n):
+                cells.setdefault(colours[v], list()).append(v)
+            split = [cell for colour, cell in sorted(cells.items()) if len(cell) > 1]
+
+            if not split:
+                stack.pop()
+                edges = tuple(sorted((colours[u], colours[w], k)
+                                     for u in range(n) for w, k in structure.out[u].items()))
+                if best is None or edges < best:
+                    best, best_leaf = edges, colours
+                elif edges == best:
+                    at = [0] * n
+                    for v in range(n):
+                        at[best_leaf[v]] = v
+                    automorphism = [at[colours[v]] for v in range(n)]
+                    if automorphism != list(range(n)):
+                        generators.append(automorphism)
+                continue
+
+            representatives = list()
+            for v in min(split, key=len):
+                if not any(_twins(structure, r, v) for r in representatives):
+                    representatives.append(v)
+            stack[-1] = (path, colours, representatives[::-1], list())
+            continue
+
+        if not pending:
+            stack.pop()
+            continue
+
+        v = pending.pop()
+        if tried and any(t in _orbit_of(generators, path, v) for t in tried):
+            continue
+        tried.append(v)
+
+        individualised = _rank([(colours[x], x != v) for x in range(n)])
+        stack.append((path + (v,), _refine(structure, individualised), None, None))
+
+    return n, structure.directed, best or ()
+
+
+def group_isomorphic(graphs):
+    """
+    Groups graphs into classes of isomorphic graphs. The graphs are bucketed by fingerprint, and the matcher runs only
+    within a bucket.
+
+    :param graphs: An iterable of graphs.
+    :return: A list of lists of isomorphic graphs, in the order they first appear.
+    """
+
+    buckets = dict()
+    classes = list()
+
+    for graph in graphs:
+        bucket = buckets.setdefault(fingerprint(graph), list())
+        for group in bucket:
+            if next(isomorphisms(group[0], graph), None) is not None:
+                group.append(graph)
+                break
+        else:
+            bucket.append([graph])
+            classes.append(bucket[-1])
+
+    return classes
@@ -0,0 +1,358 @@
+"""
+This module runs graph algorithms over many processes on a frozen graph (CSRGraph).
+
+The CSR arrays of the graph, and the vectors the algorithms work on, are copied once into shared memory blocks
+(multiprocessing.shared_memory), and the worker processes map the same blocks instead of receiving a pickled copy of
+the graph. Only block names and index ranges travel between the processes.
+
+- The Breadth-First Search is level-synchronous: the frontier of each level is split among the workers, each one
+  finds the unvisited neighbors of its part, and the main process merges them into the next frontier.
+- Many Breadth-First Searches, one from each of many sources, are split among the workers in batches, each worker
+  writing the distances of its sources to a shared matrix.
+- PageRank and the eigenvector centrality are power iterations, a sparse matrix-vector product per iteration. The
+  product is split by rows: each worker computes the values of a range of vertices, summing over their predecessors.
+
+A graph with one worker runs the same kernels in the current process, without a process pool.
+"""
+
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.main.graph.graph_csr import gather
+
+
+# Below this size a frontier is expanded by the main process, as splitting it costs more than it saves.
+MIN_PARALLEL_FRONTIER = 10000
+
+
+def _share(array):
+    # Copies an array into a new shared memory block, returning the block and the description workers attach with.
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    shared = np.ndarray(array.shape, array.dtype, buffer=block.buf)
+    shared[...] = array
+
+    return block, shared, (block.name, array.shape, array.dtype.str)
+
+
+# The blocks attached by a worker process, by name.
+_attached = dict()
+
+
+def _attach(spec):
+    name, shape, dtype = spec
+
+    if name not in _attached:
+        # The workers share the resource tracker of the main process, which owns the block and unlinks it.
+        _attached[name] = shared_memory.SharedMemory(name=name)
+
+    return np.ndarray(shape, dtype, buffer=_attached[name].buf)
+
+
+def _expand(indptr, indices, distances, frontier, lo, hi):
+    # The unvisited neighbors of frontier[lo:hi].
+    neighbors = indices[gather(indptr, frontier[lo:hi])]
+
+    return np.unique(neighbors[distances[neighbors] < 0])
+
+
+def _bfs_distances(indptr, indices, source, distances):
+    distances[:] = -1
+    distances[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+
+    while frontier.size:
+        level += 1
+        frontier = _expand(indptr, indices, distances, frontier, 0, frontier.size)
+        distances[frontier] = level
+
+
+def _spmv(indptr, indices, x, y, lo, hi):
+    # y[v] = sum of x[u] for the predecessors u of each vertex v in range(lo, hi), indptr and indices being the
+    # reverse graph.
+    start, end = indptr[lo], indptr[hi]
+    # The padding zero lets the rows without predecessors at the end of the range start inside the values.
+    values = np.append(x[indices[start:end]], 0.0)
+    y[lo:hi] = np.add.reduceat(values, indptr[lo:hi] - start)
+    # reduceat takes the next value for the rows without predecessors, instead of 0.
+    y[lo:hi][indptr[lo:hi] == indptr[lo + 1:hi + 1]] = 0.0
+
+
+def _worker_expand(specs, lo, hi):
+    indptr, indices, distances, frontier = map(_attach, specs)
+    return _expand(indptr, indices, distances, frontier, lo, hi)
+
+
+def _worker_bfs(specs, sources, first):
+    indptr, indices, result = map(_attach, specs)
+    for i, source in enumerate(sources):
+        _bfs_distances(indptr, indices, source, result[first + i])
+
+    # The result matrix is created for a single call, so it's released right away.
+    del result
+    _attached.pop(specs[2][0]).close()
+
+
+def _worker_spmv(specs, lo, hi):
+    indptr, indices, x, y = map(_attach, specs)
+    _spmv(indptr, indices, x, y, lo, hi)
+
+
+class ParallelGraph:
+    """
+    This class shares a CSRGraph with a pool of worker processes and runs the parallel algorithms on it. It should be
+    closed, or used in a with statement, to stop the workers and free the shared memory.
+    """
+
+    def __init__(self, csr, workers=None):
+        """
+        Copies the graph to shared memory and starts the workers.
+
+        :param csr: The CSRGraph.
+        :param workers: The number of processes, by default the number of CPUs.
+        """
+
+        self.csr = csr
+        self.workers = workers or os.cpu_count() or 1
+        self._blocks = list()
+
+        n = len(csr)
+        reverse = csr.reverse
+        self.indptr, self._indptr = self._share(csr.indptr)
+        self.indices, self._indices = self._share(csr.indices)
+        if reverse is csr:
+            self.rindptr, self._rindptr, self.rindices, self._rindices = self.indptr, self._indptr, self.indices, \
+                self._indices
+        else:
+            self.rindptr, self._rindptr = self._share(reverse.indptr)
+            self.rindices, self._rindices = self._share(reverse.indices)
+        self.distances, self._distances = self._share(np.full(n, -1, dtype=np.int64))
+        self.frontier, self._frontier = self._share(np.zeros(n, dtype=np.int64))
+        self.x, self._x = self._share(np.zeros(n))
+        self.y, self._y = self._share(np.zeros(n))
+
+        self._executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+
+    def _share(self, array):
+        block, shared, spec = _share(array)
+        self._blocks.append(block)
+        return shared, spec
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _ranges(self, n, minimum=1):
+        # Splits range(n) in up to one part per worker.
+        parts = max(1, min(self.workers, n // minimum))
+        bounds = np.linspace(0, n, parts + 1).astype(np.int64).tolist()
+        return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+    def bfs(self, source):
+        """
+        Computes the number of edges between a source vertex and every vertex with a level-synchronous Breadth-First
+        Search, each level expanded by all the workers.
+
+        :param source: The source vertex id.
+        :return: An array with the distance of each vertex id, -1 for the vertices that can't be reached.
+        """
+
+        if source not in self.csr:
+            raise Exception('Start vertex cannot be found in the graph.')
+
+        distances, frontier = self.distances, self.frontier
+        specs = (self._indptr, self._indices, self._distances, self._frontier)
+        distances[:] = -1
+        distances[source] = 0
+        frontier[0] = source
+        size, level = 1, 0
+
+        while size:
+            level += 1
+            if self._executor is None or size < MIN_PARALLEL_FRONTIER:
+                parts = [_expand(self.indptr, self.indices, distances, frontier, 0, size)]
+            else:
+                futures = [self._executor.submit(_worker_expand, specs, lo, hi) for lo, hi in self._ranges(size)]
+                parts = [future.result() for future in futures]
+            reached = np.unique(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+            distances[reached] = level
+            size = reached.size
+            frontier[:size] = reached
+
+        return distances.copy()
+
+    def multi_source_bfs(self, sources):
+        """
+        Runs a Breadth-First Search from each of many sources, the sources split among the workers.
+
+        :param sources: The source vertex ids.
+        :return: A matrix with a row for each source, with the distance to each vertex id, -1 for the vertices that
+                 can't be reached.
+        """
+
+        sources = [int(source) for source in sources]
+        for source in sources:
+            if source not in self.csr:
+                raise Exception('Start vertex cannot be found in the graph.')
+
+        n = len(self.csr)
+        block, result, spec = _share(np.zeros((len(sources), n), dtype=np.int64))
+
+        try:
+            if self._executor is None:
+                for i, source in enumerate(sources):
+                    _bfs_distances(self.indptr, self.indices, source, result[i])
+            else:
+                specs = (self._indptr, self._indices, spec)
+                futures = [self._executor.submit(_worker_bfs, specs, sources[lo:hi], lo)
+                           for lo, hi in self._ranges(len(sources))]
+                for future in futures:
+                    future.result()
+            return result.copy()
+        finally:
+            del result
+            block.close()
+            block.unlink()
+
+    def _product(self, x):
+        # y = Aᵀx, y[v] being the sum of x over the predecessors of v.
+        self.x[:] = x
+        n = len(self.csr)
+
+        if self._executor is None:
+            _spmv(self.rindptr, self.rindices, self.x, self.y, 0, n)
+        else:
+            specs = (self._rindptr, self._rindices, self._x, self._y)
+            futures = [self._executor.submit(_worker_spmv, specs, lo, hi) for lo, hi in self._ranges(n)]
+            for future in futures:
+                future.result()
+
+        return self.y.copy()
+
+    def degree_centrality(self):
+        """
+        Computes the degree centrality of each vertex, its number of neighbors (predecessors in directed graphs)
+        divided by n - 1.
+
+        :return: An array with the centrality of each vertex id.
+        """
+
+        n = len(self.csr)
+
+        return self._product(np.ones(n)) / max(1, n - 1)
+
+    def pagerank(self, damping=0.85, tolerance=1e-10, max_iterations=100):
+        """
+        Computes the PageRank of each vertex with the power iteration. The rank of the vertices without neighbors is
+        spread over all the vertices.
+
+        :param damping: The probability of following an edge instead of jumping to a random vertex.
+        :param tolerance: The iteration stops when the ranks change less than this, summed over all the vertices.
+        :param max_iterations: The greatest number of iterations.
+        :return: An array with the rank of each vertex id, summing 1.
+        """
+
+        n = len(self.csr)
+        if not n:
+            return np.zeros(0)
+
+        out_degrees = self.csr.out_degrees.astype(np.float64)
+        dangling = out_degrees == 0
+        out_degrees[dangling] = 1.0
+        rank = np.full(n, 1.0 / n)
+
+        for _ in range(max_iterations):
+            spread = damping * rank[dangling].sum() / n + (1.0 - damping) / n
+            new_rank = damping * self._product(rank / out_degrees) + spread
+            change = np.abs(new_rank - rank).sum()
+            rank = new_rank
+            if change < tolerance:
+                break
+
+        return rank
+
+    def eigenvector_centrality(self, tolerance=1e-10, max_iterations=100):
+        """
+        Computes the eigenvector centrality of each vertex with the power iteration: the centrality of a vertex is
+        proportional to the sum of the centralities of its neighbors (predecessors in directed graphs).
+
+        :param tolerance: The iteration stops when the centralities change less than this, summed over all the vertices.
+        :param max_iterations: The greatest number of iterations.
+        :return: An array with the centrality of each vertex id, with euclidean norm 1.
+        """
+
+        n = len(self.csr)
+        if not n:
+            return np.zeros(0)
+
+        centrality = np.full(n, 1.0 / np.sqrt(n))
+
+        for _ in range(max_iterations):
+            # Adding the vector itself (the product by A + I) keeps the iteration from oscillating in bipartite graphs.
+            new_centrality = self._product(centrality) + centrality
+            norm = np.linalg.norm(new_centrality)
+            if norm == 0:
+                return new_centrality
+            new_centrality /= norm
+            change = np.abs(new_centrality - centrality).sum()
+            centrality = new_centrality
+            if change < tolerance:
+                break
+
+        return centrality
+
+
+def bfs(csr, source, workers=None):
+    """
+    Runs a parallel level-synchronous Breadth-First Search, see ParallelGraph.bfs.
+    """
+
+    with ParallelGraph(csr, workers) as graph:
+        return graph.bfs(source)
+
+
+def multi_source_bfs(csr, sources, workers=None):
+    """
+    Runs a Breadth-First Search from each of many sources in parallel, see ParallelGraph.multi_source_bfs.
+    """
+
+    with ParallelGraph(csr, workers) as graph:
+        return graph.multi_source_bfs(sources)
+
+
+def pagerank(csr, damping=0.85, tolerance=1e-10, max_iterations=100, workers=None):
+    """
+    Computes the PageRank of each vertex in parallel, see ParallelGraph.pagerank.
+    """
+
+    with ParallelGraph(csr, workers) as graph:
+        return graph.pagerank(damping, tolerance, max_iterations)
+
+
+def degree_centrality(csr, workers=None):
+    """
+    Computes the degree centrality of each vertex in parallel, see ParallelGraph.degree_centrality.
+    """
+
+    with ParallelGraph(csr, workers) as graph:
+        return graph.degree_centrality()
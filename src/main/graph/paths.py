@@ -0,0 +1,212 @@
+"""
+This module enumerates paths between two vertices.
+
+The simple paths (paths that don't repeat vertices) can be enumerated in breadth-first or depth-first order, with limits
+on their length and on their number. The breadth-first enumeration keeps each partial path as a node pointing to its
+parent, so paths that share a prefix share its memory, and the depth-first enumeration keeps only the current path.
+
+Yen's algorithm finds the k shortest simple paths in order of weight, running Dijkstra's algorithm from every vertex of
+the last path found with the edges of the paths already found removed.
+"""
+
+import heapq
+import itertools
+
+from collections import deque
+
+from src.main.graph import shortest_path
+
+
+def _unwind(node):
+    path = list()
+
+    while node is not None:
+        path.append(node[0])
+        node = node[1]
+    path.reverse()
+
+    return path
+
+
+def _on_path(node, vertex):
+    while node is not None:
+        if node[0] == vertex:
+            return True
+        node = node[1]
+
+    return False
+
+
+def bfs_paths(graph, start, target, max_depth=None, max_paths=None):
+    """
+    Returns a generator for the simple paths between a vertex S and a vertex T, the shortest ones (in number of edges)
+    first. Uses the Breadth-First Search method.
+
+    The search keeps every partial path up to the length of the paths found, so its memory grows with the number of
+    paths of that length, whatever max_paths is: max_paths bounds the output, not the memory. Use dfs_paths, whose
+    memory is the length of a path, or k_shortest_paths to find a few routes in large graphs.
+
+    :param graph: The graph.
+    :param start: The initial vertex.
+    :param target: The target vertex to be find.
+    :param max_depth: The maximum number of edges of a path, if not informed the paths can have any length.
+    :param max_paths: The maximum number of paths generated, if not informed all the paths are generated. It limits
+                      the output, not the memory.
+    :return: A generator of lists of vertices.
+    """
+
+    if max_paths is not None and max_paths <= 0:
+        return
+
+    # Each node is a (vertex, parent node, depth) tuple, and the path is the chain of vertices up to the root.
+    queue = deque([(start, None, 0)])
+    found = 0
+
+    while queue:
+        node = queue.popleft()
+        current, _, depth = node
+
+        if current == target:
+            yield _unwind(node)
+            found += 1
+            if found == max_paths:
+                return
+            continue
+
+        if max_depth is not None and depth >= max_depth:
+            continue
+
+        for vertex in graph.neighbors(current):
+            if not _on_path(node, vertex):
+                queue.append((vertex, node, depth + 1))
+
+
+def dfs_paths(graph, start, target, max_depth=None, max_paths=None, path=None):
+    """
+    Returns a generator for the simple paths between a vertex S and a vertex T. Uses the Depth-First Search method with
+    backtracking, keeping in memory only the path being extended.
+
+    :param graph: The graph.
+    :param start: The initial vertex.
+    :param target: The target vertex to be find.
+    :param max_depth: The maximum number of edges of a path, if not informed the paths can have any length.
+    :param max_paths: The maximum number of paths generated, if not informed all the paths are generated.
+    :param path: The vertices already in the path, ending at the start vertex. If not informed, the path starts at the
+                 start vertex.
+    :return: A generator of lists of vertices.
+    """
+
+    if max_paths is not None and max_paths <= 0:
+        return
+
+    path = list(path) if path else [start]
+    on_path = set(path)
+    base = len(path)
+    stack = [iter(graph.neighbors(start))]
+    found = 0
+
+    if start == target:
+        yield list(path)
+        return
+
+    while stack:
+        for vertex in stack[-1]:
+            if vertex in on_path:
+                continue
+            # The number of edges of the path once it reaches the vertex.
+            depth = len(path) - base + 1
+            if max_depth is not None and depth > max_depth:
+                continue
+            if vertex == target:
+                yield path + [vertex]
+                found += 1
+                if found == max_paths:
+                    return
+            elif max_depth is None or depth < max_depth:
+                path.append(vertex)
+                on_path.add(vertex)
+                stack.append(iter(graph.neighbors(vertex)))
+                break
+        else:
+            stack.pop()
+            if len(path) > base:
+                on_path.discard(path.pop())
+
+
+class _Restricted:
+    """
+    A view of a graph without some of its vertices and edges.
+    """
+
+    def __init__(self, graph, vertices, edges):
+        self.graph = graph
+        self.vertices = vertices
+        self.edges = edges
+
+    def __contains__(self, vertex):
+        return vertex in self.graph and vertex not in self.vertices
+
+    def weighted_neighbors(self, vertex):
+        for neighbor, cost in self.graph.weighted_neighbors(vertex):
+            if neighbor not in self.vertices and (vertex, neighbor) not in self.edges:
+                yield neighbor, cost
+
+
+def shortest_simple_paths(graph, source, target):
+    """
+    Returns a generator for the simple paths between two vertices in order of weight, using Yen's algorithm.
+
+    :param graph: The graph.
+    :param source: The initial vertex.
+    :param target: The target vertex.
+    :return: A generator of ShortestPath tuples.
+    """
+
+    distances, previous = shortest_path.dijkstra(graph, source, [target])
+
+    if target not in distances:
+        return
+
+    found = [shortest_path.ShortestPath(shortest_path.path_to(previous, source, target), distances[target])]
+    seen = {tuple(found[0].path)}
+    candidates = list()
+    counter = itertools.count()
+
+    while True:
+        last = found[-1]
+        yield last
+
+        costs = [0.0]
+        for u, v in zip(last.path, last.path[1:]):
+            costs.append(costs[-1] + dict(graph.weighted_neighbors(u))[v])
+
+        for i, spur in enumerate(last.path[:-1]):
+            root = last.path[:i + 1]
+            edges = {(p.path[i], p.path[i + 1]) for p in found if len(p.path) > i + 1 and p.path[:i + 1] == root}
+            distances, previous = shortest_path.dijkstra(_Restricted(graph, set(root[:-1]), edges), spur, [target])
+            if target in distances:
+                path = root[:-1] + shortest_path.path_to(previous, spur, target)
+                if tuple(path) not in seen:
+                    seen.add(tuple(path))
+                    weight = costs[i] + distances[target]
+                    heapq.heappush(candidates, (weight, len(path), next(counter), path))
+
+        if not candidates:
+            return
+
+        weight, _, _, path = heapq.heappop(candidates)
+        found.append(shortest_path.ShortestPath(path, weight))
+
+
+def k_shortest_paths(graph, source, target, k):
+    """
+    Finds the k shortest simple paths between two vertices with Yen's algorithm.
+
+    :param graph: The graph.
+    :param source: The initial vertex.
+    :param target: The target vertex.
+    :param k: The number of paths.
+    :return: A list of up to k ShortestPath tuples in order of weight.
+    """
+
+    return list(itertools.islice(shortest_simple_paths(graph, source, target), k))
@@ -0,0 +1,232 @@
+"""
+This module finds shortest paths between a single pair of vertices without settling the whole graph.
+
+The bidirectional Dijkstra's algorithm searches forward from the source and backward from the target, following the
+edges in reverse, and stops when the two searches meet: each one settles the vertices up to about half the distance,
+a much smaller region than a single search that reaches the target.
+
+The A* algorithm guides the search toward the target with a heuristic, a lower bound of the distance from each vertex
+to the target, settling first the vertices that seem to lie on the shortest path. The ALT heuristic (A*, landmarks and
+the triangle inequality) bounds the distances with the precomputed distances to and from a few landmark vertices:
+
+    d(v, t) >= d(L, t) - d(L, v)    and    d(v, t) >= d(v, L) - d(t, L)
+
+The functions work on any graph that provides weighted_neighbors and weighted_predecessors, such as the adjacency list
+Graph, its interned view and the CSRGraph.
+"""
+
+import heapq
+import itertools
+import math
+
+from src.main.graph import shortest_path
+
+
+class _Reverse:
+    """
+    A view of a graph with the direction of every edge reversed.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __contains__(self, vertex):
+        return vertex in self.graph
+
+    def weighted_neighbors(self, vertex):
+        return self.graph.weighted_predecessors(vertex)
+
+
+def _check(graph, source, target):
+    if source not in graph:
+        raise Exception('Start vertex cannot be found in the graph.')
+    if target not in graph:
+        raise Exception('The target vertex does not exist in the graph.')
+
+
+def bidirectional_dijkstra(graph, source, target):
+    """
+    Finds the shortest path between two vertices with two Dijkstra's searches, forward from the source and backward
+    from the target.
+
+    :param graph: The graph to be searched.
+    :param source: The initial vertex.
+    :param target: The vertex to be reached from the initial vertex.
+    :return: A ShortestPath tuple with the list of vertices in the path and its total weight.
+    """
+
+    _check(graph, source, target)
+
+    if source == target:
+        return shortest_path.ShortestPath([source], 0.0)
+
+    # Index 0 is the forward search and index 1 the backward one.
+    expand = (graph.weighted_neighbors, graph.weighted_predecessors)
+    distances = ({source: 0.0}, {target: 0.0})
+    parents = (dict(), dict())
+    settled = (set(), set())
+    counter = itertools.count()
+    heaps = ([(0.0, next(counter), source)], [(0.0, next(counter), target)])
+    best, meeting = math.inf, None
+
+    while heaps[0] and heaps[1]:
+        # No path through a vertex not settled yet can be shorter than the best one found.
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        distance, _, current = heapq.heappop(heaps[side])
+
+        if current in settled[side]:
+            continue  # stale heap entry
+        settled[side].add(current)
+
+        mine, other = distances[side], distances[1 - side]
+
+        for neighbor, cost in expand[side](current):
+            new_distance = distance + cost
+            if new_distance < mine.get(neighbor, math.inf):
+                mine[neighbor] = new_distance
+                parents[side][neighbor] = current
+                heapq.heappush(heaps[side], (new_distance, next(counter), neighbor))
+            if neighbor in other and mine[neighbor] + other[neighbor] < best:
+                best, meeting = mine[neighbor] + other[neighbor], neighbor
+
+    if meeting is None:
+        raise Exception('The target vertex is unreachable')
+
+    path = shortest_path.path_to(parents[0], source, meeting)
+    while path[-1] != target:
+        path.append(parents[1][path[-1]])
+
+    return shortest_path.ShortestPath(path, best)
+
+
+def astar(graph, source, target, heuristic=None):
+    """
+    Finds the shortest path between two vertices with the A* algorithm. Vertices are settled in the order of their
+    distance from the source plus the heuristic's estimate of their distance to the target.
+
+    :param graph: The graph to be searched.
+    :param source: The initial vertex.
+    :param target: The vertex to be reached from the initial vertex.
+    :param heuristic: A function that receives a vertex and returns a lower bound of its distance to the target, such
+                      as Landmarks.heuristic(target). If it overestimates a distance the path may not be the shortest.
+                      If not informed the search is Dijkstra's.
+    :return: A ShortestPath tuple with the list of vertices in the path and its total weight.
+    """
+
+    _check(graph, source, target)
+
+    if heuristic is None:
+        def heuristic(vertex):
+            return 0.0
+
+    distances, parents = {source: 0.0}, dict()
+    counter = itertools.count()
+    heap = [(heuristic(source), next(counter), 0.0, source)]
+
+    while heap:
+        _, _, distance, current = heapq.heappop(heap)
+
+        if distance > distances[current]:
+            continue  # stale heap entry
+
+        if current == target:
+            return shortest_path.ShortestPath(shortest_path.path_to(parents, source, target), distance)
+
+        for neighbor, cost in graph.weighted_neighbors(current):
+            new_distance = distance + cost
+            if new_distance < distances.get(neighbor, math.inf):
+                estimate = heuristic(neighbor)
+                if estimate == math.inf:
+                    continue  # the target can't be reached from the neighbor
+                distances[neighbor] = new_distance
+                parents[neighbor] = current
+                heapq.heappush(heap, (new_distance + estimate, next(counter), new_distance, neighbor))
+
+    raise Exception('The target vertex is unreachable')
+
+
+class Landmarks:
+    """
+    This class keeps the distances from and to a few landmark vertices, the table of the ALT heuristic. The landmarks
+    are chosen far apart, each one the vertex farthest from the ones already chosen, as the bounds are tighter for the
+    vertices that lie behind the target as seen from a landmark.
+
+    The table is computed for the graph as it is: after the graph changes the bounds may overestimate the distances,
+    and the table must be computed again.
+    """
+
+    def __init__(self, graph, count=8, landmarks=None):
+        """
+        Chooses the landmarks and computes their distances with Dijkstra's algorithm, 2 searches per landmark.
+
+        :param graph: The graph.
+        :param count: The number of landmarks.
+        :param landmarks: The landmarks to use, if not informed they are chosen among the graph's vertices.
+        """
+
+        self.graph = graph
+        self.version = getattr(graph, 'version', None)
+        self.landmarks = list()
+        self.forward = list()
+        self.backward = list()
+
+        if landmarks is not None:
+            for landmark in landmarks:
+                self._add(landmark)
+            return
+
+        # The distance from the chosen landmarks to each vertex, infinity until one of them reaches it.
+        closest = dict.fromkeys(graph, math.inf)
+
+        while closest and len(self.landmarks) < count:
+            landmark = max(closest, key=closest.get) if self.landmarks else next(iter(closest))
+            self._add(landmark)
+            del closest[landmark]
+            for vertex, distance in self.forward[-1].items():
+                if vertex in closest:
+                    closest[vertex] = min(closest[vertex], distance)
+
+    def _add(self, landmark):
+        if landmark not in self.graph:
+            raise Exception('The landmark {} cannot be found in the graph.'.format(landmark))
+        self.landmarks.append(landmark)
+        self.forward.append(shortest_path.dijkstra(self.graph, landmark)[0])
+        self.backward.append(shortest_path.dijkstra(_Reverse(self.graph), landmark)[0])
+
+    def bound(self, vertex, target):
+        """
+        A lower bound of the distance between two vertices, by the triangle inequality.
+
+        :param vertex: The first vertex.
+        :param target: The second vertex.
+        :return: The bound, infinity if the target certainly can't be reached from the vertex.
+        """
+
+        bound = 0.0
+
+        for forward, backward in zip(self.forward, self.backward):
+            from_vertex, from_target = forward.get(vertex), forward.get(target)
+            if from_vertex is not None:
+                if from_target is None:
+                    return math.inf  # the landmark reaches the vertex but not the target
+                bound = max(bound, from_target - from_vertex)
+            to_vertex, to_target = backward.get(vertex), backward.get(target)
+            if to_target is not None:
+                if to_vertex is None:
+                    return math.inf  # the target reaches the landmark but the vertex doesn't
+                bound = max(bound, to_vertex - to_target)
+
+        return bound
+
+    def heuristic(self, target):
+        """
+        The ALT heuristic for a target, to be used by astar.
+
+        :param target: The target vertex.
+        :return: A function that receives a vertex and returns a lower bound of its distance to the target.
+        """
+
+        return lambda vertex: self.bound(vertex, target)
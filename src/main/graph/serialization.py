@@ -0,0 +1,291 @@
+"""
+This module saves and loads graphs.
+
+The binary format stores the CSR arrays of the graph, so loading it doesn't insert any edge: the arrays are
+memory-mapped straight from the file, and every process that loads the same file shares a single read-only copy of
+them.
+
+    header   magic b'GRPH', version, flags (1: directed, 2: 32 bits indices), vertices, edges and labels' size
+    indptr   int64[vertices + 1]
+    indices  int32 or int64[edges], padded to a multiple of 8 bytes
+    weights  float64[edges]
+    labels   the graph's name and the vertex names as a UTF-8 JSON object {"name": ..., "labels": [...]}
+
+The vertex names can be strings, numbers, booleans, tuples and frozensets of them. A tuple is stored as
+{"tuple": [...]} and a frozenset as {"frozenset": [...]}, so they're hashable again when loaded. Version 1 files, whose
+labels are a plain JSON array and have no name, can still be loaded.
+
+The text formats are read and written one line at a time, so files of any size can be streamed. In the edge list format
+each line holds an edge, "u v" or "u v weight", and in the adjacency list format each line holds a vertex followed by
+its neighbors, "u v1 v2 ...". Lines starting with # are ignored. The vertex names can't contain whitespace.
+"""
+
+import json
+import math
+import mmap
+import struct
+
+import numpy as np
+
+from src.main.graph import adjacency
+from src.main.graph.graph_adjl import Graph
+from src.main.graph.graph_csr import CSRGraph
+
+
+MAGIC = b'GRPH'
+VERSION = 2
+HEADER = struct.Struct('<4sHHqqq')
+
+DIRECTED = 1
+INDICES_32 = 2
+
+
+def _encode(label):
+    if label is None or isinstance(label, (str, int, float)):
+        return label
+    if isinstance(label, tuple):
+        return {'tuple': [_encode(item) for item in label]}
+    if isinstance(label, frozenset):
+        return {'frozenset': [_encode(item) for item in label]}
+
+    raise Exception('The vertex name {!r} can not be saved: it must be a string, a number, a boolean, a tuple or a '
+                    'frozenset.'.format(label))
+
+
+def _decode(value):
+    if isinstance(value, dict):
+        if 'tuple' in value:
+            return tuple(_decode(item) for item in value['tuple'])
+        return frozenset(_decode(item) for item in value['frozenset'])
+
+    return value
+
+
+def encode_labels(labels):
+    """
+    Converts vertex names to values that can be written as JSON, raising an exception for names that can't.
+
+    :param labels: The vertex names.
+    :return: A list of JSON values.
+    """
+
+    return [_encode(label) for label in labels]
+
+
+def decode_labels(values):
+    """
+    Converts the JSON values made by encode_labels back to the vertex names.
+
+    :param values: A list of JSON values.
+    :return: The list of vertex names.
+    """
+
+    return [_decode(value) for value in values]
+
+
+def save(graph, path):
+    """
+    Saves a graph in the binary format. Parallel edges are merged into their cheapest edge.
+
+    :param graph: An adjacency list Graph or a CSRGraph.
+    :param path: The path of the file.
+    """
+
+    if not isinstance(graph, CSRGraph):
+        graph = graph.freeze()
+
+    labels = json.dumps({'name': graph.name, 'labels': encode_labels(graph.labels)}).encode('utf-8')
+    flags = (DIRECTED if graph.is_directed else 0) | (INDICES_32 if graph.indices.dtype == np.int32 else 0)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, len(graph), len(graph.indices), len(labels)))
+        f.write(graph.indptr.astype('<i8').tobytes())
+        indices = graph.indices.astype('<i4' if flags & INDICES_32 else '<i8').tobytes()
+        f.write(indices + b'\0' * (-len(indices) % 8))
+        f.write(graph.weights.astype('<f8').tobytes())
+        f.write(labels)
+
+
+def load(path, mmap_mode=True):
+    """
+    Loads a graph saved in the binary format.
+
+    :param path: The path of the file.
+    :param mmap_mode: If True the arrays are read-only views of the memory-mapped file, otherwise they're read into
+                      memory.
+    :return: A CSRGraph.
+    """
+
+    with open(path, 'rb') as f:
+        if mmap_mode:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+
+    magic, version, flags, n, nnz, labels_size = HEADER.unpack_from(buffer, 0)
+
+    if magic != MAGIC:
+        raise Exception('The file is not a graph.')
+    if version not in (1, VERSION):
+        raise Exception('Unsupported graph file version: {}'.format(version))
+
+    offset = HEADER.size
+    indptr = np.frombuffer(buffer, '<i8', n + 1, offset)
+    offset += indptr.nbytes
+    indices = np.frombuffer(buffer, '<i4' if flags & INDICES_32 else '<i8', nnz, offset)
+    offset += indices.nbytes + (-indices.nbytes % 8)
+    weights = np.frombuffer(buffer, '<f8', nnz, offset)
+    offset += weights.nbytes
+    labels = json.loads(bytes(buffer[offset:offset + labels_size]).decode('utf-8'))
+    name = 'Graph'
+
+    if version > 1:
+        name, labels = labels['name'], decode_labels(labels['labels'])
+
+    return CSRGraph(indptr, indices, weights, labels, bool(flags & DIRECTED), name)
+
+
+def _open(file, mode):
+    if isinstance(file, str):
+        return open(file, mode, encoding='utf-8')
+    return file
+
+
+def _lines(file):
+    f = _open(file, 'r')
+
+    try:
+        for line in f:
+            fields = line.split()
+            if fields and not fields[0].startswith('#'):
+                yield fields
+    finally:
+        if f is not file:
+            f.close()
+
+
+def read_edgelist(file):
+    """
+    Reads the edges of an edge list file, one at a time.
+
+    :param file: A path or a text file object.
+    :return: A generator of (u, v, weight) tuples, the weight being infinity when the line doesn't have one.
+    """
+
+    for fields in _lines(file):
+        yield fields[0], fields[1], float(fields[2]) if len(fields) > 2 else math.inf
+
+
+def _edges(graph):
+    # Yields each edge once, including every parallel edge.
+    done = set()
+
+    label_of = graph.interned.label_of
+
+    for u in graph:
+        for v, entry in graph[u].get_neighbors().items():
+            v = label_of(v)
+            if v in done:
+                continue
+            weights = adjacency.weights(entry)
+            if u == v and not graph.is_directed:
+                weights = weights[::2]  # a loop is stored twice
+            for weight in weights:
+                yield u, v, weight
+        if not graph.is_directed:
+            done.add(u)
+
+
+def write_edgelist(graph, file):
+    """
+    Writes the edges of an adjacency list Graph in the edge list format, one per line.
+
+    :param graph: The graph.
+    :param file: A path or a text file object.
+    """
+
+    f = _open(file, 'w')
+
+    try:
+        for u, v, weight in _edges(graph):
+            f.write('{} {}\n'.format(u, v) if weight == math.inf else '{} {} {!r}\n'.format(u, v, weight))
+    finally:
+        if f is not file:
+            f.close()
+
+
+def load_edgelist(file, is_directed=False, name='Graph'):
+    """
+    Builds an adjacency list Graph from an edge list file.
+
+    :param file: A path or a text file object.
+    :param is_directed: True if the edges are directed.
+    :param name: The graph's name.
+    :return: A new Graph.
+    """
+
+    graph = Graph(name, is_directed)
+    graph.add_edges_from(read_edgelist(file))
+
+    return graph
+
+
+def read_adjlist(file):
+    """
+    Reads the lines of an adjacency list file, one at a time.
+
+    :param file: A path or a text file object.
+    :return: A generator of (vertex, neighbors) tuples.
+    """
+
+    for fields in _lines(file):
+        yield fields[0], fields[1:]
+
+
+def write_adjlist(graph, file):
+    """
+    Writes an adjacency list Graph in the adjacency list format, one vertex per line. A neighbor is repeated once for
+    each parallel edge, and the weights are not written.
+
+    :param graph: The graph.
+    :param file: A path or a text file object.
+    """
+
+    f = _open(file, 'w')
+
+    try:
+        label_of = graph.interned.label_of
+        for u in graph:
+            neighbors = list()
+            for v, entry in graph[u].get_neighbors().items():
+                v = label_of(v)
+                count = adjacency.count(entry)
+                if u == v and not graph.is_directed:
+                    count //= 2
+                neighbors.extend([str(v)] * count)
+            f.write(' '.join([str(u)] + neighbors) + '\n')
+    finally:
+        if f is not file:
+            f.close()
+
+
+def load_adjlist(file, is_directed=False, name='Graph'):
+    """
+    Builds an adjacency list Graph from an adjacency list file. In undirected graphs every edge is listed by both of
+    its ends, and it's added only once.
+
+    :param file: A path or a text file object.
+    :param is_directed: True if the edges are directed.
+    :param name: The graph's name.
+    :return: A new Graph.
+    """
+
+    graph = Graph(name, is_directed)
+    done = set()
+
+    for u, neighbors in read_adjlist(file):
+        graph.add_vertex(u)
+        graph.add_edges_from((u, v) for v in neighbors if is_directed or v not in done)
+        done.add(u)
+
+    return graph
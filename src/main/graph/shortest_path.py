@@ -0,0 +1,369 @@
+"""
+This module implements single-source shortest path algorithms based on Dijkstra's algorithm.
+
+The implementation is iterative and keeps the frontier in a binary heap (heapq), so a search costs
+O((V + E) log V) instead of the O(V²) of a linear scan for the closest unvisited vertex.
+
+The functions work on any graph that supports membership tests (vertex in graph) and provides a
+weighted_neighbors(vertex) method yielding (neighbor, cost) pairs, such as the adjacency list Graph.
+
+The DynamicShortestPaths class keeps the shortest path trees of some sources up to date while the graph changes,
+repairing only the part of each tree affected by a change, in the style of Ramalingam and Reps.
+"""
+
+import heapq
+import itertools
+import math
+
+from collections import defaultdict, namedtuple
+
+
+ShortestPath = namedtuple('ShortestPath', ['path', 'weight'])
+
+
+def dijkstra(graph, source, targets=None):
+    """
+    Dijkstra Algorithm implementation.
+    Computes the distance from the source vertex to every vertex reachable from it. If a collection of targets
+    is informed, the search stops as soon as all of them have been settled.
+
+    :param graph: The graph to be searched.
+    :param source: The initial vertex.
+    :param targets: An optional collection of vertices to be reached from the source.
+    :return: A tuple (distances, previous) where distances maps each settled vertex to its distance from the source
+             and previous maps each settled vertex, except the source, to its predecessor in the shortest path.
+    """
+
+    if source not in graph:
+        raise Exception('Start vertex cannot be found in the graph.')
+
+    remaining = None
+
+    if targets is not None:
+        remaining = set(targets)
+        for target in remaining:
+            if target not in graph:
+                raise Exception('The target vertex does not exist in the graph.')
+
+    distances, previous = dict(), dict()
+    tentative, parents = {source: 0.0}, dict()
+
+    # The counter breaks ties between equal distances, so vertices themselves are never compared.
+    counter = itertools.count()
+    heap = [(0.0, next(counter), source)]
+
+    while heap:
+        distance, _, current = heapq.heappop(heap)
+
+        if current in distances:
+            continue  # stale heap entry
+
+        distances[current] = distance
+        if current in parents:
+            previous[current] = parents[current]
+
+        if remaining is not None:
+            remaining.discard(current)
+            if not remaining:
+                break
+
+        for neighbor, cost in graph.weighted_neighbors(current):
+            if neighbor in distances:
+                continue
+            new_distance = distance + cost
+            if new_distance < tentative.get(neighbor, math.inf):
+                tentative[neighbor] = new_distance
+                parents[neighbor] = current
+                heapq.heappush(heap, (new_distance, next(counter), neighbor))
+
+    return distances, previous
+
+
+def path_to(previous, source, target):
+    """
+    Rebuilds the path from the source to the target using the predecessor map produced by dijkstra.
+
+    :param previous: The predecessor map.
+    :param source: The initial vertex.
+    :param target: The final vertex.
+    :return: The list of vertices from the source to the target.
+    """
+
+    path = [target]
+
+    while path[-1] != source:
+        path.append(previous[path[-1]])
+    path.reverse()
+
+    return path
+
+
+def shortest_path(graph, source, target):
+    """
+    Finds the shortest path between two vertices.
+
+    :param graph: The graph to be searched.
+    :param source: The initial vertex.
+    :param target: The vertex to be reached from the initial vertex.
+    :return: A ShortestPath tuple with the list of vertices in the path and its total weight.
+    """
+
+    distances, previous = dijkstra(graph, source, [target])
+
+    if target not in distances:
+        raise Exception('The target vertex is unreachable')
+
+    return ShortestPath(path_to(previous, source, target), distances[target])
+
+
+def shortest_paths(graph, source, targets=None):
+    """
+    Finds the shortest paths from one source to many targets with a single search.
+
+    :param graph: The graph to be searched.
+    :param source: The initial vertex.
+    :param targets: The vertices to be reached. If not informed, every reachable vertex is a target.
+    :return: A dict mapping each reachable target to a ShortestPath tuple. Unreachable targets are left out.
+    """
+
+    distances, previous = dijkstra(graph, source, targets)
+
+    if targets is None:
+        targets = distances
+
+    return {t: ShortestPath(path_to(previous, source, t), distances[t]) for t in targets if t in distances}
+
+
+class _Tree:
+    """
+    The shortest path tree of a source: the distance and the predecessor of each reachable vertex, and the children of
+    each vertex, so the subtree below a vertex can be found.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.distances = {source: 0.0}
+        self.previous = dict()
+        self.children = defaultdict(set)
+
+    def set_parent(self, vertex, parent):
+        old = self.previous.get(vertex)
+        if old is not None:
+            self.children[old].discard(vertex)
+        self.previous[vertex] = parent
+        self.children[parent].add(vertex)
+
+    def cut(self, root):
+        """
+        Removes a vertex and every vertex below it from the tree.
+
+        :param root: The root of the subtree.
+        :return: The list of removed vertices.
+        """
+
+        removed, stack = list(), [root]
+
+        while stack:
+            vertex = stack.pop()
+            removed.append(vertex)
+            stack.extend(self.children.pop(vertex, ()))
+
+        parent = self.previous.get(root)
+        if parent is not None:
+            self.children[parent].discard(root)
+
+        for vertex in removed:
+            del self.distances[vertex]
+            self.previous.pop(vertex, None)
+
+        return removed
+
+
+class DynamicShortestPaths:
+    """
+    This class maintains the shortest paths from a set of sources to every vertex while the graph changes. It observes
+    the graph, and each change is applied to the shortest path tree of every source:
+
+    - An edge added (or a cheaper parallel edge) can only shorten paths. If it shortens the path to its head, Dijkstra's
+      algorithm is resumed from there, visiting only the vertices whose distance decreases.
+    - An edge or a vertex removed can only lengthen paths, and only the paths through it. If it's in the tree, the
+      subtree below it is cut off and each of its vertices is reconnected through its cheapest predecessor still in the
+      tree, then Dijkstra's algorithm settles the subtree again.
+
+    Changing the weight of an edge is a removal followed by an addition. The version counter is increased each time the
+    distances or the paths change, so a caller holding a previous answer can tell it's stale.
+    """
+
+    def __init__(self, graph, sources=()):
+        """
+        Computes the shortest path trees of the sources and subscribes to the graph's changes. The graph must provide
+        weighted_neighbors and weighted_predecessors, like the adjacency list Graph.
+
+        :param graph: The graph.
+        :param sources: The initial sources.
+        """
+
+        self.graph = graph
+        self.version = 0
+        self._trees = dict()
+        self._counter = itertools.count()
+
+        for source in sources:
+            self.add_source(source)
+        graph.subscribe(self)
+
+    def close(self):
+        """
+        Stops observing the graph.
+        """
+
+        self.graph.unsubscribe(self)
+
+    @property
+    def sources(self):
+        return list(self._trees)
+
+    def add_source(self, source):
+        """
+        Registers a source and computes its shortest path tree.
+
+        :param source: The source vertex.
+        """
+
+        if source not in self.graph:
+            raise Exception('Start vertex cannot be found in the graph.')
+
+        if source not in self._trees:
+            tree = _Tree(source)
+            self._trees[source] = tree
+            self._settle(tree, [(cost, next(self._counter), neighbor, source)
+                                for neighbor, cost in self.graph.weighted_neighbors(source)])
+
+    def remove_source(self, source):
+        """
+        Forgets a source and its shortest path tree.
+
+        :param source: The source vertex.
+        """
+
+        self._trees.pop(source, None)
+
+    def _tree(self, source):
+        if source not in self._trees:
+            raise Exception('The vertex {} is not a source.'.format(source))
+        return self._trees[source]
+
+    def distance(self, source, target):
+        """
+        The length of the shortest path between a source and a vertex.
+
+        :param source: A registered source.
+        :param target: The vertex to be reached.
+        :return: The distance, or infinity if the vertex can't be reached.
+        """
+
+        return self._tree(source).distances.get(target, math.inf)
+
+    def distances(self, source):
+        """
+        The distance from a source to every vertex reachable from it.
+
+        :param source: A registered source.
+        :return: A dict mapping each reachable vertex to its distance.
+        """
+
+        return dict(self._tree(source).distances)
+
+    def shortest_path(self, source, target):
+        """
+        The shortest path between a source and a vertex.
+
+        :param source: A registered source.
+        :param target: The vertex to be reached.
+        :return: A ShortestPath tuple with the list of vertices in the path and its total weight.
+        """
+
+        tree = self._tree(source)
+
+        if target not in tree.distances:
+            raise Exception('The target vertex is unreachable')
+
+        return ShortestPath(path_to(tree.previous, source, target), tree.distances[target])
+
+    def _settle(self, tree, heap):
+        # Dijkstra's algorithm from the (distance, counter, vertex, parent) entries of the heap. Only the vertices
+        # whose distance decreases are visited.
+        changed = False
+        distances = tree.distances
+        heapq.heapify(heap)
+
+        while heap:
+            distance, _, current, parent = heapq.heappop(heap)
+
+            if distance >= distances.get(current, math.inf):
+                continue  # stale heap entry, or not an improvement
+
+            distances[current] = distance
+            tree.set_parent(current, parent)
+            changed = True
+
+            for neighbor, cost in self.graph.weighted_neighbors(current):
+                if distance + cost < distances.get(neighbor, math.inf):
+                    heapq.heappush(heap, (distance + cost, next(self._counter), neighbor, current))
+
+        return changed
+
+    def _reconnect(self, tree, removed):
+        # Settles again the vertices cut off from the tree, starting from their predecessors still in it.
+        distances, heap = tree.distances, list()
+
+        for vertex in removed:
+            if vertex in self.graph:
+                for predecessor, cost in self.graph.weighted_predecessors(vertex):
+                    if predecessor in distances:
+                        heap.append((distances[predecessor] + cost, next(self._counter), vertex, predecessor))
+
+        self._settle(tree, heap)
+
+    def vertex_added(self, vertex):
+        pass
+
+    def vertex_removed(self, vertex):
+        changed = self._trees.pop(vertex, None) is not None
+
+        for tree in self._trees.values():
+            if vertex in tree.distances:
+                removed = tree.cut(vertex)
+                self._reconnect(tree, removed[1:])
+                changed = True
+
+        if changed:
+            self.version += 1
+
+    def edge_added(self, u, v, weight):
+        # The cost comes from the graph, the cheapest of the parallel edges between the vertices.
+        cost = next(cost for neighbor, cost in self.graph.weighted_neighbors(u) if neighbor == v)
+        changed = False
+
+        for tree in self._trees.values():
+            heap = list()
+            for tail, head in ((u, v), (v, u)) if not self.graph.is_directed else ((u, v),):
+                if tail in tree.distances:
+                    heap.append((tree.distances[tail] + cost, next(self._counter), head, tail))
+            if self._settle(tree, heap):
+                changed = True
+
+        if changed:
+            self.version += 1
+
+    def edge_removed(self, u, v):
+        changed = False
+
+        for tree in self._trees.values():
+            for tail, head in ((u, v), (v, u)) if not self.graph.is_directed else ((u, v),):
+                if tree.previous.get(head) == tail:
+                    self._reconnect(tree, tree.cut(head))
+                    changed = True
+
+        if changed:
+            self.version += 1
@@ -0,0 +1,201 @@
+"""
+This module finds minimum spanning trees, the trees that connect all the vertices of an undirected graph with the least
+total weight. When the graph isn't connected the result is a minimum spanning forest, a tree for each component.
+
+Kruskal's algorithm sorts the edges by weight and takes each one that joins two different trees, using a union-find to
+tell them apart, in O(E log E). Its streaming version sorts the edges in chunks saved to temporary files and merges
+them, so it can process edge lists larger than the memory. Prim's algorithm grows a tree from a vertex, always taking
+the cheapest edge leaving it, kept in a binary heap (heapq), in O(E log V).
+
+The functions work on the adjacency list Graph and on the CSRGraph. As in the other algorithms, edges without weight
+cost 1 and only the cheapest of parallel edges is considered.
+"""
+
+import heapq
+import itertools
+import math
+import pickle
+import tempfile
+
+from collections import namedtuple
+
+from src.main.graph import adjacency
+from src.main.graph.components import UnionFind
+
+
+SpanningTree = namedtuple('SpanningTree', ['edges', 'weight'])
+
+
+def _check(graph):
+    if graph.is_directed:
+        raise Exception('Spanning trees are defined for undirected graphs.')
+
+
+def _edges(graph):
+    # Yields each edge once as a (cost, u, v) tuple, leaving out the loops.
+    done = set()
+
+    for u in graph:
+        for v, cost in graph.weighted_neighbors(u):
+            if v != u and v not in done:
+                yield cost, u, v
+        done.add(u)
+
+
+def _csr_edges(csr):
+    # The same edges of a CSRGraph, sorted by cost with array operations.
+    import numpy as np
+
+    sources = np.repeat(np.arange(len(csr), dtype=csr.indices.dtype), csr.out_degrees)
+    mask = sources < csr.indices
+    costs, sources, targets = csr.costs[mask], sources[mask], csr.indices[mask]
+    order = np.argsort(costs, kind='stable')
+
+    return zip(costs[order].tolist(), sources[order].tolist(), targets[order].tolist())
+
+
+def _kruskal(vertices, edges):
+    # Takes the sorted (cost, u, v) edges that join different trees.
+    sets = UnionFind(vertices)
+    tree, weight = list(), 0.0
+
+    for cost, u, v in edges:
+        sets.add(u)
+        sets.add(v)
+        if sets.union(u, v):
+            tree.append((u, v, cost))
+            weight += cost
+            if sets.count == 1 and vertices:
+                break
+
+    return SpanningTree(tree, weight)
+
+
+def kruskal(graph):
+    """
+    Finds a minimum spanning forest with Kruskal's algorithm.
+
+    :param graph: An undirected graph, an adjacency list Graph or a CSRGraph.
+    :return: A SpanningTree tuple with the list of (u, v, cost) edges of the forest and its total weight.
+    """
+
+    _check(graph)
+
+    if hasattr(graph, 'indptr'):
+        edges = _csr_edges(graph)
+    else:
+        edges = sorted(_edges(graph), key=lambda edge: edge[0])
+
+    return _kruskal(graph, edges)
+
+
+def _sorted_runs(edges, chunk_size, directory, files):
+    # Sorts the edges in chunks, saving each chunk to a temporary file appended to files.
+    edges = iter(edges)
+
+    while True:
+        chunk = sorted(itertools.islice(edges, chunk_size), key=lambda edge: edge[0])
+        if not chunk:
+            break
+        f = tempfile.TemporaryFile(dir=directory)
+        files.append(f)
+        for edge in chunk:
+            pickle.dump(edge, f, pickle.HIGHEST_PROTOCOL)
+        f.seek(0)
+
+
+def _read_run(f):
+    while True:
+        try:
+            yield pickle.load(f)
+        except EOFError:
+            return
+
+
+def kruskal_stream(edges, chunk_size=1000000, directory=None):
+    """
+    Finds a minimum spanning forest of a graph given by a stream of edges, with Kruskal's algorithm and an external
+    merge sort: at most chunk_size edges are kept in memory at once, and the sorted chunks are written to temporary
+    files and merged. The union-find still keeps every vertex in memory.
+
+    :param edges: An iterable of (u, v) or (u, v, weight) tuples, such as serialization.read_edgelist(file). Edges
+                  without weight, or with infinite weight, cost 1, as in the graphs, and Kruskal's algorithm only
+                  takes the cheapest of parallel edges.
+    :param chunk_size: The number of edges sorted at once.
+    :param directory: The directory of the temporary files, by default the system's temporary directory.
+    :return: A SpanningTree tuple with the list of (u, v, cost) edges of the forest and its total weight.
+    """
+
+    def costs():
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            weight = edge[2] if len(edge) > 2 else math.inf
+            if u != v:
+                yield adjacency.cost(weight), u, v
+
+    files = list()
+
+    try:
+        _sorted_runs(costs(), chunk_size, directory, files)
+        return _kruskal((), heapq.merge(*map(_read_run, files), key=lambda edge: edge[0]))
+    finally:
+        for f in files:
+            f.close()
+
+
+def prim(graph, root=None):
+    """
+    Finds a minimum spanning forest with Prim's algorithm, growing a tree from the root and then from each vertex not
+    reached yet.
+
+    :param graph: An undirected graph, an adjacency list Graph or a CSRGraph.
+    :param root: The vertex the first tree grows from, by default any vertex.
+    :return: A SpanningTree tuple with the list of (u, v, cost) edges of the forest, each one leading to a new vertex,
+             and its total weight.
+    """
+
+    _check(graph)
+
+    if root is not None and root not in graph:
+        raise Exception('Start vertex cannot be found in the graph.')
+
+    visited = set()
+    tree, weight = list(), 0.0
+    # The counter breaks ties between equal costs, so vertices themselves are never compared.
+    counter = itertools.count()
+
+    for start in itertools.chain([root] if root is not None else [], graph):
+        if start in visited:
+            continue
+        visited.add(start)
+        heap = [(cost, next(counter), start, v) for v, cost in graph.weighted_neighbors(start) if v not in visited]
+        heapq.heapify(heap)
+
+        while heap:
+            cost, _, u, v = heapq.heappop(heap)
+            if v in visited:
+                continue
+            visited.add(v)
+            tree.append((u, v, cost))
+            weight += cost
+            for neighbor, c in graph.weighted_neighbors(v):
+                if neighbor not in visited:
+                    heapq.heappush(heap, (c, next(counter), v, neighbor))
+
+    return SpanningTree(tree, weight)
+
+
+def minimum_spanning_tree(graph, algorithm='kruskal'):
+    """
+    Finds a minimum spanning forest.
+
+    :param graph: An undirected graph, an adjacency list Graph or a CSRGraph.
+    :param algorithm: 'kruskal' or 'prim'.
+    :return: A SpanningTree tuple with the list of (u, v, cost) edges of the forest and its total weight.
+    """
+
+    if algorithm == 'kruskal':
+        return kruskal(graph)
+    if algorithm == 'prim':
+        return prim(graph)
+    raise Exception('Unknown algorithm: {}'.format(algorithm))
@@ -0,0 +1,294 @@
+"""
+This module finds Eulerian and Hamiltonian paths and circuits.
+
+An Eulerian path uses every edge exactly once, and an Eulerian circuit is one that ends where it starts. A connected
+undirected graph has a circuit if every degree is even, and a path if exactly two degrees are odd, from one of those
+vertices to the other. A directed graph has a circuit if every vertex has the same in-degree and out-degree, and a
+path if one vertex has one more outgoing edge than incoming ones, where it starts, and one has one more incoming edge,
+where it ends. Hierholzer's algorithm walks unused edges until it gets stuck, which can only happen where the walk
+started or should end, and splices the detours found on the way back, using every edge once: O(V + E). Each parallel
+edge is an edge to be used, and a loop is used like any other edge.
+
+A Hamiltonian path visits every vertex exactly once, and a Hamiltonian cycle also returns to its first vertex. Finding
+one is NP-hard, and the Held–Karp dynamic programming over the subsets of vertices decides it in O(2ⁿ·n): for each set
+of vertices it keeps, as a bitmask, the vertices where a path through exactly that set can end. The search is skipped
+when a cheap test already rules the path out: a disconnected graph, or degrees that can't fit a path (more than two
+vertices that must be endpoints, or a vertex without the edges a cycle needs). Loops and parallel edges don't matter to
+Hamiltonian paths, and in an undirected graph a Hamiltonian cycle has at least 3 vertices.
+"""
+
+import time
+
+from collections import Counter
+
+from src.main.graph import adjacency
+
+
+# The greatest number of vertices of the Hamiltonian search, whose table has 2ⁿ entries.
+MAX_HAMILTONIAN_VERTICES = 24
+
+# The number of subsets the Hamiltonian search goes through between checks of its time budget.
+_BUDGET_CHECK = 4096
+
+
+def _edges(graph):
+    # Maps each vertex to its successors (neighbors), each one mapped to the number of edges to it, an undirected loop
+    # counting once.
+    vertices = getattr(graph, '_vertices', None)
+    directed = graph.is_directed
+    edges = dict()
+
+    for vertex in graph:
+        if vertices is not None and not isinstance(graph, dict):
+            v = vertices[vertex]
+            targets = {u: adjacency.count(w) for u, w in (v.out_neighbors if directed else v.neighbors).items()}
+            if not directed and vertex in targets:
+                targets[vertex] //= 2
+        else:
+            targets = dict(Counter(graph.neighbors(vertex)))
+        edges[vertex] = targets
+
+    return edges
+
+
+def _start(graph, edges, circuit):
+    # The vertex an Eulerian path (circuit) must start from, None if there is no such path, and the number of edges.
+    directed = graph.is_directed
+    count = 0
+
+    if directed:
+        balance = Counter()
+        for u, targets in edges.items():
+            for v, k in targets.items():
+                balance[u] += k
+                balance[v] -= k
+                count += k
+        starts = [v for v, b in balance.items() if b == 1]
+        ends = [v for v, b in balance.items() if b == -1]
+        if any(b not in (-1, 0, 1) for b in balance.values()) or len(starts) != len(ends) or len(starts) > 1:
+            return None, count
+        odd = starts
+    else:
+        odd = list()
+        for u, targets in edges.items():
+            degree = sum(k for v, k in targets.items() if v != u) + 2 * targets.get(u, 0)
+            count += degree
+            if degree % 2:
+                odd.append(u)
+        count //= 2
+        if len(odd) not in (0, 2):
+            return None, count
+
+    if odd:
+        return (None if circuit else odd[0]), count
+
+    return next((u for u, targets in edges.items() if targets), next(iter(edges), None)), count
+
+
+def _hierholzer(graph, circuit):
+    edges = _edges(graph)
+    start, count = _start(graph, edges, circuit)
+
+    if start is None:
+        return list() if not edges else None
+
+    directed = graph.is_directed
+    targets = {u: list(t) for u, t in edges.items()}
+    # The position of the next target of each vertex that may have unused edges.
+    position = dict.fromkeys(edges, 0)
+    stack, path = [start], list()
+
+    while stack:
+        u = stack[-1]
+        remaining, i = edges[u], position[u]
+        while i < len(targets[u]) and not remaining[targets[u][i]]:
+            i += 1
+        position[u] = i
+        if i == len(targets[u]):
+            path.append(stack.pop())
+            continue
+        v = targets[u][i]
+        remaining[v] -= 1
+        if not directed and v != u:
+            edges[v][u] -= 1
+        stack.append(v)
+
+    # Edges left unused are in another component.
+    if len(path) != count + 1:
+        return None
+
+    path.reverse()
+
+    return path
+
+
+def eulerian_path(graph):
+    """
+    Finds an Eulerian path, one that uses every edge of the graph exactly once, with Hierholzer's algorithm. If the
+    graph has an Eulerian circuit, the path is a circuit.
+
+    :param graph: The graph.
+    :return: The list of vertices in the path, each edge between two consecutive ones, or None if there is no such
+             path. A graph without edges has a path with a single vertex, and a graph without vertices an empty path.
+    """
+
+    return _hierholzer(graph, False)
+
+
+def eulerian_circuit(graph):
+    """
+    Finds an Eulerian circuit, a closed path that uses every edge of the graph exactly once, with Hierholzer's
+    algorithm.
+
+    :param graph: The graph.
+    :return: The list of vertices in the circuit, starting and ending with the same vertex, or None if there is no
+             such circuit.
+    """
+
+    return _hierholzer(graph, True)
+
+
+def _reachable(successors, predecessors, n, start, undirected):
+    # The bitmask of the vertices reached from start, following edges in both directions if undirected is True.
+    seen, stack = 1 << start, [start]
+
+    while stack:
+        v = stack.pop()
+        links = successors[v] | predecessors[v] if undirected else successors[v]
+        new = links & ~seen
+        seen |= new
+        while new:
+            low = new & -new
+            stack.append(low.bit_length() - 1)
+            new ^= low
+
+    return seen
+
+
+def _held_karp(graph, cycle, budget):
+    vertices = list(graph)
+    n = len(vertices)
+
+    if n > MAX_HAMILTONIAN_VERTICES:
+        raise Exception('The Hamiltonian search is limited to {} vertices.'.format(MAX_HAMILTONIAN_VERTICES))
+
+    if n == 0:
+        return None if cycle else list()
+    if cycle and n < (2 if graph.is_directed else 3):
+        return None
+
+    index = {v: i for i, v in enumerate(vertices)}
+    successors, predecessors = [0] * n, [0] * n
+
+    for v in vertices:
+        i = index[v]
+        for u in graph.neighbors(v):
+            j = index[u]
+            if i != j:
+                successors[i] |= 1 << j
+                predecessors[j] |= 1 << i
+
+    full = (1 << n) - 1
+
+    # The connectivity and degree tests.
+    if _reachable(successors, predecessors, n, 0, True) != full:
+        return None
+
+    if cycle:
+        if not all(successors) or not all(predecessors):
+            return None
+        if not graph.is_directed and any(bin(s).count('1') < 2 for s in successors):
+            return None
+        if graph.is_directed and _reachable(successors, predecessors, n, 0, False) != full:
+            return None
+        starts, ends = 1, full
+    elif graph.is_directed:
+        # A vertex without incoming edges can only start the path, and one without outgoing edges can only end it.
+        sources = [i for i in range(n) if not predecessors[i]]
+        sinks = [i for i in range(n) if not successors[i]]
+        if len(sources) > 1 or len(sinks) > 1:
+            return None
+        starts = 1 << sources[0] if sources else full
+        ends = 1 << sinks[0] if sinks else full
+    else:
+        # A vertex with a single neighbor can only be an endpoint.
+        leaves = [i for i in range(n) if bin(successors[i]).count('1') == 1]
+        if len(leaves) > 2:
+            return None
+        starts = 1 << leaves[0] if leaves else full
+        ends = full
+
+    # reach[mask] is the bitmask of the vertices where a path through exactly the vertices of mask can end.
+    reach = [0] * (1 << n)
+    remaining = starts
+    while remaining:
+        low = remaining & -remaining
+        reach[low] = low
+        remaining ^= low
+
+    deadline = None if budget is None else time.monotonic() + budget
+
+    for mask in range(1, full):
+        if deadline is not None and not mask % _BUDGET_CHECK and time.monotonic() > deadline:
+            raise Exception('The Hamiltonian search ran out of time.')
+        ends_here = reach[mask]
+        if not ends_here:
+            continue
+        following = 0
+        while ends_here:
+            low = ends_here & -ends_here
+            following |= successors[low.bit_length() - 1]
+            ends_here ^= low
+        following &= ~mask
+        while following:
+            low = following & -following
+            reach[mask | low] |= low
+            following ^= low
+
+    last = reach[full] & ends
+    if cycle:
+        last &= predecessors[0]
+    if not last:
+        return None
+
+    # Walks the table back from the full set, each vertex preceded by one where a path through the others can end.
+    v = (last & -last).bit_length() - 1
+    path, mask = [v], full
+    while mask != 1 << v:
+        mask ^= 1 << v
+        candidates = reach[mask] & predecessors[v]
+        v = (candidates & -candidates).bit_length() - 1
+        path.append(v)
+    path.reverse()
+
+    if cycle:
+        path.append(path[0])
+
+    return [vertices[i] for i in path]
+
+
+def hamiltonian_path(graph, budget=None):
+    """
+    Finds a Hamiltonian path, one that visits every vertex of the graph exactly once, with the Held–Karp dynamic
+    programming.
+
+    :param graph: The graph, with at most MAX_HAMILTONIAN_VERTICES vertices.
+    :param budget: The greatest number of seconds the search can take. If it runs out an exception is raised.
+    :return: The list of vertices in the path, or None if there is no such path.
+    """
+
+    return _held_karp(graph, False, budget)
+
+
+def hamiltonian_cycle(graph, budget=None):
+    """
+    Finds a Hamiltonian cycle, one that visits every vertex of the graph exactly once and returns to the first one,
+    with the Held–Karp dynamic programming.
+
+    :param graph: The graph, with at most MAX_HAMILTONIAN_VERTICES vertices.
+    :param budget: The greatest number of seconds the search can take. If it runs out an exception is raised.
+    :return: The list of vertices in the cycle, starting and ending with the same vertex, or None if there is no such
+             cycle.
+    """
+
+    return _held_karp(graph, True, budget)
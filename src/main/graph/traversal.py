@@ -0,0 +1,163 @@
+"""
+This module implements the Breadth-First Search and Depth-First Search traversals as lazy generators.
+
+Every traversal is iterative, keeps the frontier in a collections.deque or a list used as a stack, and remembers the
+visited vertices in a set, so it runs in O(V + E) without recursion, however deep the graph is.
+
+The functions work on any graph that supports membership tests and provides a neighbors(vertex) method, such as the
+adjacency list Graph. The source can be a single vertex or a list of vertices, which are all visited first. An optional
+visited set can be shared between several traversals: the vertices in it are skipped, and the vertices found are added
+to it.
+"""
+
+from collections import deque
+
+
+PRE = 'pre'
+POST = 'post'
+
+
+def _sources(graph, source, visited):
+    sources = source if isinstance(source, list) else [source]
+
+    for v in sources:
+        if v not in graph:
+            raise Exception('Start vertex cannot be found in the graph.')
+
+    return [v for v in dict.fromkeys(sources) if v not in visited]
+
+
+def bfs_order(graph, source, visited=None):
+    """
+    Yields the vertices in the order they're visited by a Breadth-First Search.
+
+    :param graph: The graph to be traversed.
+    :param source: The initial vertex, or a list of initial vertices.
+    :param visited: An optional set of vertices that are not visited.
+    :return: A generator of vertices.
+    """
+
+    for vertex, _ in bfs_tree(graph, source, visited):
+        yield vertex
+
+
+def bfs_tree(graph, source, visited=None):
+    """
+    Yields the vertices in the order they're visited by a Breadth-First Search, together with the vertex from which
+    each one of them was reached. dict(bfs_tree(graph, source)) is the parent map of the Breadth-First Search tree.
+
+    :param graph: The graph to be traversed.
+    :param source: The initial vertex, or a list of initial vertices.
+    :param visited: An optional set of vertices that are not visited.
+    :return: A generator of (vertex, parent) tuples, the parent of the initial vertices is None.
+    """
+
+    if visited is None:
+        visited = set()
+
+    queue = deque(_sources(graph, source, visited))
+    visited.update(queue)
+
+    for v in queue:
+        yield v, None
+
+    while queue:
+        current = queue.popleft()
+        for neighbor in graph.neighbors(current):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+                yield neighbor, current
+
+
+def bfs_layers(graph, source, visited=None):
+    """
+    Yields the levels of a Breadth-First Search, the i-th level being the list of vertices i edges away from the
+    initial vertices.
+
+    :param graph: The graph to be traversed.
+    :param source: The initial vertex, or a list of initial vertices.
+    :param visited: An optional set of vertices that are not visited.
+    :return: A generator of lists of vertices.
+    """
+
+    if visited is None:
+        visited = set()
+
+    layer = _sources(graph, source, visited)
+    visited.update(layer)
+
+    while layer:
+        yield layer
+        next_layer = list()
+        for current in layer:
+            for neighbor in graph.neighbors(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    next_layer.append(neighbor)
+        layer = next_layer
+
+
+def dfs_events(graph, source, visited=None):
+    """
+    Yields the events of a Depth-First Search: a PRE event when a vertex is found and a POST event when all the
+    vertices reachable from it have been visited.
+
+    :param graph: The graph to be traversed.
+    :param source: The initial vertex, or a list of initial vertices.
+    :param visited: An optional set of vertices that are not visited.
+    :return: A generator of (event, vertex) tuples.
+    """
+
+    if visited is None:
+        visited = set()
+
+    for root in _sources(graph, source, visited):
+        if root in visited:
+            continue
+
+        visited.add(root)
+        yield PRE, root
+        stack = [(root, iter(graph.neighbors(root)))]
+
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield PRE, neighbor
+                    stack.append((neighbor, iter(graph.neighbors(neighbor))))
+                    break
+            else:
+                stack.pop()
+                yield POST, current
+
+
+def dfs_order(graph, source, visited=None):
+    """
+    Yields the vertices in the order they're found by a Depth-First Search (preorder).
+
+    :param graph: The graph to be traversed.
+    :param source: The initial vertex, or a list of initial vertices.
+    :param visited: An optional set of vertices that are not visited.
+    :return: A generator of vertices.
+    """
+
+    for event, vertex in dfs_events(graph, source, visited):
+        if event == PRE:
+            yield vertex
+
+
+def dfs_postorder(graph, source, visited=None):
+    """
+    Yields the vertices in the order a Depth-First Search finishes them (postorder).
+
+    :param graph: The graph to be traversed.
+    :param source: The initial vertex, or a list of initial vertices.
+    :param visited: An optional set of vertices that are not visited.
+    :return: A generator of vertices.
+    """
+
+    for event, vertex in dfs_events(graph, source, visited):
+        if event == POST:
+            yield vertex
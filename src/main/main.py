@@ -57,7 +57,7 @@ def test():
     print(graph.erdoes_gallai(graph.degree_sequence))
 
     try:
-        print(graph.dijkstra('A', 'E'))
+        print('Smaller path: {}\nWeight: {}'.format(*graph.dijkstra('A', 'E')))
     except Exception as e:
         print('Erro:', e)
 
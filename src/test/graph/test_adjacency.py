@@ -0,0 +1,76 @@
+import copy
+import math
+import pickle
+import unittest
+
+from src.main.graph import adjacency
+from src.main.graph.graph_adjl import Graph, Vertex
+
+
+class TestAdjacency(unittest.TestCase):
+
+    def test_entries(self):
+        entries = dict()
+        adjacency.add(entries, 1, 3)
+        self.assertEqual(entries, {1: 3})
+        adjacency.add(entries, 1, math.inf)
+        adjacency.add(entries, 1, 2)
+        self.assertEqual(entries, {1: [3, math.inf, 2]})
+
+        self.assertEqual((adjacency.count(3), adjacency.count(entries[1])), (1, 3))
+        self.assertEqual((adjacency.weights(3), adjacency.weights(entries[1])), ([3], [3, math.inf, 2]))
+        self.assertIsNot(adjacency.weights(entries[1]), entries[1])
+        self.assertEqual((adjacency.cost(math.inf), adjacency.cost(4)), (1.0, 4.0))
+        self.assertEqual(adjacency.cheapest(entries[1]), math.inf)
+        self.assertEqual(adjacency.cheapest([3, 0.5]), 0.5)
+
+    def test_lazy_maps(self):
+        graph = Graph('Undirected')
+        graph.add_edges_from([('A', 'B', 2)])
+        graph.add_vertex('C')
+        self.assertIs(graph['C'].neighbors, adjacency.EMPTY)
+        self.assertEqual(graph['A'].neighbors, {graph['B'].id: 2})
+        self.assertIs(graph['A'].in_neighbors, adjacency.EMPTY)
+        self.assertIs(graph['A'].out_neighbors, adjacency.EMPTY)
+
+        directed = Graph('Directed', True)
+        directed.add_edges_from([('A', 'B', 2)])
+        self.assertIs(directed['A'].neighbors, adjacency.EMPTY)
+        self.assertIs(directed['A'].in_neighbors, adjacency.EMPTY)
+        self.assertIs(directed['B'].out_neighbors, adjacency.EMPTY)
+        self.assertEqual(directed['A'].get_neighbors(), {directed['B'].id: 2})
+
+        with self.assertRaises(TypeError):
+            adjacency.EMPTY[0] = 1
+
+    def test_undirected_loop(self):
+        graph = Graph('Loop')
+        graph.add_edges_from([('A', 'A', 5)])
+        self.assertEqual(graph['A'].neighbors, {graph['A'].id: [5, 5]})
+        self.assertEqual(graph.edge_weights('A', 'A'), [5])
+        self.assertEqual(graph.degree('A'), 2)
+
+    def test_slots(self):
+        vertex = Vertex('A')
+        with self.assertRaises(AttributeError):
+            vertex.colour = 'red'
+        self.assertFalse(hasattr(vertex, '__dict__'))
+
+    def test_pickle_and_copy(self):
+        graph = Graph('Graph', True)
+        graph.add_edges_from([('A', 'B', 1), ('A', 'B', 2), ('B', 'C', math.inf)])
+        graph.add_vertex('D')
+
+        for other in (pickle.loads(pickle.dumps(graph)), copy.deepcopy(graph)):
+            for label in graph:
+                for attribute in ('neighbors', 'in_neighbors', 'out_neighbors'):
+                    self.assertEqual(getattr(other[label], attribute), getattr(graph[label], attribute))
+                    if getattr(graph[label], attribute) is adjacency.EMPTY:
+                        self.assertIs(getattr(other[label], attribute), adjacency.EMPTY)
+            self.assertEqual(other.edge_weights('A', 'B'), [1, 2])
+            other.add_edge('D', 'A', 3)
+            self.assertIs(graph['D'].out_neighbors, adjacency.EMPTY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import math
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.main.graph.graph_adjl import Graph
+
+
+def random_graph(is_directed, seed=0):
+    rng = random.Random(seed)
+    graph = Graph(is_directed=is_directed)
+    graph.add_vertices_from((i, i % 3) for i in range(12))
+    graph.add_edges_from(((rng.randrange(12), rng.randrange(4)), (rng.randrange(12), rng.randrange(4)),
+                          rng.choice([math.inf, 0.5, 2, 3])) for _ in range(30))
+
+    return graph
+
+
+@unittest.skipIf(numpy is None, 'requires NumPy')
+class TestAllPairs(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def assertMatchesDijkstra(self, graph, table):
+        for u in graph:
+            for v in graph:
+                try:
+                    expected = graph.dijkstra(u, v).weight
+                except Exception:
+                    expected = math.inf
+                self.assertAlmostEqual(table.distance(u, v), expected)
+                if expected != math.inf:
+                    self.assertAlmostEqual(table.path(u, v).weight, expected)
+
+    def test_methods_agree_with_dijkstra(self):
+        from src.main.graph import all_pairs
+
+        for is_directed in (False, True):
+            graph = random_graph(is_directed)
+            for method in ('floyd_warshall', 'dijkstra'):
+                self.assertMatchesDijkstra(graph, all_pairs.all_pairs_shortest_paths(graph, method))
+
+    def test_tuple_labels_round_trip(self):
+        from src.main.graph import all_pairs
+
+        graph = random_graph(False)
+        for method in ('floyd_warshall', 'dijkstra'):
+            prefix = os.path.join(self.directory, method)
+            table = all_pairs.all_pairs_shortest_paths(graph, method, prefix)
+            self.assertEqual(table.labels, list(graph))
+
+            loaded = all_pairs.ShortestPathTable.load(prefix, mmap=False)
+            self.assertEqual(loaded.labels, list(graph))
+            self.assertMatchesDijkstra(graph, loaded)
+
+    def test_unsupported_labels_write_no_files(self):
+        from src.main.graph import all_pairs
+
+        graph = Graph()
+        graph.add_edges_from([(object(), 'A')])
+
+        for method in ('floyd_warshall', 'dijkstra'):
+            with self.assertRaises(Exception):
+                all_pairs.all_pairs_shortest_paths(graph, method, os.path.join(self.directory, method))
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from src.main.graph.cache import QueryCache
+from src.main.graph.graph_adjl import Graph
+
+
+def triangle():
+    graph = Graph()
+    graph.add_edges_from([('A', 'B', 1), ('B', 'C', 1), ('A', 'C', 5)])
+
+    return graph
+
+
+class TestQueryCache(unittest.TestCase):
+
+    def test_hits_until_the_version_changes(self):
+        results = QueryCache()
+        self.assertEqual(results.get(0, ('q',), lambda: 1), 1)
+        self.assertEqual(results.get(0, ('q',), lambda: 2), 1)
+        self.assertEqual(results.get(1, ('q',), lambda: 3), 3)
+        self.assertEqual(results.info()[:3], (1, 2, 1))
+
+    def test_lru_size(self):
+        results = QueryCache(maxsize=2)
+        for key in 'abc':
+            results.get(0, (key,), lambda: key, bounded=True)
+        results.get(0, ('a',), lambda: 'new', bounded=True)
+        self.assertEqual(results.get(0, ('a',), lambda: 'newer', bounded=True), 'new')
+        self.assertEqual(len(results), 2)
+
+
+class TestMemoize(unittest.TestCase):
+
+    def test_keyword_calls(self):
+        graph = triangle()
+        self.assertEqual(graph.dijkstra(start='A', target='C'), graph.dijkstra('A', 'C'))
+        self.assertEqual(graph.dijkstra('A', target='C').weight, 2.0)
+        self.assertEqual(graph.component_of(vertex='A'), {'A', 'B', 'C'})
+
+    def test_positional_and_keyword_calls_share_an_entry(self):
+        graph = triangle()
+        graph.dijkstra('A', 'C')
+        hits = graph.cache.hits
+        graph.dijkstra(start='A', target='C')
+        graph.dijkstra(target='C', start='A')
+        self.assertEqual(graph.cache.hits, hits + 2)
+
+    def test_results_are_copies(self):
+        graph = triangle()
+        graph.component_of('A').add('Z')
+        self.assertEqual(graph.component_of('A'), {'A', 'B', 'C'})
+
+    def test_invalidation_after_a_mutation(self):
+        graph = triangle()
+        self.assertEqual(graph.dijkstra(start='A', target='C').weight, 2.0)
+        self.assertEqual(graph.max_degree, 2)
+
+        graph.add_edge('A', 'C', 0.5)
+        self.assertEqual(graph.dijkstra(start='A', target='C').weight, 0.5)
+        self.assertEqual(graph.max_degree, 3)
+
+        graph.add_vertex('D')
+        self.assertEqual(graph.component_of(vertex='D'), {'D'})
+        graph.add_edge('C', 'D')
+        self.assertEqual(graph.component_of(vertex='D'), {'A', 'B', 'C', 'D'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from src.main.graph.graph_adjl import Graph
+
+
+def build(edges, is_directed=False, vertices=()):
+    graph = Graph('Shape', is_directed)
+    graph.add_vertices_from(vertices)
+    graph.add_edges_from((u, v, 1) for u, v in edges)
+
+    return graph
+
+
+def shapes(classification):
+    names = ('simple', 'multigraph', 'pseudograph', 'connected', 'bipartite', 'complete_bipartite', 'acyclic', 'forest',
+             'tree', 'regular', 'complete', 'cycle', 'wheel', 'star')
+    return {name for name in names if getattr(classification, name)}
+
+
+class TestClassification(unittest.TestCase):
+
+    def test_path(self):
+        c = build([(0, 1), (1, 2), (2, 3)]).classification
+        self.assertEqual((c.vertices, c.edges, c.components, c.degree), (4, 3, 1, None))
+        self.assertEqual(shapes(c), {'simple', 'connected', 'bipartite', 'acyclic', 'forest', 'tree'})
+
+    def test_star(self):
+        c = build([('hub', leaf) for leaf in 'abcd']).classification
+        self.assertEqual(shapes(c), {'simple', 'connected', 'bipartite', 'complete_bipartite', 'acyclic', 'forest',
+                                     'tree', 'star'})
+
+    def test_cycles(self):
+        even = build([(i, (i + 1) % 6) for i in range(6)]).classification
+        self.assertEqual(shapes(even), {'simple', 'connected', 'bipartite', 'regular', 'cycle'})
+        self.assertEqual(even.degree, 2)
+
+        odd = build([(i, (i + 1) % 5) for i in range(5)]).classification
+        self.assertEqual(shapes(odd), {'simple', 'connected', 'regular', 'cycle'})
+
+        triangle = build([(0, 1), (1, 2), (2, 0)]).classification
+        self.assertEqual(shapes(triangle), {'simple', 'connected', 'regular', 'complete', 'cycle'})
+
+        # Two disjoint triangles are 2-regular but not a single cycle.
+        c = build([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3)]).classification
+        self.assertEqual((shapes(c), c.components), ({'simple', 'regular'}, 2))
+
+    def test_wheel(self):
+        rim = [(i, i % 5 + 1) for i in range(1, 6)]
+        c = build(rim + [(0, i) for i in range(1, 6)]).classification
+        self.assertEqual(shapes(c), {'simple', 'connected', 'wheel'})
+
+        # The same numbers of edges and degrees, but the rim is two triangles.
+        rims = [(1, 2), (2, 3), (3, 1), (4, 5), (5, 6), (6, 4)]
+        c = build(rims + [(0, i) for i in range(1, 7)]).classification
+        self.assertFalse(c.wheel)
+
+    def test_complete(self):
+        c = build([(u, v) for u in range(5) for v in range(u + 1, 5)]).classification
+        self.assertEqual(shapes(c), {'simple', 'connected', 'regular', 'complete'})
+        self.assertEqual(c.degree, 4)
+
+        c = build([(u, v) for u in 'abc' for v in 'xy']).classification
+        self.assertEqual(shapes(c), {'simple', 'connected', 'bipartite', 'complete_bipartite'})
+
+    def test_multigraph_and_pseudograph(self):
+        c = build([(0, 1), (0, 1), (1, 2)]).classification
+        self.assertEqual((c.edges, c.parallel_edges, c.loops), (3, 1, 0))
+        self.assertEqual(shapes(c), {'multigraph', 'connected', 'bipartite'})
+
+        c = build([(0, 1), (1, 1), (1, 1)]).classification
+        self.assertEqual((c.edges, c.parallel_edges, c.loops), (3, 1, 2))
+        self.assertEqual(shapes(c), {'pseudograph', 'connected'})
+
+    def test_forest_and_isolated_vertices(self):
+        c = build([(0, 1), (2, 3)], vertices=[4]).classification
+        self.assertEqual((c.components, c.vertices), (3, 5))
+        self.assertEqual(shapes(c), {'simple', 'bipartite', 'acyclic', 'forest'})
+
+        c = build([]).classification
+        self.assertEqual((c.vertices, c.edges, c.components), (0, 0, 0))
+        self.assertTrue(c.simple and c.acyclic and c.regular)
+
+    def test_directed(self):
+        dag = build([('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd')], True).classification
+        self.assertTrue(dag.acyclic)
+        self.assertFalse(dag.forest)
+        self.assertTrue(dag.cycle)
+
+        cycle = build([(0, 1), (1, 2), (2, 0)], True).classification
+        self.assertEqual(shapes(cycle), {'simple', 'connected', 'regular', 'cycle'})
+        self.assertEqual(cycle.degree, 1)
+
+        # Two opposite edges are parallel in the underlying graph, but not in the directed one.
+        c = build([(0, 1), (1, 0)], True).classification
+        self.assertEqual((c.parallel_edges, c.simple, c.complete, c.forest), (0, True, True, False))
+
+    def test_follows_changes(self):
+        graph = build([(0, 1), (1, 2)])
+        self.assertTrue(graph.classification.tree)
+        graph.add_edge(2, 0, 1)
+        self.assertFalse(graph.classification.tree)
+        self.assertTrue(graph.classification.cycle)
+
+
+if __name__ == '__main__':
+    unittest.main()
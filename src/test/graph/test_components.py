@@ -0,0 +1,102 @@
+import random
+import unittest
+
+from src.main.graph import components
+from src.main.graph.graph_adjl import Graph
+
+
+def random_graph(seed, is_directed=None):
+    rng = random.Random(seed)
+    graph = Graph(is_directed=rng.random() < 0.5 if is_directed is None else is_directed)
+    graph.add_vertices_from(range(15))
+    graph.add_edges_from((rng.randrange(15), rng.randrange(15)) for _ in range(rng.randrange(20)))
+
+    return graph
+
+
+def reachable(graph, source, undirected):
+    seen, stack = {source}, [source]
+    while stack:
+        u = stack.pop()
+        for v in graph:
+            if v not in seen and (graph.edge_weights(u, v) or undirected and graph.edge_weights(v, u)):
+                seen.add(v)
+                stack.append(v)
+
+    return seen
+
+
+class TestComponents(unittest.TestCase):
+
+    def test_connected_components(self):
+        for seed in range(40):
+            graph = random_graph(seed)
+            expected = {frozenset(reachable(graph, v, True)) for v in graph}
+            found = graph.connected_components()
+            self.assertEqual({frozenset(c) for c in found}, expected)
+            self.assertEqual(len(found), len(expected))
+            self.assertEqual(graph.number_of_components, len(expected))
+            self.assertEqual(graph.is_connected(), len(expected) == 1)
+            for v in graph:
+                self.assertEqual(graph.component_of(v), reachable(graph, v, True))
+
+    def test_strongly_connected_components(self):
+        for seed in range(40):
+            graph = random_graph(seed, True)
+            reach = {v: reachable(graph, v, False) for v in graph}
+            expected = {frozenset(u for u in reach[v] if v in reach[u]) for v in graph}
+            found = graph.strongly_connected_components()
+            self.assertEqual({frozenset(c) for c in found}, expected)
+            self.assertEqual(graph.is_strongly_connected(), len(expected) == 1)
+            # Reverse topological order: every edge goes to the same component or to an earlier one.
+            position = {v: i for i, component in enumerate(found) for v in component}
+            for u, v in graph.edges:
+                self.assertLessEqual(position[v], position[u])
+
+    def test_deep_cycle(self):
+        graph = Graph(is_directed=True)
+        graph.add_edges_from((i, (i + 1) % 30000) for i in range(30000))
+        self.assertTrue(graph.is_strongly_connected())
+
+    def test_empty_graph(self):
+        self.assertFalse(Graph().is_connected())
+        self.assertEqual(Graph().connected_components(), [])
+
+
+class TestUnionFind(unittest.TestCase):
+
+    def test_union(self):
+        sets = components.UnionFind(range(5))
+        self.assertTrue(sets.union(0, 1))
+        self.assertTrue(sets.union(3, 4))
+        self.assertFalse(sets.union(1, 0))
+        self.assertTrue(sets.connected(0, 1))
+        self.assertFalse(sets.connected(1, 3))
+        self.assertEqual(sets.count, 3)
+
+
+class TestConnectivityIndex(unittest.TestCase):
+
+    def test_follows_mutations(self):
+        rng = random.Random(5)
+        graph = random_graph(0, False)
+        index = graph.connectivity_index()
+        for _ in range(200):
+            action, u, v = rng.random(), rng.randrange(18), rng.randrange(18)
+            if action < 0.1:
+                graph.add_vertex(u)
+            elif action < 0.2:
+                graph.rm_vertex(u)
+            elif action < 0.4:
+                graph.rm_edge(u, v)
+            elif u in graph and v in graph:
+                graph.add_edge(u, v)
+            self.assertEqual(index.number_of_components, graph.number_of_components)
+            for a in graph:
+                for b in graph:
+                    self.assertEqual(index.connected(a, b), b in graph.component_of(a))
+        index.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import random
+import unittest
+
+from src.main.graph.graph_adjl import Graph, edge_cost
+
+
+def random_dag(seed, n=9, m=18):
+    rng = random.Random(seed)
+    order = list(range(n))
+    rng.shuffle(order)
+    graph = Graph('DAG', True)
+    graph.add_vertices_from(range(n))
+    for _ in range(m):
+        i, j = sorted(rng.sample(range(n), 2))
+        graph.add_edge(order[i], order[j], rng.choice([-2, 0, 1, 3, 5]))
+
+    return graph
+
+
+def all_paths(graph, source):
+    # Every path from the source with its weight, the graph being acyclic.
+    paths, stack = list(), [([source], 0.0)]
+
+    while stack:
+        path, weight = stack.pop()
+        paths.append((path, weight))
+        for neighbor in set(graph.neighbors(path[-1])):
+            stack.append((path + [neighbor], weight + edge_cost(graph.edge_weights(path[-1], neighbor))))
+
+    return paths
+
+
+def path_weight(graph, path):
+    return sum(edge_cost(graph.edge_weights(u, v)) for u, v in zip(path, path[1:]))
+
+
+class TestDAG(unittest.TestCase):
+
+    def test_topological_sort(self):
+        for seed in range(20):
+            graph = random_dag(seed)
+            order = graph.topological_sort()
+            self.assertEqual(sorted(order), sorted(graph))
+            position = {v: i for i, v in enumerate(order)}
+            for u in graph:
+                for v in graph.neighbors(u):
+                    self.assertLess(position[u], position[v])
+            self.assertIsNone(graph.find_cycle())
+
+    def test_paths_against_enumeration(self):
+        for seed in range(20):
+            graph = random_dag(seed)
+            for source in graph:
+                weights = dict()
+                for path, weight in all_paths(graph, source):
+                    shortest, longest = weights.get(path[-1], (weight, weight))
+                    weights[path[-1]] = min(shortest, weight), max(longest, weight)
+                for target in graph:
+                    if target not in weights:
+                        with self.assertRaises(Exception):
+                            graph.dag_shortest_path(source, target)
+                        with self.assertRaises(Exception):
+                            graph.dag_longest_path(source, target)
+                        continue
+                    shortest = graph.dag_shortest_path(source, target)
+                    longest = graph.dag_longest_path(source, target)
+                    self.assertEqual((shortest.weight, longest.weight), weights[target])
+                    self.assertEqual(path_weight(graph, shortest.path), shortest.weight)
+                    self.assertEqual(path_weight(graph, longest.path), longest.weight)
+                    self.assertEqual((longest.path[0], longest.path[-1]), (source, target))
+
+    def test_critical_path(self):
+        for seed in range(10):
+            graph = random_dag(seed)
+            expected = max(weight for source in graph for _, weight in all_paths(graph, source))
+            path = graph.critical_path()
+            self.assertEqual(path.weight, expected)
+            self.assertEqual(path_weight(graph, path.path), expected)
+
+        jobs = Graph('Jobs', True)
+        jobs.add_edges_from([('start', 'a', 2), ('start', 'b', 5), ('a', 'end', 4), ('b', 'end', 2), ('a', 'b', 1)])
+        self.assertEqual(jobs.critical_path(), (['start', 'b', 'end'], 7.0))
+        # A parallel edge costs the cheapest of them, so a heavier one doesn't lengthen the path.
+        jobs.add_edge('a', 'end', 9)
+        self.assertEqual(jobs.critical_path(), (['start', 'b', 'end'], 7.0))
+        jobs.rm_edge('start', 'b')
+        self.assertEqual(jobs.critical_path(), (['start', 'a', 'end'], 6.0))
+
+    def test_cycles(self):
+        rng = random.Random(5)
+        for seed in range(20):
+            graph = random_dag(seed)
+            u, v = rng.sample(list(graph), 2)
+            graph.add_edge(u, v, 1)
+            graph.add_edge(v, u, 1)
+
+            cycle = graph.find_cycle()
+            self.assertEqual(cycle[0], cycle[-1])
+            self.assertEqual(len(set(cycle)), len(cycle) - 1)
+            for a, b in zip(cycle, cycle[1:]):
+                self.assertTrue(graph.edge_weights(a, b))
+            with self.assertRaises(Exception):
+                graph.topological_sort()
+
+        loop = Graph('Loop', True)
+        loop.add_edges_from([('A', 'A', 1)])
+        self.assertEqual(loop.find_cycle(), ['A', 'A'])
+
+    def test_errors(self):
+        undirected = Graph('Undirected')
+        undirected.add_edges_from([('A', 'B', 1)])
+        with self.assertRaises(Exception):
+            undirected.topological_sort()
+
+        graph = random_dag(0)
+        with self.assertRaises(Exception):
+            graph.dag_shortest_path('Z', 0)
+        with self.assertRaises(Exception):
+            graph.dag_longest_path(0, 'Z')
+        self.assertEqual(Graph('Empty', True).critical_path().path, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import math
+import random
+import unittest
+
+from src.main.graph import eccentricity
+from src.main.graph.graph_adjl import Graph
+
+
+def build(edges, vertices=()):
+    graph = Graph()
+    graph.add_vertices_from(vertices)
+    graph.add_edges_from(edges)
+
+    return graph
+
+
+def random_connected(seed, weights=(math.inf,)):
+    rng = random.Random(seed)
+    n = rng.randint(2, 25)
+    edges = [(v, rng.randrange(v), rng.choice(weights)) for v in range(1, n)]
+    edges += [(rng.randrange(n), rng.randrange(n), rng.choice(weights)) for _ in range(rng.randrange(n))]
+
+    return build(edges)
+
+
+class TestMeasures(unittest.TestCase):
+
+    def test_path(self):
+        graph = build([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E')])
+        self.assertEqual(graph.diameter, 4)
+        self.assertEqual(graph.radius, 2)
+        self.assertEqual(graph.center, ['C'])
+        self.assertEqual(sorted(graph.periphery), ['A', 'E'])
+        self.assertEqual(graph.eccentricity('B'), 3)
+        self.assertEqual(graph.eccentricities(), {'A': 4, 'B': 3, 'C': 2, 'D': 3, 'E': 4})
+
+    def test_weighted(self):
+        graph = build([('A', 'B', 5), ('B', 'C', 1), ('A', 'C', 1)])
+        self.assertEqual(graph.diameter, 1)
+        self.assertEqual(graph.compute_diameter(weighted=True), 2.0)
+
+    def test_disconnected(self):
+        graph = build([('A', 'B')], ['C'])
+        self.assertEqual(graph.diameter, math.inf)
+        self.assertEqual(graph.eccentricity('A'), math.inf)
+        self.assertEqual(graph.diameter_bounds(), (math.inf, math.inf))
+
+    def test_empty(self):
+        self.assertEqual(Graph().diameter, 0)
+        self.assertEqual(Graph().diameter_bounds(), (0, 0))
+
+    def test_unknown_vertex(self):
+        with self.assertRaises(Exception):
+            build([('A', 'B')]).eccentricity('Z')
+
+
+class TestDiameterBounds(unittest.TestCase):
+
+    def test_exact_bounds_match_the_diameter(self):
+        for seed in range(100):
+            graph = random_connected(seed)
+            self.assertEqual(graph.diameter_bounds(), (graph.diameter, graph.diameter))
+
+    def test_weighted_with_zero_weights(self):
+        for seed in range(100):
+            graph = random_connected(seed, (0, 0, 1, 2.5))
+            diameter = graph.compute_diameter(weighted=True)
+            self.assertEqual(graph.diameter_bounds(weighted=True), (diameter, diameter))
+
+    def test_zero_weight_center_walk(self):
+        # The middle of the longest path is reached through an edge of weight zero.
+        graph = build([('A', 'B', 1), ('B', 'C', 0), ('C', 'D', 0), ('D', 'E', 1), ('B', 'D', 0)])
+        self.assertEqual(graph.diameter_bounds(weighted=True), (2.0, 2.0))
+
+    def test_sweep_limit(self):
+        graph = random_connected(3)
+        lower, upper = graph.diameter_bounds(max_sweeps=1)
+        self.assertLessEqual(lower, graph.diameter)
+        self.assertGreaterEqual(upper, graph.diameter)
+
+    def test_directed(self):
+        graph = Graph(is_directed=True)
+        graph.add_edges_from([('A', 'B')])
+        with self.assertRaises(Exception):
+            graph.diameter_bounds()
+
+
+class TestDiameterOptions(unittest.TestCase):
+
+    def test_approximate_is_a_lower_bound(self):
+        for seed in range(30):
+            graph = random_connected(seed)
+            self.assertLessEqual(graph.compute_diameter(approximate=True), graph.diameter)
+
+    def test_workers(self):
+        graph = random_connected(7, (1, 2, 3))
+        self.assertEqual(graph.compute_diameter(workers=2), graph.diameter)
+        self.assertEqual(eccentricity.eccentricities(graph.interned, True, workers=2),
+                         eccentricity.eccentricities(graph.interned, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import random
+import unittest
+
+from src.main.graph.graph_adjl import Graph
+
+
+def path_graph(is_directed=False):
+    graph = Graph('Path', is_directed)
+    graph.add_edges_from([('A', 'B'), ('B', 'C')])
+
+    return graph
+
+
+class TestUnknownVertices(unittest.TestCase):
+
+    def test_bfs_paths_unknown_start(self):
+        with self.assertRaises(KeyError):
+            list(path_graph().bfs_paths('Z', 'C'))
+
+    def test_bfs_paths_unknown_target(self):
+        with self.assertRaises(KeyError):
+            list(path_graph().bfs_paths('A', 'Z'))
+
+    def test_dfs_paths_unknown_start(self):
+        with self.assertRaises(KeyError):
+            list(path_graph().dfs_paths('Z', 'C'))
+
+    def test_dfs_paths_unknown_target(self):
+        with self.assertRaises(KeyError):
+            list(path_graph().dfs_paths('A', 'Z'))
+
+    def test_unknown_start_after_removal(self):
+        graph = path_graph()
+        graph.rm_vertex('C')
+        with self.assertRaises(KeyError):
+            list(graph.bfs_paths('Z', 'A'))
+        with self.assertRaises(KeyError):
+            graph.i_bfs('Z', 'A')
+
+    def test_search_unknown_target(self):
+        graph = path_graph()
+        self.assertIsNone(graph.i_bfs('A', 'Z'))
+        self.assertIsNone(graph.i_dfs('A', 'Z'))
+
+
+class TestInterning(unittest.TestCase):
+
+    def test_names_are_not_converted(self):
+        graph = Graph()
+        graph.add_edges_from([(1, '1'), ((0, 1), frozenset({2}))])
+        self.assertEqual(len(graph), 4)
+        self.assertEqual(graph.dijkstra(1, '1').path, [1, '1'])
+        self.assertFalse(graph.add_vertex(None))
+
+    def test_ids_are_reused(self):
+        graph = path_graph()
+        interned = graph.interned
+        removed = graph['B'].id
+        graph.rm_vertex('B')
+        self.assertNotIn(removed, interned)
+        graph.add_vertex('D')
+        self.assertEqual(graph['D'].id, removed)
+        self.assertEqual(interned.label_of(removed), 'D')
+        self.assertEqual(list(graph['D'].get_neighbors()), [])
+        graph.add_edges_from([('A', 'D'), ('D', 'C')])
+        self.assertEqual(list(graph.bfs_paths('A', 'C')), [['A', 'D', 'C']])
+
+    def test_view_translates_names(self):
+        graph = path_graph(True)
+        interned = graph.interned
+        self.assertEqual(sorted(interned.label_of(v) for v in interned), ['A', 'B', 'C'])
+        self.assertEqual([interned.label_of(v) for v in interned.neighbors(interned.id_of('A'))], ['B'])
+        self.assertEqual([interned.label_of(v) for v in interned.predecessors(interned.id_of('C'))], ['B'])
+        self.assertEqual(interned.id_of('Z'), -1)
+
+
+class TestPendants(unittest.TestCase):
+
+    def test_undirected(self):
+        self.assertEqual(sorted(path_graph().pendants), [('A', 'B'), ('C', 'B')])
+
+    def test_directed(self):
+        self.assertEqual(sorted(path_graph(True).pendants), [('A', 'B'), ('C', 'B')])
+
+
+class TestDegreeIndex(unittest.TestCase):
+
+    def expected_degrees(self, graph):
+        # Counts the edges from scratch: an undirected loop counts twice.
+        degrees, in_degrees, out_degrees = dict(), dict(), dict()
+        for v in graph:
+            out_degrees[v] = sum(len(graph.edge_weights(v, u)) for u in graph)
+            in_degrees[v] = sum(len(graph.edge_weights(u, v)) for u in graph)
+            if graph.is_directed:
+                degrees[v] = in_degrees[v] + out_degrees[v]
+            else:
+                degrees[v] = out_degrees[v] + len(graph.edge_weights(v, v))
+
+        return degrees, in_degrees, out_degrees
+
+    def assertIndexed(self, graph):
+        degrees, in_degrees, out_degrees = self.expected_degrees(graph)
+        self.assertEqual({v: graph.degree(v) for v in graph}, degrees)
+        if graph.is_directed:
+            self.assertEqual({v: graph.in_degree(v) for v in graph}, in_degrees)
+            self.assertEqual({v: graph.out_degree(v) for v in graph}, out_degrees)
+            self.assertEqual(set(graph.sources), {v for v, d in in_degrees.items() if not d})
+            self.assertEqual(set(graph.sinks), {v for v, d in out_degrees.items() if not d})
+        self.assertEqual(graph.degree_sequence, tuple(sorted(degrees.values(), reverse=True)))
+        self.assertEqual(graph.max_degree, max(degrees.values(), default=0))
+        if degrees:
+            self.assertEqual(graph.min_degree, min(degrees.values()))
+        self.assertEqual(set(graph.isolated_vertices), {v for v, d in degrees.items() if not d})
+        self.assertEqual(set(graph.leaves), {v for v, d in degrees.items() if d == 1})
+
+    def test_random_mutations(self):
+        rng = random.Random(2)
+        for is_directed in (False, True):
+            graph = Graph(is_directed=is_directed)
+            for _ in range(400):
+                action = rng.random()
+                u, v = rng.randrange(8), rng.randrange(8)
+                if action < 0.15:
+                    graph.add_vertex(u)
+                elif action < 0.25:
+                    graph.rm_vertex(u)
+                elif action < 0.35:
+                    graph.rm_edge(u, v)
+                else:
+                    graph.add_edges_from([(u, v, rng.choice([1, 2]))])
+                self.assertIndexed(graph)
+
+    def test_unknown_vertex(self):
+        self.assertEqual(path_graph().degree('Z'), 0)
+
+
+class TestBulkLoaders(unittest.TestCase):
+
+    def test_same_graph_as_add_edge(self):
+        rng = random.Random(3)
+        edges = [(rng.randrange(20), rng.randrange(20), rng.choice([1, 2, 3])) for _ in range(100)]
+        for is_directed in (False, True):
+            one_by_one, bulk = Graph(is_directed=is_directed), Graph(is_directed=is_directed)
+            one_by_one.add_vertices_from(range(20))
+            for u, v, w in edges:
+                self.assertTrue(one_by_one.add_edge(u, v, w))
+
+            bulk.add_vertices_from(range(20))
+            self.assertEqual(bulk.add_edges_from(iter(edges)), len(edges))
+
+            self.assertEqual(str(bulk), str(one_by_one))
+            self.assertEqual(bulk.degree_sequence, one_by_one.degree_sequence)
+            for u in range(20):
+                for v in range(20):
+                    self.assertEqual(bulk.edge_weights(u, v), one_by_one.edge_weights(u, v))
+
+    def test_vertices_are_created(self):
+        graph = Graph()
+        self.assertEqual(graph.add_edges_from([('A', 'B'), ('B', 'C', 4)], weight=2), 2)
+        self.assertEqual(sorted(graph), ['A', 'B', 'C'])
+        self.assertEqual(graph.edge_weights('A', 'B'), [2])
+        self.assertEqual(graph.edge_weights('C', 'B'), [4])
+
+    def test_add_vertices_from(self):
+        graph = Graph()
+        self.assertEqual(graph.add_vertices_from('ABCA'), 3)
+        self.assertEqual(graph.add_vertices_from('CD'), 1)
+        self.assertEqual(len(graph), 4)
+
+    def test_add_edge_needs_both_vertices(self):
+        graph = Graph()
+        graph.add_vertex('A')
+        self.assertFalse(graph.add_edge('A', 'B'))
+        self.assertTrue(graph.add_edge('A'))
+        self.assertEqual(graph.degree('A'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'requires NumPy')
+class TestDegree(unittest.TestCase):
+
+    def build(self, is_directed):
+        from src.main.graph.graph_adjm import Graph
+
+        graph = Graph(is_directed=is_directed, capacity=2)
+        for v in 'ABCDE':
+            graph.add_vertex(v)
+        for u, v in ('AB', 'BC', 'CA', 'AD', 'DD'):
+            graph.add_edge(u, v)
+
+        return graph
+
+    def test_undirected(self):
+        graph = self.build(False)
+        self.assertEqual([graph.degree(v) for v in 'ABCDE'], [3, 2, 2, 3, 0])
+        self.assertEqual([graph.degree(v) for v in 'ABCDE'], graph.degrees.tolist())
+
+    def test_directed(self):
+        graph = self.build(True)
+        self.assertEqual([graph.degree(v) for v in 'ABCDE'], [3, 2, 2, 3, 0])
+        self.assertEqual([graph.degree(v) for v in 'ABCDE'], graph.degrees.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
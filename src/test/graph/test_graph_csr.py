@@ -0,0 +1,75 @@
+import math
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.main.graph import eccentricity
+from src.main.graph import shortest_path
+from src.main.graph.graph_adjl import Graph, edge_cost
+
+
+def random_graph(is_directed, seed=0):
+    rng = random.Random(seed)
+    graph = Graph('Random', is_directed)
+    graph.add_vertices_from('v%d' % i for i in range(15))
+    graph.add_edges_from(('v%d' % rng.randrange(15), 'v%d' % rng.randrange(15), rng.choice([math.inf, 1, 2, 3]))
+                         for _ in range(40))
+
+    return graph
+
+
+@unittest.skipIf(numpy is None, 'requires NumPy')
+class TestCSRGraph(unittest.TestCase):
+
+    def test_neighbors_and_costs(self):
+        for is_directed in (False, True):
+            graph = random_graph(is_directed)
+            csr = graph.freeze()
+            self.assertEqual((csr.name, csr.is_directed, len(csr)), ('Random', is_directed, len(graph)))
+            for u in graph:
+                i = csr.id_of(u)
+                self.assertEqual(csr.label_of(i), u)
+                expected = {v: edge_cost(graph.edge_weights(u, v)) for v in graph if graph.edge_weights(u, v)}
+                self.assertEqual({csr.label_of(j): cost for j, cost in csr.weighted_neighbors(i)}, expected)
+                predecessors = {v for v in graph if graph.edge_weights(v, u)}
+                self.assertEqual({csr.label_of(j) for j in csr.predecessors(i)}, predecessors)
+
+    def test_round_trip(self):
+        for is_directed in (False, True):
+            graph = random_graph(is_directed)
+            thawed = graph.freeze().to_graph()
+            for u in graph:
+                for v in graph:
+                    weights = graph.edge_weights(u, v)
+                    expected = [min(weights, key=lambda w: edge_cost(w))] if weights else []
+                    self.assertEqual(thawed.edge_weights(u, v), expected)
+
+    def test_algorithms_run_on_ids(self):
+        graph = random_graph(True, 4)
+        csr = graph.freeze()
+        source = csr.id_of('v0')
+        distances, _ = shortest_path.dijkstra(csr, source)
+        expected, _ = shortest_path.dijkstra(graph, 'v0')
+        self.assertEqual({csr.label_of(v): d for v, d in distances.items()}, expected)
+
+    def test_bfs_distances(self):
+        graph = random_graph(False, 5)
+        csr = graph.freeze()
+        for u in graph:
+            expected = eccentricity.distances_from(graph, u)
+            distances = csr.bfs_distances(csr.id_of(u)).tolist()
+            self.assertEqual({csr.label_of(v): d for v, d in enumerate(distances) if d >= 0}, expected)
+
+    def test_reverse(self):
+        csr = random_graph(True, 6).freeze()
+        self.assertIs(csr.reverse.reverse, csr)
+        edges = {(u, v) for u in csr for v in csr.neighbors(u)}
+        self.assertEqual({(v, u) for u in csr for v in csr.reverse.neighbors(u)}, edges)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import itertools
+import random
+import unittest
+
+from src.main.graph import graphical
+from src.main.graph.graph_adjl import Graph
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def simple_degree_sequences(n):
+    pairs = list(itertools.combinations(range(n), 2))
+    sequences = set()
+
+    for mask in range(1 << len(pairs)):
+        degrees = [0] * n
+        for i, (u, v) in enumerate(pairs):
+            if mask >> i & 1:
+                degrees[u] += 1
+                degrees[v] += 1
+        sequences.add(tuple(sorted(degrees, reverse=True)))
+
+    return sequences
+
+
+def candidate_sequences(n):
+    return [s for s in itertools.product(range(n + 1), repeat=n) if graphical.is_non_increasing(s)]
+
+
+class TestErdosGallai(unittest.TestCase):
+
+    def test_against_enumeration(self):
+        for n in range(6):
+            expected = simple_degree_sequences(n)
+            for sequence in candidate_sequences(n):
+                self.assertEqual(graphical.erdos_gallai(sequence), sequence in expected, sequence)
+
+    def test_invalid_sequences(self):
+        self.assertFalse(graphical.erdos_gallai([1, 2, 1]))
+        self.assertFalse(graphical.erdos_gallai([1, 1, -2]))
+        self.assertFalse(graphical.erdos_gallai([3, 1, 1]))
+        self.assertTrue(graphical.erdos_gallai([]))
+        self.assertTrue(Graph.erdoes_gallai((3, 3, 2, 2, 2)))
+
+    def test_degree_sequence_of_a_graph(self):
+        self.assertTrue(Graph.is_degree_sequence((3, 2, 2, 1)))
+        self.assertFalse(Graph.is_degree_sequence((1, 2)))
+
+    @unittest.skipIf(numpy is None, 'requires NumPy')
+    def test_batch_matches_single_check(self):
+        import numpy as np
+
+        for n in range(6):
+            sequences = candidate_sequences(n)
+            if not sequences:
+                continue
+            expected = [graphical.erdos_gallai(s) for s in sequences]
+            self.assertEqual(graphical.erdos_gallai_batch(sequences).tolist(), expected)
+
+        padded = np.array([[2, 2, 2, 0], [3, 3, 0, 0], [1, 1, 0, 0]])
+        self.assertEqual(graphical.erdos_gallai_batch(padded).tolist(), [True, False, True])
+
+        with self.assertRaises(Exception):
+            graphical.erdos_gallai_batch([1, 1])
+
+
+class TestHavelHakimi(unittest.TestCase):
+
+    def test_realizes_the_sequence(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            sequence = [rng.randrange(8) for _ in range(rng.randrange(1, 10))]
+            if not graphical.erdos_gallai(sorted(sequence, reverse=True)):
+                with self.assertRaises(Exception):
+                    graphical.havel_hakimi(sequence)
+                continue
+
+            edges = graphical.havel_hakimi(sequence)
+            self.assertEqual(len({frozenset(e) for e in edges}), len(edges))
+            self.assertTrue(all(u != v for u, v in edges))
+
+            graph = Graph.from_degree_sequence(sequence)
+            self.assertEqual([graph.degree(v) for v in range(len(sequence))], sequence)
+            self.assertEqual(graph.degree_sequence, tuple(sorted(sequence, reverse=True)))
+
+    def test_empty_sequence(self):
+        self.assertEqual(graphical.havel_hakimi([]), [])
+        self.assertEqual(graphical.havel_hakimi([0, 0]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
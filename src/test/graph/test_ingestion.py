@@ -0,0 +1,51 @@
+import math
+import random
+import unittest
+
+from src.main.graph import ingestion
+from src.main.graph.graph_adjl import Graph
+
+
+def records(count, seed=0):
+    rng = random.Random(seed)
+
+    return [(rng.randrange(5), rng.randrange(5), rng.choice([math.inf, 1, 2, 3])) for _ in range(count)]
+
+
+class TestMetrics(unittest.TestCase):
+
+    def assertAccounted(self, metrics):
+        self.assertEqual(metrics.received, metrics.rejected + metrics.merged + metrics.committed)
+
+    def test_every_record_is_counted(self):
+        for policy in ingestion.POLICIES:
+            for batch_size in (1, 7, 1000):
+                graph = Graph()
+                metrics = ingestion.ingest(graph, records(100), policy, batch_size)
+                self.assertEqual(metrics.received, 100)
+                self.assertAccounted(metrics)
+                self.assertEqual(metrics.committed, sum(graph.degree(v) for v in graph) // 2)
+
+    def test_existing_edge_with_the_merged_weight(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B', 1)])
+        metrics = ingestion.ingest(graph, [('A', 'B', 3)] * 10, 'min', batch_size=1)
+        self.assertEqual((metrics.merged, metrics.committed), (10, 0))
+        self.assertEqual(graph.edge_weights('A', 'B'), [1])
+
+    def test_min_keeps_the_cheapest_edge(self):
+        graph = Graph()
+        ingestion.ingest(graph, [('A', 'B', 5), ('A', 'B'), ('B', 'C', 0.5), ('B', 'C')], 'min')
+        self.assertEqual(graph.edge_weights('A', 'B'), [math.inf])
+        self.assertEqual(graph.edge_weights('B', 'C'), [0.5])
+
+    def test_boolean_weights_are_rejected(self):
+        metrics = ingestion.ingest(Graph(), [('A', 'B', True), ('A', 'B', False), ('A', 'B', 1)])
+        self.assertEqual((metrics.rejected, metrics.committed), (2, 1))
+
+        with self.assertRaises(Exception):
+            ingestion.EdgePipeline(Graph(), strict=True).add(('A', 'B', True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import itertools
+import random
+import unittest
+
+from src.main.graph import isomorphism
+from src.main.graph.graph_adjl import Graph
+
+
+def random_graph(rng, is_directed, n, m):
+    graph = Graph('Random', is_directed)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from((rng.randrange(n), rng.randrange(n), rng.randrange(1, 4)) for _ in range(m))
+
+    return graph
+
+
+def relabel(graph, mapping):
+    other = Graph('Relabelled', graph.is_directed)
+    other.add_vertices_from(mapping[v] for v in graph)
+    for u, v in itertools.product(graph, repeat=2):
+        if graph.is_directed or repr(u) <= repr(v):
+            other.add_edges_from((mapping[u], mapping[v], weight) for weight in graph.edge_weights(u, v))
+
+    return other
+
+
+def multiplicities(graph):
+    return {(u, v): len(graph.edge_weights(u, v)) for u, v in itertools.product(graph, repeat=2)}
+
+
+def brute_force(first, second):
+    if len(first) != len(second):
+        return False
+    edges = multiplicities(second)
+    for permutation in itertools.permutations(second):
+        mapping = dict(zip(first, permutation))
+        if all(edges[mapping[u], mapping[v]] == k for (u, v), k in multiplicities(first).items()):
+            return True
+    return False
+
+
+class TestIsomorphism(unittest.TestCase):
+
+    def assertMapping(self, first, second, mapping):
+        self.assertEqual(sorted(mapping), sorted(first))
+        self.assertEqual(sorted(mapping.values(), key=repr), sorted(second, key=repr))
+        edges = multiplicities(second)
+        for (u, v), k in multiplicities(first).items():
+            self.assertEqual(edges[mapping[u], mapping[v]], k)
+
+    def test_relabelled_graphs(self):
+        rng = random.Random(0)
+        for _ in range(40):
+            graph = random_graph(rng, rng.random() < 0.5, rng.randrange(1, 9), rng.randrange(15))
+            names = ['v%d' % i for i in range(len(graph))]
+            rng.shuffle(names)
+            other = relabel(graph, dict(zip(graph, names)))
+
+            self.assertEqual(graph.fingerprint, other.fingerprint)
+            self.assertEqual(graph.canonical_form, other.canonical_form)
+            self.assertTrue(graph.is_isomorphic(other))
+            self.assertMapping(graph, other, graph.isomorphism(other))
+
+    def test_against_brute_force(self):
+        rng = random.Random(1)
+        for _ in range(150):
+            is_directed, n = rng.random() < 0.5, rng.randrange(1, 6)
+            first = random_graph(rng, is_directed, n, rng.randrange(7))
+            second = random_graph(rng, is_directed, n, rng.randrange(7))
+            expected = brute_force(first, second)
+            self.assertEqual(first.is_isomorphic(second), expected)
+            self.assertEqual(first.canonical_form == second.canonical_form, expected)
+            self.assertEqual(first.isomorphism(second) is not None, expected)
+
+    def test_same_degree_sequence(self):
+        # The complete bipartite graph K3,3 and the triangular prism are both 3-regular on 6 vertices.
+        bipartite = Graph('K3,3')
+        bipartite.add_edges_from((u, v, 1) for u in 'abc' for v in 'xyz')
+        prism = Graph('Prism')
+        prism.add_edges_from([(0, 1, 1), (1, 2, 1), (2, 0, 1), (3, 4, 1), (4, 5, 1), (5, 3, 1), (0, 3, 1), (1, 4, 1),
+                              (2, 5, 1)])
+
+        self.assertEqual(bipartite.degree_sequence, prism.degree_sequence)
+        self.assertFalse(bipartite.is_isomorphic(prism))
+        self.assertIsNone(bipartite.isomorphism(prism))
+        self.assertNotEqual(bipartite.canonical_form, prism.canonical_form)
+
+    def test_all_isomorphisms(self):
+        cycle = Graph('Cycle')
+        cycle.add_edges_from((i, (i + 1) % 5, 1) for i in range(5))
+        mappings = list(isomorphism.isomorphisms(cycle, cycle))
+        self.assertEqual(len(mappings), 10)
+        self.assertEqual(len({tuple(sorted(m.items())) for m in mappings}), 10)
+        for mapping in mappings:
+            self.assertMapping(cycle, cycle, mapping)
+
+    def test_direction_and_multiplicity_matter(self):
+        directed, undirected = Graph('D', True), Graph('U')
+        directed.add_edges_from([('A', 'B', 1)])
+        undirected.add_edges_from([('A', 'B', 1)])
+        self.assertFalse(isomorphism.is_isomorphic(directed, undirected))
+
+        double = Graph('Double')
+        double.add_edges_from([('A', 'B', 1), ('A', 'B', 2)])
+        self.assertFalse(double.is_isomorphic(undirected))
+        self.assertNotEqual(double.canonical_form, undirected.canonical_form)
+
+        heavier = Graph('Heavier')
+        heavier.add_edges_from([('X', 'Y', 7)])
+        self.assertEqual(heavier.canonical_form, undirected.canonical_form)
+
+    def test_group_isomorphic(self):
+        rng = random.Random(2)
+        graphs = [random_graph(rng, False, 5, 6) for _ in range(4)]
+        shuffled = [relabel(graph, dict(zip(graph, rng.sample(range(10, 15), 5)))) for graph in graphs]
+        groups = isomorphism.group_isomorphic(graphs + shuffled)
+
+        for group in groups:
+            self.assertGreaterEqual(len(group), 2)
+            self.assertTrue(all(brute_force(group[0], graph) for graph in group[1:]))
+        for first, second in itertools.combinations(groups, 2):
+            self.assertFalse(brute_force(first[0], second[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
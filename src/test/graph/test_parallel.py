@@ -0,0 +1,113 @@
+import math
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.main.graph import eccentricity
+from src.main.graph.graph_adjl import Graph
+
+
+def random_graph(is_directed, seed=0, n=30, m=60):
+    rng = random.Random(seed)
+    graph = Graph('Random', is_directed)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from((rng.randrange(n), rng.randrange(n), 1) for _ in range(m))
+
+    return graph
+
+
+def power_iteration(csr, damping=0.85, iterations=200):
+    n = len(csr)
+    rank = [1.0 / n] * n
+
+    for _ in range(iterations):
+        spread = sum(rank[u] for u in range(n) if not csr.neighbors(u)) * damping / n + (1.0 - damping) / n
+        new_rank = [spread] * n
+        for u in range(n):
+            neighbors = csr.neighbors(u)
+            for v in neighbors:
+                new_rank[v] += damping * rank[u] / len(neighbors)
+        rank = new_rank
+
+    return rank
+
+
+def bfs_row(csr, source):
+    distances = eccentricity.distances_from(csr, source)
+    return [distances.get(v, -1) for v in range(len(csr))]
+
+
+@unittest.skipIf(numpy is None, 'requires NumPy')
+class TestParallel(unittest.TestCase):
+
+    def test_bfs(self):
+        from src.main.graph import parallel
+
+        minimum = parallel.MIN_PARALLEL_FRONTIER
+        parallel.MIN_PARALLEL_FRONTIER = 1
+        try:
+            for is_directed in (False, True):
+                csr = random_graph(is_directed).freeze()
+                with parallel.ParallelGraph(csr, workers=2) as shared:
+                    for source in range(len(csr)):
+                        expected = eccentricity.distances_from(csr, source)
+                        distances = shared.bfs(source)
+                        self.assertEqual({v: d for v, d in enumerate(distances.tolist()) if d >= 0}, expected)
+                self.assertEqual(parallel.bfs(csr, 0, workers=1).tolist(), bfs_row(csr, 0))
+        finally:
+            parallel.MIN_PARALLEL_FRONTIER = minimum
+
+    def test_multi_source_bfs(self):
+        from src.main.graph import parallel
+
+        csr = random_graph(True, seed=1).freeze()
+        sources = [0, 3, 7, 11, 29]
+        for workers in (1, 2):
+            matrix = parallel.multi_source_bfs(csr, sources, workers)
+            self.assertEqual(matrix.shape, (len(sources), len(csr)))
+            for row, source in zip(matrix.tolist(), sources):
+                self.assertEqual(row, bfs_row(csr, source))
+
+        with self.assertRaises(Exception):
+            parallel.multi_source_bfs(csr, [0, len(csr)], workers=1)
+
+    def test_pagerank(self):
+        from src.main.graph import parallel
+
+        for is_directed in (False, True):
+            csr = random_graph(is_directed, seed=2).freeze()
+            expected = power_iteration(csr)
+            for workers in (1, 2):
+                rank = parallel.pagerank(csr, workers=workers, max_iterations=200)
+                self.assertTrue(math.isclose(rank.sum(), 1.0))
+                for value, other in zip(rank.tolist(), expected):
+                    self.assertAlmostEqual(value, other, places=8)
+
+    def test_degree_centrality(self):
+        from src.main.graph import parallel
+
+        csr = random_graph(True, seed=3).freeze()
+        expected = [len(csr.predecessors(v)) / (len(csr) - 1) for v in range(len(csr))]
+        for workers in (1, 2):
+            self.assertEqual(parallel.degree_centrality(csr, workers).tolist(), expected)
+
+    def test_eigenvector_centrality(self):
+        from src.main.graph import parallel
+
+        graph = Graph('Star')
+        graph.add_edges_from(('center', leaf, 1) for leaf in 'abcd')
+        csr = graph.freeze()
+        with parallel.ParallelGraph(csr, workers=1) as shared:
+            centrality = shared.eigenvector_centrality()
+        self.assertAlmostEqual(float(numpy.linalg.norm(centrality)), 1.0)
+        leaves = [centrality[csr.id_of(leaf)] for leaf in 'abcd']
+        self.assertGreater(centrality[csr.id_of('center')], max(leaves))
+        self.assertAlmostEqual(min(leaves), max(leaves))
+
+
+if __name__ == '__main__':
+    unittest.main()
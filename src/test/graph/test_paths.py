@@ -0,0 +1,79 @@
+import math
+import random
+import unittest
+
+from src.main.graph.graph_adjl import Graph
+
+
+def path_weight(graph, path):
+    return sum(min(1.0 if w == math.inf else w for w in graph.edge_weights(u, v)) for u, v in zip(path, path[1:]))
+
+
+class TestPathDepth(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.graph.add_edges_from([('A', 'B'), ('B', 'C'), ('A', 'C'), ('C', 'D')])
+
+    def assertSamePaths(self, start, target, max_depth):
+        bfs = self.graph.bfs_paths(start, target, max_depth=max_depth)
+        dfs = self.graph.dfs_paths(start, target, max_depth=max_depth)
+        self.assertEqual(sorted(bfs), sorted(dfs))
+
+    def test_depth_zero(self):
+        self.assertEqual(list(self.graph.dfs_paths('A', 'B', max_depth=0)), [])
+        self.assertSamePaths('A', 'B', 0)
+        self.assertSamePaths('A', 'A', 0)
+
+    def test_depth_one(self):
+        self.assertEqual(list(self.graph.dfs_paths('A', 'B', max_depth=1)), [['A', 'B']])
+        self.assertSamePaths('A', 'B', 1)
+        self.assertSamePaths('A', 'D', 1)
+
+    def test_any_depth(self):
+        for max_depth in (2, 3, None):
+            self.assertSamePaths('A', 'D', max_depth)
+
+
+    def test_shortest_first(self):
+        lengths = [len(path) for path in self.graph.bfs_paths('A', 'D')]
+        self.assertEqual(lengths, sorted(lengths))
+
+    def test_max_paths(self):
+        self.assertEqual(len(list(self.graph.bfs_paths('A', 'D', max_paths=1))), 1)
+        self.assertEqual(len(list(self.graph.dfs_paths('A', 'D', max_paths=1))), 1)
+        self.assertEqual(list(self.graph.dfs_paths('A', 'D', max_paths=0)), [])
+
+
+class TestKShortestPaths(unittest.TestCase):
+
+    def test_order_and_weights(self):
+        graph = Graph(is_directed=True)
+        graph.add_edges_from([('C', 'D', 3), ('C', 'E', 2), ('D', 'F', 4), ('E', 'D', 1), ('E', 'F', 2),
+                              ('E', 'G', 3), ('F', 'G', 2), ('F', 'H', 1), ('G', 'H', 2)])
+        paths = graph.k_shortest_paths('C', 'H', 3)
+        self.assertEqual([p.path for p in paths], [['C', 'E', 'F', 'H'], ['C', 'E', 'G', 'H'], ['C', 'D', 'F', 'H']])
+        self.assertEqual([p.weight for p in paths], [5.0, 7.0, 8.0])
+
+    def test_against_every_simple_path(self):
+        rng = random.Random(1)
+        for _ in range(30):
+            graph = Graph(is_directed=rng.random() < 0.5)
+            graph.add_vertices_from(range(7))
+            graph.add_edges_from((rng.randrange(7), rng.randrange(7), rng.choice([math.inf, 1, 2, 4]))
+                                 for _ in range(14))
+            expected = sorted(path_weight(graph, p) for p in graph.dfs_paths(0, 6))
+            paths = graph.k_shortest_paths(0, 6, 5)
+            self.assertEqual([p.weight for p in paths], expected[:5])
+            for p in paths:
+                self.assertEqual(len(set(p.path)), len(p.path))
+                self.assertEqual(path_weight(graph, p.path), p.weight)
+
+    def test_unreachable(self):
+        graph = Graph()
+        graph.add_vertices_from('AB')
+        self.assertEqual(graph.k_shortest_paths('A', 'B', 3), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
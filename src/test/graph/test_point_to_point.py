@@ -0,0 +1,91 @@
+import math
+import random
+import unittest
+
+from src.main.graph import shortest_path
+from src.main.graph.graph_adjl import Graph, edge_cost
+
+
+def random_graph(seed, n=25, m=60):
+    rng = random.Random(seed)
+    graph = Graph('Random', rng.random() < 0.5)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from((rng.randrange(n), rng.randrange(n), rng.choice([math.inf, 0, 1, 2.5, 4])) for _ in range(m))
+
+    return graph
+
+
+class TestPointToPoint(unittest.TestCase):
+
+    def assertShortest(self, graph, path, source, target, distance):
+        self.assertEqual((path.path[0], path.path[-1]), (source, target))
+        self.assertEqual(path.weight, distance)
+        self.assertEqual(sum(edge_cost(graph.edge_weights(u, v)) for u, v in zip(path.path, path.path[1:])), distance)
+
+    def test_against_dijkstra(self):
+        for seed in range(10):
+            graph = random_graph(seed)
+            landmarks = graph.landmarks(4)
+            for source in range(0, len(graph), 3):
+                distances, _ = shortest_path.dijkstra(graph, source)
+                for target in graph:
+                    if target not in distances:
+                        for search in (graph.bidirectional_dijkstra, graph.astar):
+                            with self.assertRaises(Exception):
+                                search(source, target)
+                        continue
+                    distance = distances[target]
+                    self.assertShortest(graph, graph.bidirectional_dijkstra(source, target), source, target, distance)
+                    self.assertShortest(graph, graph.astar(source, target), source, target, distance)
+                    self.assertShortest(graph, graph.astar(source, target, landmarks), source, target, distance)
+
+    def test_landmark_bounds(self):
+        for seed in range(5):
+            graph = random_graph(seed)
+            landmarks = graph.landmarks(3)
+            self.assertEqual(len(landmarks.landmarks), 3)
+            for source in graph:
+                distances, _ = shortest_path.dijkstra(graph, source)
+                for target in graph:
+                    bound = landmarks.bound(graph[source].id, graph[target].id)
+                    self.assertLessEqual(bound, distances.get(target, math.inf))
+
+    def test_callable_heuristic(self):
+        graph = Graph('Grid')
+        graph.add_edges_from(((x, y), (x + 1, y), 1) for x in range(4) for y in range(5))
+        graph.add_edges_from(((x, y), (x, y + 1), 1) for x in range(5) for y in range(4))
+        calls = list()
+
+        def manhattan(vertex, target):
+            calls.append((vertex, target))
+            return abs(vertex[0] - target[0]) + abs(vertex[1] - target[1])
+
+        path = graph.astar((0, 0), (4, 4), manhattan)
+        self.assertEqual((len(path.path), path.weight), (9, 8.0))
+        self.assertTrue(calls)
+        self.assertTrue(all(target == (4, 4) for _, target in calls))
+
+    def test_errors(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B', 1), ('B', 'C', 1)])
+        landmarks = graph.landmarks(2)
+
+        for search in (graph.bidirectional_dijkstra, graph.astar):
+            with self.assertRaises(Exception):
+                search('A', 'Z')
+            with self.assertRaises(Exception):
+                search('Z', 'A')
+
+        graph.add_edge('A', 'C', 1)
+        with self.assertRaises(Exception):
+            graph.astar('A', 'C', landmarks)
+        self.assertEqual(graph.astar('A', 'C', graph.landmarks(2)).path, ['A', 'C'])
+
+        other = Graph()
+        other.add_edges_from([('A', 'C', 1)])
+        with self.assertRaises(Exception):
+            graph.astar('A', 'C', other.landmarks(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import math
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.main.graph.graph_adjl import Graph
+
+
+@unittest.skipIf(numpy is None, 'requires NumPy')
+class TestBinaryFormat(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, 'graph.bin')
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(lambda: os.path.exists(self.path) and os.remove(self.path))
+
+    def test_tuple_labels_round_trip(self):
+        from src.main.graph import serialization
+
+        graph = Graph('Grid', is_directed=True)
+        graph.add_edges_from([((0, 0), (0, 1), 2.0), ((0, 1), (1, 1), 3.0), ((1, 1), frozenset({'a', 1}), 1.0)])
+
+        serialization.save(graph, self.path)
+        loaded = serialization.load(self.path, mmap_mode=False)
+
+        self.assertEqual(loaded.name, 'Grid')
+        self.assertEqual(loaded.labels, list(graph))
+        self.assertEqual(set(loaded.to_graph().edges), set(graph.edges))
+        self.assertEqual(loaded.to_graph().edge_weights((0, 1), (1, 1)), [3.0])
+
+    def test_unsupported_labels(self):
+        from src.main.graph import serialization
+
+        graph = Graph()
+        graph.add_vertex(object())
+
+        with self.assertRaises(Exception):
+            serialization.save(graph, self.path)
+
+    def test_memory_mapped_arrays(self):
+        from src.main.graph import serialization
+
+        graph = Graph('Big', is_directed=False)
+        graph.add_edges_from((i, (i * 7) % 50, float(i)) for i in range(50))
+        serialization.save(graph, self.path)
+
+        for mmap_mode in (True, False):
+            loaded = serialization.load(self.path, mmap_mode)
+            frozen = graph.freeze()
+            self.assertEqual(loaded.indptr.tolist(), frozen.indptr.tolist())
+            self.assertEqual(loaded.indices.tolist(), frozen.indices.tolist())
+            self.assertEqual(loaded.weights.tolist(), frozen.weights.tolist())
+            if mmap_mode:
+                self.assertFalse(loaded.indices.flags.writeable)
+
+    def test_not_a_graph(self):
+        from src.main.graph import serialization
+
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 64)
+        with self.assertRaises(Exception):
+            serialization.load(self.path)
+
+
+@unittest.skipIf(numpy is None, 'requires NumPy')
+class TestTextFormats(unittest.TestCase):
+
+    def graph(self, is_directed):
+        graph = Graph(is_directed=is_directed)
+        graph.add_edges_from([('a', 'b', 2.5), ('a', 'b'), ('b', 'c'), ('c', 'c', 1.0), ('d', 'a')])
+        graph.add_vertex('e')
+
+        return graph
+
+    def test_edgelist_round_trip(self):
+        from src.main.graph import serialization
+
+        for is_directed in (False, True):
+            graph, text = self.graph(is_directed), io.StringIO()
+            serialization.write_edgelist(graph, text)
+            loaded = serialization.load_edgelist(io.StringIO(text.getvalue()), is_directed)
+            for u in graph:
+                for v in graph:
+                    if graph.edge_weights(u, v):
+                        self.assertEqual(sorted(loaded.edge_weights(u, v)), sorted(graph.edge_weights(u, v)))
+
+    def test_adjlist_round_trip(self):
+        from src.main.graph import serialization
+
+        for is_directed in (False, True):
+            graph, text = self.graph(is_directed), io.StringIO()
+            serialization.write_adjlist(graph, text)
+            loaded = serialization.load_adjlist(io.StringIO(text.getvalue()), is_directed)
+            self.assertEqual(sorted(loaded), sorted(graph))
+            for u in graph:
+                for v in graph:
+                    self.assertEqual(len(loaded.edge_weights(u, v)), len(graph.edge_weights(u, v)))
+
+    def test_read_edgelist(self):
+        from src.main.graph import serialization
+
+        lines = io.StringIO('# comment\n\na b\nb c 3\n')
+        self.assertEqual(list(serialization.read_edgelist(lines)), [('a', 'b', math.inf), ('b', 'c', 3.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import math
+import random
+import unittest
+
+from src.main.graph import shortest_path
+from src.main.graph.graph_adjl import Graph, edge_cost
+from src.main.graph.shortest_path import DynamicShortestPaths
+
+
+def random_graph(seed, n=10, m=25):
+    rng = random.Random(seed)
+    graph = Graph(is_directed=rng.random() < 0.5)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from((rng.randrange(n), rng.randrange(n), rng.choice([math.inf, 0, 1, 2.5, 4])) for _ in range(m))
+
+    return graph
+
+
+def bellman_ford(graph, source):
+    distances = {source: 0.0}
+
+    for _ in range(len(graph)):
+        for u in list(distances):
+            for v, cost in graph.weighted_neighbors(u):
+                if distances[u] + cost < distances.get(v, math.inf):
+                    distances[v] = distances[u] + cost
+
+    return distances
+
+
+class TestEdgeCost(unittest.TestCase):
+
+    def test_single_edge(self):
+        self.assertEqual(edge_cost(math.inf), 1.0)
+        self.assertEqual(edge_cost(3), 3.0)
+
+    def test_mixed_parallel_edges(self):
+        self.assertEqual(edge_cost([math.inf, 5]), 1.0)
+        self.assertEqual(edge_cost([2, math.inf]), 1.0)
+        self.assertEqual(edge_cost([0.5, math.inf]), 0.5)
+        self.assertEqual(edge_cost([math.inf, math.inf]), 1.0)
+
+    def test_parallel_edge_never_lengthens_a_path(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B'), ('B', 'C')])
+        self.assertEqual(graph.dijkstra('A', 'C').weight, 2.0)
+
+        graph.add_edge('A', 'B', 5)
+        self.assertEqual(graph.dijkstra('A', 'C').weight, 2.0)
+
+        graph.add_edge('B', 'C', 0.5)
+        self.assertEqual(graph.dijkstra('A', 'C').weight, 1.5)
+
+    def test_dynamic_shortest_paths(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B', 2), ('B', 'C')])
+        paths = DynamicShortestPaths(graph, ['A'])
+
+        graph.add_edge('A', 'B')
+        self.assertEqual(paths.distance('A', 'C'), 2.0)
+        graph.add_edge('A', 'B', 7)
+        self.assertEqual(paths.distance('A', 'C'), 2.0)
+        self.assertEqual(paths.distance('A', 'C'), graph.dijkstra('A', 'C').weight)
+
+
+class TestDynamicShortestPaths(unittest.TestCase):
+
+    def assertUpToDate(self, graph, paths):
+        for source in paths.sources:
+            expected, _ = shortest_path.dijkstra(graph, source)
+            self.assertEqual(paths.distances(source), expected)
+            for target, distance in expected.items():
+                path = paths.shortest_path(source, target)
+                self.assertEqual(path.path[0], source)
+                self.assertEqual(path.path[-1], target)
+                self.assertEqual(sum(edge_cost(graph.edge_weights(u, v)) for u, v in zip(path.path, path.path[1:])),
+                                 distance)
+
+    def test_random_mutations(self):
+        rng = random.Random(4)
+        for seed in range(10):
+            graph = random_graph(seed)
+            paths = DynamicShortestPaths(graph, [0, 1, 2])
+            for _ in range(60):
+                action, u, v = rng.random(), rng.randrange(12), rng.randrange(12)
+                if action < 0.05:
+                    graph.add_vertex(u)
+                elif action < 0.1:
+                    graph.rm_vertex(u)
+                elif action < 0.4:
+                    graph.rm_edge(u, v)
+                elif u in graph and v in graph:
+                    graph.add_edge(u, v, rng.choice([math.inf, 0, 1, 2.5, 4]))
+                self.assertUpToDate(graph, paths)
+            paths.close()
+
+    def test_version_and_sources(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B', 1), ('B', 'C', 1)])
+        graph.add_vertex('D')
+        paths = DynamicShortestPaths(graph, ['A'])
+
+        version = paths.version
+        graph.add_edge('C', 'D', 1)
+        self.assertGreater(paths.version, version)
+        self.assertEqual(paths.distance('A', 'D'), 3.0)
+
+        version = paths.version
+        graph.add_edge('A', 'C', 5)
+        self.assertEqual(paths.version, version)
+
+        graph.rm_edge('B', 'C')
+        self.assertEqual(paths.shortest_path('A', 'D').path, ['A', 'C', 'D'])
+
+        graph.rm_vertex('A')
+        self.assertEqual(paths.sources, [])
+        with self.assertRaises(Exception):
+            paths.distance('A', 'D')
+
+
+class TestDijkstra(unittest.TestCase):
+
+    def test_against_bellman_ford(self):
+        for seed in range(50):
+            graph = random_graph(seed)
+            expected = bellman_ford(graph, 0)
+            distances, previous = shortest_path.dijkstra(graph, 0)
+            self.assertEqual(distances, expected)
+            for target in distances:
+                path = shortest_path.path_to(previous, 0, target)
+                self.assertEqual(sum(edge_cost(graph.edge_weights(u, v)) for u, v in zip(path, path[1:])),
+                                 distances[target])
+
+    def test_multiple_targets(self):
+        graph = Graph()
+        graph.add_edges_from([(i, i + 1) for i in range(100)])
+        distances, _ = shortest_path.dijkstra(graph, 0, [3, 5])
+        self.assertEqual((distances[3], distances[5]), (3.0, 5.0))
+        self.assertLess(len(distances), 10)
+
+        paths = shortest_path.shortest_paths(graph, 0, [2, 4])
+        self.assertEqual(paths[4], shortest_path.ShortestPath([0, 1, 2, 3, 4], 4.0))
+
+    def test_long_path_is_iterative(self):
+        graph = Graph()
+        graph.add_edges_from([(i, i + 1, 2) for i in range(20000)])
+        self.assertEqual(graph.dijkstra(0, 20000).weight, 40000.0)
+
+    def test_errors(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B')])
+        graph.add_vertex('C')
+        with self.assertRaises(Exception):
+            graph.dijkstra('A', 'C')
+        with self.assertRaises(Exception):
+            graph.dijkstra('Z', 'A')
+        with self.assertRaises(Exception):
+            graph.dijkstra('A', 'Z')
+
+
+if __name__ == '__main__':
+    unittest.main()
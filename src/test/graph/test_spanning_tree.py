@@ -0,0 +1,32 @@
+import math
+import random
+import unittest
+
+from src.main.graph import spanning_tree
+from src.main.graph.graph_adjl import Graph
+
+
+class TestStreamAgainstGraph(unittest.TestCase):
+
+    def assertSameWeight(self, edges):
+        graph = Graph()
+        graph.add_edges_from(edges)
+
+        stream = spanning_tree.kruskal_stream(edges, chunk_size=3)
+        self.assertAlmostEqual(stream.weight, spanning_tree.kruskal(graph).weight)
+        self.assertAlmostEqual(stream.weight, spanning_tree.prim(graph).weight)
+        self.assertAlmostEqual(stream.weight, spanning_tree.kruskal(graph.interned).weight)
+
+    def test_mixed_parallel_edges(self):
+        self.assertSameWeight([('A', 'B', math.inf), ('A', 'B', 5), ('B', 'C', 2), ('B', 'C', math.inf),
+                               ('C', 'D', 4), ('A', 'D', 3), ('D', 'D', 0.5)])
+
+    def test_random_multigraphs(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            edges = [(rng.randrange(8), rng.randrange(8), rng.choice([math.inf, 0.5, 1, 2, 7])) for _ in range(20)]
+            self.assertSameWeight(edges)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import itertools
+import random
+import unittest
+
+from collections import Counter
+
+from src.main.graph import tours
+from src.main.graph.graph_adjl import Graph
+
+
+def random_graph(rng, is_directed, n, m):
+    graph = Graph('Random', is_directed)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from((rng.randrange(n), rng.randrange(n), 1) for _ in range(m))
+
+    return graph
+
+
+def edge_key(graph, u, v):
+    return (u, v) if graph.is_directed else tuple(sorted((u, v)))
+
+
+def edge_counts(graph):
+    counts = Counter()
+    for u, v in itertools.product(graph, repeat=2):
+        k = len(graph.edge_weights(u, v))
+        if k and (graph.is_directed or u <= v):
+            counts[u, v] = k
+
+    return counts
+
+
+def walk(graph, counts, u, remaining, ends):
+    # Tries every walk that uses each remaining edge once, backtracking.
+    if not remaining:
+        return u in ends
+    for v in graph:
+        key = edge_key(graph, u, v)
+        if counts[key]:
+            counts[key] -= 1
+            found = walk(graph, counts, v, remaining - 1, ends)
+            counts[key] += 1
+            if found:
+                return True
+    return False
+
+
+def has_eulerian(graph, circuit):
+    counts = edge_counts(graph)
+    total = sum(counts.values())
+
+    return not total or any(walk(graph, counts, start, total, {start} if circuit else set(graph)) for start in graph)
+
+
+def has_hamiltonian(graph, cycle):
+    vertices = list(graph)
+    if cycle and len(vertices) < (2 if graph.is_directed else 3):
+        return False
+    for order in itertools.permutations(vertices):
+        path = list(order) + [order[0]] if cycle else list(order)
+        if all(graph.edge_weights(u, v) for u, v in zip(path, path[1:])):
+            return True
+    return not vertices and not cycle
+
+
+class TestEulerian(unittest.TestCase):
+
+    def assertEulerian(self, graph, path):
+        self.assertEqual(Counter(edge_key(graph, u, v) for u, v in zip(path, path[1:])), edge_counts(graph))
+
+    def test_against_backtracking(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            graph = random_graph(rng, rng.random() < 0.5, rng.randrange(1, 6), rng.randrange(8))
+            path, circuit = graph.eulerian_path(), graph.eulerian_circuit()
+
+            self.assertEqual(path is not None, has_eulerian(graph, False))
+            self.assertEqual(circuit is not None, has_eulerian(graph, True))
+            if path is not None:
+                self.assertEulerian(graph, path)
+            if circuit is not None:
+                self.assertEulerian(graph, circuit)
+                self.assertEqual(circuit[0], circuit[-1])
+
+    def test_known_graphs(self):
+        # The seven bridges of Königsberg have four vertices of odd degree.
+        bridges = Graph('Königsberg')
+        bridges.add_edges_from([('A', 'B', 1), ('A', 'B', 1), ('A', 'C', 1), ('A', 'C', 1), ('A', 'D', 1),
+                                ('B', 'D', 1), ('C', 'D', 1)])
+        self.assertIsNone(bridges.eulerian_path())
+
+        bridges.rm_edge('A', 'D')
+        path = bridges.eulerian_path()
+        self.assertEqual({path[0], path[-1]}, {'B', 'C'})
+        self.assertIsNone(bridges.eulerian_circuit())
+
+        directed = Graph('Directed', True)
+        directed.add_edges_from([('A', 'B', 1), ('B', 'C', 1), ('C', 'A', 1), ('A', 'A', 1)])
+        circuit = directed.eulerian_circuit()
+        self.assertEqual(len(circuit), 5)
+        self.assertEulerian(directed, circuit)
+
+        self.assertEqual(Graph('Empty').eulerian_circuit(), [])
+
+
+class TestHamiltonian(unittest.TestCase):
+
+    def test_against_permutations(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            graph = random_graph(rng, rng.random() < 0.5, rng.randrange(1, 7), rng.randrange(12))
+            path, cycle = graph.hamiltonian_path(), graph.hamiltonian_cycle()
+
+            self.assertEqual(path is not None, has_hamiltonian(graph, False))
+            self.assertEqual(cycle is not None, has_hamiltonian(graph, True))
+            if path is not None:
+                self.assertEqual(sorted(path), sorted(graph))
+                self.assertTrue(all(graph.edge_weights(u, v) for u, v in zip(path, path[1:])))
+            if cycle is not None:
+                self.assertEqual(cycle[0], cycle[-1])
+                self.assertEqual(sorted(cycle[1:]), sorted(graph))
+                self.assertTrue(all(graph.edge_weights(u, v) for u, v in zip(cycle, cycle[1:])))
+
+    def test_known_graphs(self):
+        # The Petersen graph has a Hamiltonian path but no Hamiltonian cycle.
+        petersen = Graph('Petersen')
+        petersen.add_edges_from([(i, (i + 1) % 5, 1) for i in range(5)] + [(i, i + 5, 1) for i in range(5)] +
+                                [(5 + i, 5 + (i + 2) % 5, 1) for i in range(5)])
+        self.assertEqual(len(petersen.hamiltonian_path()), 10)
+        self.assertIsNone(petersen.hamiltonian_cycle())
+
+        star = Graph('Star')
+        star.add_edges_from(('hub', leaf, 1) for leaf in 'abc')
+        self.assertIsNone(star.hamiltonian_path())
+
+    def test_limits(self):
+        large = Graph('Large')
+        large.add_edges_from((i, (i + 1) % (tours.MAX_HAMILTONIAN_VERTICES + 1), 1)
+                             for i in range(tours.MAX_HAMILTONIAN_VERTICES + 1))
+        with self.assertRaises(Exception):
+            large.hamiltonian_path()
+
+        complete = Graph('Complete')
+        complete.add_edges_from((u, v, 1) for u in range(16) for v in range(u + 1, 16))
+        with self.assertRaises(Exception):
+            complete.hamiltonian_cycle(budget=0)
+        self.assertEqual(len(complete.hamiltonian_cycle()), 17)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+
+from src.main.graph import traversal
+from src.main.graph.graph_adjl import Graph
+
+
+def random_graph(seed):
+    rng = random.Random(seed)
+    graph = Graph(is_directed=rng.random() < 0.5)
+    graph.add_vertices_from(range(12))
+    graph.add_edges_from((rng.randrange(12), rng.randrange(12)) for _ in range(18))
+
+    return graph
+
+
+def recursive_dfs(graph, vertex, visited, pre, post):
+    visited.add(vertex)
+    pre.append(vertex)
+    for neighbor in graph.neighbors(vertex):
+        if neighbor not in visited:
+            recursive_dfs(graph, neighbor, visited, pre, post)
+    post.append(vertex)
+
+
+class TestBreadthFirst(unittest.TestCase):
+
+    def test_layers_are_distances(self):
+        for seed in range(30):
+            graph = random_graph(seed)
+            layers = list(traversal.bfs_layers(graph, 0))
+            self.assertEqual(layers[0], [0])
+            for depth, layer in enumerate(layers[1:], 1):
+                for v in layer:
+                    self.assertTrue(any(v in graph.neighbors(u) for u in layers[depth - 1]))
+                    self.assertFalse(any(v in earlier for earlier in layers[:depth]))
+            self.assertEqual(list(traversal.bfs_order(graph, 0)), [v for layer in layers for v in layer])
+
+    def test_tree(self):
+        for seed in range(30):
+            graph = random_graph(seed)
+            order = list(traversal.bfs_order(graph, 0))
+            parents = dict(traversal.bfs_tree(graph, 0))
+            self.assertEqual(list(parents), order)
+            self.assertIsNone(parents[0])
+            for v, parent in parents.items():
+                if parent is not None:
+                    self.assertIn(v, graph.neighbors(parent))
+                    self.assertLess(order.index(parent), order.index(v))
+
+
+class TestDepthFirst(unittest.TestCase):
+
+    def test_same_order_as_a_recursive_search(self):
+        for seed in range(30):
+            graph = random_graph(seed)
+            pre, post = list(), list()
+            recursive_dfs(graph, 0, set(), pre, post)
+            self.assertEqual(list(traversal.dfs_order(graph, 0)), pre)
+            self.assertEqual(list(traversal.dfs_postorder(graph, 0)), post)
+
+    def test_events_are_nested(self):
+        graph = random_graph(1)
+        open_vertices = list()
+        for event, vertex in traversal.dfs_events(graph, list(graph)):
+            if event == traversal.PRE:
+                open_vertices.append(vertex)
+            else:
+                self.assertEqual(open_vertices.pop(), vertex)
+        self.assertEqual(open_vertices, [])
+
+    def test_deep_graph(self):
+        graph = Graph()
+        graph.add_edges_from((i, i + 1) for i in range(50000))
+        self.assertEqual(sum(1 for _ in traversal.dfs_order(graph, 0)), 50001)
+        self.assertEqual(graph.r_dfs(0, 50000)[-1], 50000)
+
+
+class TestSources(unittest.TestCase):
+
+    def test_many_sources_and_shared_visited(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B'), ('C', 'D'), ('D', 'E')])
+        visited = {'D'}
+        self.assertEqual(list(traversal.bfs_order(graph, ['A', 'C', 'A'], visited)), ['A', 'C', 'B'])
+        self.assertEqual(visited, {'A', 'B', 'C', 'D'})
+
+    def test_unknown_source(self):
+        with self.assertRaises(Exception):
+            list(traversal.bfs_order(random_graph(0), 'Z'))
+
+    def test_graph_searches(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B'), ('A', 'C'), ('B', 'D')])
+        self.assertEqual(graph.i_bfs('A', 'D'), ['A', 'B', 'C', 'D'])
+        self.assertEqual(graph.r_bfs('A', 'D'), ['A', 'B', 'C', 'D'])
+        self.assertEqual(graph.i_dfs('A', 'D')[-1], 'D')
+        self.assertEqual(graph.r_dfs('A', 'C'), ['A', 'B', 'D', 'C'])
+
+
+if __name__ == '__main__':
+    unittest.main()